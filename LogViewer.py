@@ -11,15 +11,216 @@
 Log Viewer MVP - A configurable log parser and viewer
 """
 
+import bisect
+import bz2
+import codecs
+import contextlib
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import lzma
+import math
+import mmap
+import os
 import re
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Iterator, Iterable, Tuple, BinaryIO, Callable, Collection
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import sys
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it every entry takes the scalar parser
+    np = None
+
+
+# Bytes read from a log file per chunk when streaming entries
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Leading bytes of a file remembered in a checkpoint to recognise rewrites
+CHECKPOINT_HEAD_SIZE = 256
+
+# Files smaller than this are always parsed in-process
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# Upper bound on the byte range handed to one parse worker task
+PARALLEL_RANGE_SIZE = 32 * 1024 * 1024
+
+# Distinct values of a string category the parser shares between entries; a
+# category with more distinct values is parsed afresh for every entry
+FIELD_DICTIONARY_LIMIT = 1024
+
+# Distinct values a LogStore dictionary-encodes per column before it falls back
+# to reparsing that column from the raw text
+STORE_DICTIONARY_LIMIT = 4096
+
+# Layouts tried, in order, when inferring the format of a datetime field. A
+# fraction of a second and a zone ("Z", "UTC", "+02:00", "-0500") may follow any
+# of them; "epoch" is a number of seconds, milliseconds, microseconds or nanoseconds.
+TIMESTAMP_FORMATS = [
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y/%m/%d %H:%M:%S",
+    "%d/%b/%Y:%H:%M:%S", "%d/%m/%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%b %d %H:%M:%S",
+    "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d", "%Y/%m/%d", "epoch",
+]
+
+# Distinct whole-second prefixes (and dates) remembered per datetime field
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Out-of-order entries within this many lines of a file are put back in order when merging
+MERGE_REORDER_WINDOW = 1024
+
+# Entries merged and shown before the rest of a merged view has been parsed
+MERGE_FIRST_SCREEN = 1000
+
+# Read size used to stream the head of each file for the first screen
+MERGE_HEAD_CHUNK_SIZE = 64 * 1024
+
+# Single-line entries parsed per block when NumPy is available
+BLOCK_PARSE_ROWS = 4096
+
+# Entries per block of the trigram search index; a search checks every entry of the blocks it matches
+SEARCH_INDEX_BLOCK = 16
+
+# Rows per chunk of a RowBitmap are 2**BITMAP_CHUNK_BITS
+BITMAP_CHUNK_BITS = 16
+
+# Distinct values of a string category indexed with one bitmap each; categories
+# with more are filtered by testing every entry
+BITMAP_INDEX_MAX_VALUES = 255
+
+# Entries appended to a number index since it was sorted that queries scan
+# before they are merged into the sorted values, as a fraction of those values
+NUMBER_INDEX_TAIL_FRACTION = 16
+
+# Entries per block of a time index; a time range checks the entries of the
+# blocks at its two ends one by one
+TIME_INDEX_BLOCK = 1024
+
+# Entries read per page of an indexed file
+INDEX_PAGE_SIZE = 10000
+
+# Bytes read at a time when paging through an indexed file
+INDEX_CHUNK_SIZE = 64 * 1024
+
+# Decompressed bytes between the seek points kept for a gzip file
+GZIP_SEEK_SPAN = 4 * 1024 * 1024
+
+# Openers of compressed log files, by file suffix
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+# Names of rotated log segments: the live file's name with a rotation number
+# (app.log.1, app.1.log) or a date (app.log-20250808, app.2025-08-08.log) added.
+# A number or date before the extension only marks a segment if the live file
+# exists (see rotation_segment)
+ROTATION_PATTERN = re.compile(
+    r'(?P<stem>.+?)[.-](?:(?P<number>\d{1,3})|'
+    r'(?P<date>\d{4}-?\d{2}-?\d{2}(?:[_T.-]?\d{2}(?:[-:]?\d{2}){0,2})?))'
+    r'(?P<ext>\.[A-Za-z][^.]*)?')
+
+
+def is_log_file(file_name: str, log_filters: Iterable[str]) -> bool:
+    """Whether a file name has one of the LogFileFilters extensions
+    
+    Compressed files match by the name under their compression suffix, so
+    '.log' also matches app.log.gz.
+    """
+    name = file_name.lower()
+    names = [name]
+    for suffix in COMPRESSED_OPENERS:
+        if name.endswith(suffix):
+            names.append(name[:-len(suffix)])
+    names.append(os.path.basename(rotation_segment(name, live_files=())[0]))
+    return any(candidate.endswith(ext.lower()) for candidate in names for ext in log_filters)
+
+
+def _uncompressed_path(file_path: str) -> str:
+    """A file path without its compression suffix, if it has one"""
+    for suffix in COMPRESSED_OPENERS:
+        if file_path.lower().endswith(suffix):
+            return file_path[:-len(suffix)]
+    return file_path
+
+
+def rotation_segment(file_path: str, live_files: Optional[Collection[str]] = None) -> Tuple[str, Tuple]:
+    """Live file of a rotated log segment and the segment's place in its rotation set
+    
+    The live file is given without any compression suffix, so app.log.2.gz
+    belongs to app.log. A file that is not a rotated segment is its own live
+    file. Places sort oldest first: higher rotation numbers, then earlier
+    dates, then the live file itself.
+    
+    A number or date after the live file's extension (app.log.1) always
+    marks a segment. One before it (app.1.log), or in a name without an
+    extension, only does when the live file is among live_files, or exists
+    if live_files is None; otherwise node-1.log, python3.11.log or v1.2.log
+    would all be taken for segments.
+    """
+    directory, name = os.path.split(_uncompressed_path(file_path))
+    match = ROTATION_PATTERN.fullmatch(name)
+    if match is None:
+        return os.path.join(directory, name), (2,)
+    live = os.path.join(directory, match['stem'] + (match['ext'] or ''))
+    if match['ext'] is not None or not os.path.splitext(match['stem'])[1]:
+        if not (os.path.isfile(live) if live_files is None else live in live_files):
+            return os.path.join(directory, name), (2,)
+    if match['number'] is not None:
+        return live, (0, -int(match['number']))
+    return live, (1, re.sub(r'\D', '', match['date']))
+
+
+def group_rotation_sets(file_paths: Iterable[str]) -> List[List[str]]:
+    """Group files into rotation sets, each ordered oldest segment first
+    
+    Sets come in the order of their first file; a file without rotated
+    segments is a set of one. A live file counts as existing (see
+    rotation_segment) if it is among file_paths or on disk.
+    """
+    file_paths = list(file_paths)
+    given = {_uncompressed_path(path) for path in file_paths}
+    groups: Dict[str, List[Tuple[Tuple, str]]] = {}
+    for path in file_paths:
+        live, place = rotation_segment(path, live_files=given)
+        if place == (2,):
+            live, place = rotation_segment(path)
+        groups.setdefault(live, []).append((place, path))
+    return [[path for _, path in sorted(group)] for group in groups.values()]
+
+
+def rotation_set(file_path: str) -> List[str]:
+    """The rotation set of a file found next to it, oldest segment first"""
+    directory = os.path.dirname(file_path)
+    live = rotation_segment(file_path)[0]
+    try:
+        names = os.listdir(directory or '.')
+    except OSError:
+        return [file_path]
+    paths = [path for path in (os.path.join(directory, name) for name in names)
+             if rotation_segment(path)[0] == live and os.path.isfile(path)]
+    return group_rotation_sets(paths)[0] if paths else [file_path]
+
+
+def user_cache_dir(*parts: str) -> str:
+    """LogViewer's directory in the user's cache location, or a subdirectory of it
+    
+    That is %LOCALAPPDATA%\\LogViewer on Windows and $XDG_CACHE_HOME/LogViewer
+    (~/.cache/LogViewer) elsewhere.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'LogViewer', *parts)
+
 
 class FieldType(Enum):
     """Supported field types for log categories"""
@@ -28,6 +229,10 @@ class FieldType(Enum):
     NUMBER = "number"
 
 
+# FieldType by configured type name
+_FIELD_TYPES = {field_type.value: field_type for field_type in FieldType}
+
+
 @dataclass
 class LogCategory:
     """Represents a log category from configuration"""
@@ -35,12 +240,15 @@ class LogCategory:
     type: str
     order: int
     description: str = ""
+    format: str = ""  # strptime layout of a datetime field, inferred when empty
     ColourType: str = ""
     Colouring: str = "Text"  # "Text" or "Background"
     ColourMap: Dict[str, str] = field(default_factory=dict)
     
     def get_field_type(self) -> FieldType:
-        return FieldType(self.type)
+        """The field type; unknown types such as the old 'structured_string' parse as strings"""
+        field_type = _FIELD_TYPES.get(self.type)
+        return FieldType.STRING if field_type is None else field_type
     
     def has_color_config(self) -> bool:
         """Check if this category has color configuration"""
@@ -121,6 +329,40 @@ class LogCategory:
         return False
 
 
+def _shared_value_modified(*args, **kwargs):
+    raise TypeError("Field values are shared between log entries and cannot be modified; "
+                    "modify a copy() instead")
+
+
+class FrozenDict(dict):
+    """A dict field value that cannot be modified, as it is shared between log entries"""
+    
+    __setitem__ = __delitem__ = __ior__ = _shared_value_modified
+    clear = pop = popitem = setdefault = update = _shared_value_modified
+    
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """A list field value that cannot be modified, as it is shared between log entries"""
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _shared_value_modified
+    append = extend = insert = pop = remove = clear = sort = reverse = _shared_value_modified
+    
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """A parsed field value, with its dicts and lists made FrozenDict and FrozenList"""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
+
 @dataclass
 class LogEntry:
     """Represents a parsed log entry"""
@@ -129,11 +371,16 @@ class LogEntry:
     fields: Dict[str, Any] = field(default_factory=dict)
     is_multiline: bool = False
     source_file: Optional[str] = None  # Track source file for merged logs
+    epochs: Dict[str, int] = field(default_factory=dict)  # Datetime fields as epoch microseconds
     
     def get_field(self, name: str) -> Any:
         """Get field value by name"""
         return self.fields.get(name)
     
+    def get_epoch(self, name: str) -> Optional[int]:
+        """Get a datetime field as epoch microseconds, None if it was not recognised"""
+        return self.epochs.get(name)
+    
     def __str__(self):
         """String representation for display"""
         parts = []
@@ -146,6 +393,324 @@ class LogEntry:
         return " | ".join(parts)
 
 
+# Marker for a field or epoch that has not been parsed yet
+_UNPARSED = object()
+
+
+class LazyFields(Mapping):
+    """Field values of a log entry, each parsed from the raw text on first access
+    
+    Only the end of each category in the raw text is kept up front; a value
+    is parsed, and cached, the first time it is read. Iterating or comparing
+    parses every field. Values can be set but not removed.
+    """
+    __slots__ = ('_parser', '_text', '_ends', '_values')
+    
+    def __init__(self, parser: 'LogParser', text: str, ends: Tuple[int, ...]):
+        self._parser = parser
+        self._text = text
+        self._ends = ends  # Cumulative category lengths, separators excluded
+        self._values: Dict[str, Any] = {}
+    
+    def __getitem__(self, name: str) -> Any:
+        value = self._values.get(name, _UNPARSED)
+        if value is _UNPARSED:
+            position = self._parser.category_positions.get(name)
+            if position is None or position[0] >= len(self._ends):
+                raise KeyError(name)
+            index, category = position
+            value = self._values[name] = self._parser._field_value(self.part(index), category)
+        return value
+    
+    def __setitem__(self, name: str, value: Any):
+        self._values[name] = value
+    
+    def __contains__(self, name: object) -> bool:
+        if name in self._values:
+            return True
+        position = self._parser.category_positions.get(name)
+        return position is not None and position[0] < len(self._ends)
+    
+    def __iter__(self) -> Iterator[str]:
+        categories = self._parser.config.categories
+        for category in categories[:len(self._ends)]:
+            yield category.name
+        for name in self._values:
+            if name not in self._parser.category_positions:
+                yield name
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+    
+    def part(self, index: int) -> str:
+        """Stripped text of the category at index"""
+        separator_length = self._parser.separator_length
+        start = self._ends[index - 1] + index * separator_length if index else 0
+        return self._text[start:self._ends[index] + index * separator_length].strip()
+
+
+class LazyEpochs(Mapping):
+    """Epochs of the datetime fields of a LazyFields entry, parsed on first access"""
+    __slots__ = ('_parser', '_fields', '_epochs')
+    
+    def __init__(self, parser: 'LogParser', fields: LazyFields):
+        self._parser = parser
+        self._fields = fields
+        self._epochs: Dict[str, Optional[int]] = {}
+    
+    def __getitem__(self, name: str) -> int:
+        epoch = self._epochs.get(name, _UNPARSED)
+        if epoch is _UNPARSED:
+            timestamp_parser = self._parser.timestamp_parsers.get(name)
+            epoch = timestamp_parser.parse(self._fields.get(name)) if timestamp_parser else None
+            self._epochs[name] = epoch
+        if epoch is None:
+            raise KeyError(name)
+        return epoch
+    
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self._parser.timestamp_parsers if name in self)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass
+class FileCheckpoint:
+    """Position reached in a log file by the last parse, for incremental reads"""
+    offset: int = 0              # Bytes fully consumed (end of the last complete entry)
+    inode: int = 0
+    size: int = 0                # File size seen by the last read
+    partial: bytes = b''         # Trailing bytes after offset that did not complete an entry
+    partial_entries: int = 0     # Entries returned from the partial bytes
+    next_number: int = 1         # Line/entry number of the next complete entry
+    head: bytes = b''            # Leading bytes of the file, to detect rewrites
+    delimited: Optional[bool] = None  # Whether entries were found via start/end delimiters
+    stored_size: int = 0         # Size on disk of a compressed file; the other offsets are decompressed
+
+
+@dataclass
+class FileUpdate:
+    """Entries read from a log file since its last checkpoint"""
+    file_path: str
+    entries: List[LogEntry]
+    checkpoint: FileCheckpoint
+    reload: bool = False     # File was truncated, rotated or rewritten and parsed from the start
+    retracted: int = 0       # Trailing entries of the previous read replaced by these entries
+
+
+class GzipReader(io.BufferedIOBase):
+    """Seekable reader of a gzip file that starts decompressing at seek points
+    
+    A seek point pairs a decompressed offset with the compressed offset to
+    resume from. Points at the start of a gzip member only need the offsets
+    and are saved in a LogIndex; the others hold a copy of the decompressor,
+    which cannot be saved, and last as long as the points list. Reading past
+    the last point adds a point at each member start and every
+    GZIP_SEEK_SPAN decompressed bytes, so later seeks decompress at most
+    that much before reaching their offset. tee, if given, is called with
+    the decompressed offset and bytes of each block decompressed.
+    """
+    
+    def __init__(self, file_path: str, points: Optional[List[Tuple[int, int, Any]]] = None,
+                 tee: Optional[Callable[[int, bytes], None]] = None):
+        self._file = open(file_path, 'rb')
+        self.points = [] if points is None else points
+        if not self.points:
+            self.points.append((0, 0, None))
+        self._point_offsets = []      # Decompressed offsets of the points, for bisection
+        self._tee = tee
+        self._start(self.points[0])
+    
+    def _start(self, point: Tuple[int, int, Any]):
+        """Resume decompressing at a seek point"""
+        out_offset, in_offset, decompressor = point
+        self._file.seek(in_offset)
+        self._in = in_offset          # Compressed bytes fed to the decompressor
+        self._out = out_offset        # Decompressed offset of the start of the buffer
+        self._buffer = b''
+        self._pos = 0
+        self._eof = False
+        self._decompressor = decompressor.copy() if decompressor else zlib.decompressobj(31)
+        self._in_member = decompressor is not None
+    
+    def _add_point(self, out_offset: int, in_offset: int, decompressor: Any):
+        if out_offset > self.points[-1][0]:
+            self.points.append((out_offset, in_offset, decompressor))
+    
+    def _fill(self):
+        """Decompress the next block of the file onto the buffer"""
+        data = self._file.read(INDEX_CHUNK_SIZE)
+        if not data:
+            if self._in_member:
+                raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+            self._eof = True
+            return
+        
+        out_end = self._out + len(self._buffer)
+        produced = []
+        while data:
+            if not self._in_member and not data.strip(b'\0'):
+                self._in += len(data)  # Padding after the last member
+                break
+            self._in_member = True
+            output = self._decompressor.decompress(data)
+            produced.append(output)
+            out_end += len(output)
+            if not self._decompressor.eof:
+                self._in += len(data)
+                break
+            
+            # The rest of the block belongs to the next member
+            data = self._decompressor.unused_data
+            self._in = self._file.tell() - len(data)
+            self._decompressor = zlib.decompressobj(31)
+            self._in_member = False
+            self._add_point(out_end, self._in, None)
+        
+        if self._in_member and out_end >= self.points[-1][0] + GZIP_SEEK_SPAN:
+            self._add_point(out_end, self._in, self._decompressor.copy())
+        output = b''.join(produced)
+        if self._tee is not None:
+            self._tee(self._out + len(self._buffer), output)
+        self._buffer = self._buffer[self._pos:] + output
+        self._out += self._pos
+        self._pos = 0
+    
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            while not self._eof:
+                self._fill()
+            size = len(self._buffer) - self._pos
+        else:
+            while len(self._buffer) - self._pos < size and not self._eof:
+                self._fill()
+        data = self._buffer[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("can only seek from the start or current position")
+        
+        if not self._out <= offset <= self._out + len(self._buffer):
+            if len(self._point_offsets) != len(self.points):
+                # Points are only ever appended, by this or another reader sharing the list
+                self._point_offsets = [point[0] for point in self.points]
+            point = self.points[bisect.bisect_right(self._point_offsets, offset) - 1]
+            if offset < self._out or point[0] > self._out + len(self._buffer):
+                self._start(point)
+            while self._out + len(self._buffer) < offset and not self._eof:
+                # Skip over data before the offset without keeping it
+                self._out += len(self._buffer)
+                self._buffer = b''
+                self._pos = 0
+                self._fill()
+        self._pos = min(offset - self._out, len(self._buffer))
+        return self.tell()
+    
+    def tell(self) -> int:
+        return self._out + self._pos
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def fileno(self) -> int:
+        return self._file.fileno()
+    
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class GzipBlockWriter:
+    """Writes decompressed data to a gzip file of members of about GZIP_SEEK_SPAN bytes
+    
+    Every member starts a seek point that needs no decompressor, so unlike
+    most points of a file written as one member, all of them can be saved.
+    Data is written with its decompressed offset: data written before is
+    skipped, and data after a gap abandons the file, as does a write error.
+    Given the points of a file it wrote before, the file is extended.
+    """
+    
+    def __init__(self, path: str, points: Optional[List[Tuple[int, int, Any]]] = None):
+        self.path = path
+        self.points = [point for point in points or () if point[2] is None] or [(0, 0, None)]
+        self._written, end = self.points[-1][:2]
+        self._file = open(path, 'r+b' if end else 'wb')
+        self._file.truncate(end)
+        self._file.seek(end)
+        self._pending = []
+        self._pending_size = 0
+    
+    def write(self, out_offset: int, data: bytes):
+        end = self._written + self._pending_size
+        if self._file is None or out_offset + len(data) <= end:
+            return
+        if out_offset > end:
+            self.abandon()
+            return
+        self._pending.append(data[end - out_offset:])
+        self._pending_size += out_offset + len(data) - end
+        if self._pending_size >= GZIP_SEEK_SPAN:
+            self._flush(final=False)
+    
+    def _flush(self, final: bool = True):
+        """Write the pending data as gzip members of GZIP_SEEK_SPAN bytes, and the
+        rest as a shorter member if final, else keep it pending"""
+        data = b''.join(self._pending)
+        keep = 0 if final else len(data) % GZIP_SEEK_SPAN
+        self._pending = [data[len(data) - keep:]] if keep else []
+        self._pending_size = keep
+        for start in range(0, len(data) - keep, GZIP_SEEK_SPAN):
+            block = data[start:min(start + GZIP_SEEK_SPAN, len(data) - keep)]
+            compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+            try:
+                self._file.write(compressor.compress(block) + compressor.flush())
+            except OSError:
+                self.abandon()
+                return
+            self._written += len(block)
+            self.points.append((self._written, self._file.tell(), None))
+    
+    def close(self) -> List[Tuple[int, int, Any]]:
+        """Finish the file; returns its seek points, ending with its end, or [] if it was abandoned"""
+        if self._file is None:
+            return []
+        self._flush()
+        if self._file is None:
+            return []
+        try:
+            self._file.close()
+        except OSError:
+            self.abandon()
+            return []
+        self._file = None
+        return self.points
+    
+    def abandon(self):
+        """Stop writing and remove the file"""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 class ConfigManager:
     """Manages log viewer configuration"""
     
@@ -176,6 +741,10 @@ class ConfigManager:
             raise ValueError("Missing 'delimiters' in configuration")
         if 'categories' not in lvc:
             raise ValueError("Missing 'categories' in configuration")
+        try:
+            codecs.lookup_error(lvc.get('DecodeErrors', 'replace'))
+        except LookupError:
+            raise ValueError(f"Unknown 'DecodeErrors' handler: {lvc['DecodeErrors']}")
     
     def _parse_categories(self):
         """Parse and sort categories by order"""
@@ -192,6 +761,57 @@ class ConfigManager:
         """Get delimiter configuration"""
         return self.config['logViewerConfig']['delimiters']
     
+    @property
+    def decode_errors(self) -> str:
+        """Error handler for bytes that are not valid UTF-8 (see codecs), 'replace' by default"""
+        return self.config['logViewerConfig'].get('DecodeErrors', 'replace')
+    
+    @property
+    def parse_cache_dir(self) -> str:
+        """Directory of the on-disk parse cache, empty when caching is off; it must
+        only be writable by the user (see ParseCache)"""
+        return self.config['logViewerConfig'].get('ParseCacheDir', '')
+    
+    @property
+    def parse_cache_max_bytes(self) -> int:
+        """Size cap of the on-disk parse cache"""
+        return int(self.config['logViewerConfig'].get('ParseCacheMaxMB', 1024)) * 1024 * 1024
+    
+    @property
+    def lazy_fields(self) -> bool:
+        """Whether field values are parsed only when they are first read"""
+        return bool(self.config['logViewerConfig'].get('LazyFields', False))
+    
+    @property
+    def columnar_store(self) -> bool:
+        """Whether loaded logs are kept in a LogStore instead of a list"""
+        return bool(self.config['logViewerConfig'].get('ColumnarStore', False))
+    
+    @property
+    def block_parser(self) -> bool:
+        """Whether single-line logs are parsed in NumPy blocks when NumPy is installed"""
+        return bool(self.config['logViewerConfig'].get('BlockParser', True))
+    
+    @property
+    def search_index(self) -> bool:
+        """Whether a trigram index of the raw text is built to speed up the search box"""
+        return bool(self.config['logViewerConfig'].get('SearchIndex', False))
+    
+    @property
+    def index_stride(self) -> int:
+        """Entries between checkpoints of a sidecar index (1 = every entry)"""
+        return max(1, int(self.config['logViewerConfig'].get('IndexStride', 1)))
+    
+    @property
+    def index_dir(self) -> str:
+        """Directory sidecar indexes are saved in, a per-user cache directory by default"""
+        return self.config['logViewerConfig'].get('IndexDir') or user_cache_dir('index')
+
+    @property
+    def parse_workers(self) -> int:
+        """Processes used to parse large or merged files (1 = no worker processes, the default; 0 = one per CPU)"""
+        return int(self.config['logViewerConfig'].get('ParseWorkers', 1))
+    
     def get_category_by_name(self, name: str) -> Optional[LogCategory]:
         """Get category by name"""
         for cat in self.categories:
@@ -200,216 +820,3020 @@ class ConfigManager:
         return None
 
 
+class TimestampParser:
+    """Converts timestamp strings to integer epoch microseconds
+    
+    The layout is inferred from the first value and reused for the ones that
+    follow, and inferred again when a value stops matching it. Layouts of
+    the form YYYY-MM-DD HH:MM:SS are sliced at fixed offsets rather than
+    going through strptime, and the epoch of each whole-second prefix is
+    cached. Timestamps without a zone are taken as UTC.
+    
+    Layouts without a year (e.g. syslog's "Aug 08 10:00:00") take the year
+    of the reference time, the file's modification time when set by reset
+    and the current time otherwise, or the year before when that would put
+    the timestamp more than a day after the reference.
+    """
+    
+    # Fixed-offset layouts: separators at positions 4, 7, 10, 13 and 16
+    _FIXED_LAYOUTS = {
+        "%Y-%m-%d %H:%M:%S": "-- ::",
+        "%Y-%m-%dT%H:%M:%S": "--T::",
+        "%Y/%m/%d %H:%M:%S": "// ::",
+    }
+    
+    # Fraction of a second and zone after the whole-second part
+    _SUFFIX = re.compile(r'(?:[.,](\d+))?\s*(Z|UTC|[+-]\d{2}:?\d{2})?$')
+    
+    # Digits in epoch seconds, milliseconds, microseconds and nanoseconds
+    _EPOCH_SCALES = {10: 1_000_000, 13: 1000, 16: 1}
+    
+    def __init__(self, format: str = ""):
+        self.configured_format = format or None
+        self.format = self.configured_format
+        self.reference: Optional[float] = None
+        self._seconds: Dict[str, int] = {}
+        self._days: Dict[str, int] = {}
+    
+    def reset(self, reference: Optional[float] = None):
+        """Forget the inferred layout, e.g. before parsing another file
+        
+        reference is the epoch seconds that years are filled in from, e.g. the
+        modification time of the file; None means the current time.
+        """
+        self.format = self.configured_format
+        self.reference = reference
+        self._seconds.clear()
+        self._days.clear()
+    
+    def parse(self, value: Any) -> Optional[int]:
+        """Epoch microseconds of a timestamp, or None if it is not recognised"""
+        if not isinstance(value, str) or not value:
+            return None
+        
+        if self.format:
+            epoch = self._parse_as(value, self.format)
+            if epoch is not None:
+                return epoch
+        
+        for fmt in TIMESTAMP_FORMATS:
+            if fmt != self.format:
+                epoch = self._parse_as(value, fmt)
+                if epoch is not None:
+                    self.format = fmt
+                    self._seconds.clear()
+                    return epoch
+        return None
+    
+    def _parse_as(self, value: str, fmt: str) -> Optional[int]:
+        """Epoch microseconds of value in one layout, or None if it does not match"""
+        if fmt == "epoch":
+            return self._parse_epoch(value)
+        
+        separators = self._FIXED_LAYOUTS.get(fmt)
+        if separators is not None:
+            base, rest = value[:19], value[19:]
+        else:
+            match = self._SUFFIX.search(value)
+            base, rest = value[:match.start()].rstrip(), value[match.start():]
+        
+        seconds = self._seconds.get(base)
+        if seconds is None:
+            try:
+                if separators is not None:
+                    seconds = self._slice_seconds(base, separators)
+                    if seconds is None:
+                        return None
+                elif '%Y' in fmt or '%y' in fmt:
+                    moment = datetime.strptime(base, fmt)
+                    seconds = int(moment.replace(tzinfo=timezone.utc).timestamp())
+                else:
+                    seconds = self._yearless_seconds(base, fmt)
+            except ValueError:
+                return None
+            if len(self._seconds) >= TIMESTAMP_CACHE_SIZE:
+                self._seconds.clear()
+            self._seconds[base] = seconds
+        
+        if not rest:
+            return seconds * 1_000_000
+        
+        match = self._SUFFIX.fullmatch(rest)
+        if match is None:
+            return None
+        fraction, zone = match.groups()
+        micros = int((fraction + '000000')[:6]) if fraction else 0
+        if zone and zone not in ('Z', 'UTC'):
+            offset = int(zone[1:3]) * 3600 + int(zone[-2:]) * 60
+            seconds -= offset if zone[0] == '+' else -offset
+        return seconds * 1_000_000 + micros
+    
+    def _yearless_seconds(self, base: str, fmt: str) -> int:
+        """Epoch seconds of a timestamp without a year, in the year of the reference time
+        
+        Raises ValueError if it does not match fmt.
+        """
+        reference = time.time() if self.reference is None else self.reference
+        year = datetime.fromtimestamp(reference, timezone.utc).year
+        moment = datetime.strptime(f"{year} {base}", "%Y " + fmt).replace(tzinfo=timezone.utc)
+        if moment.timestamp() > reference + 86400:
+            # Written late last year, e.g. December entries in a file modified in January
+            moment = datetime.strptime(f"{year - 1} {base}", "%Y " + fmt).replace(tzinfo=timezone.utc)
+        return int(moment.timestamp())
+    
+    def _slice_seconds(self, base: str, separators: str) -> Optional[int]:
+        """Epoch seconds of a YYYY-MM-DD HH:MM:SS string, read at fixed offsets"""
+        if len(base) != 19 or base[4] + base[7] + base[10] + base[13] + base[16] != separators:
+            return None
+        day = self._days.get(base[:10])
+        if day is None:
+            day = int(datetime(int(base[0:4]), int(base[5:7]), int(base[8:10]), tzinfo=timezone.utc).timestamp())
+            if len(self._days) >= TIMESTAMP_CACHE_SIZE:
+                self._days.clear()
+            self._days[base[:10]] = day
+        hour, minute, second = int(base[11:13]), int(base[14:16]), int(base[17:19])
+        if hour > 23 or minute > 59 or second > 59:
+            return None
+        return day + hour * 3600 + minute * 60 + second
+    
+    def _parse_epoch(self, value: str) -> Optional[int]:
+        """Epoch microseconds of a numeric timestamp"""
+        digits = value.strip()
+        if not digits.isdigit():
+            return None
+        if len(digits) == 19:
+            return int(digits) // 1000
+        scale = self._EPOCH_SCALES.get(len(digits))
+        return int(digits) * scale if scale else None
+
+
+class DelimiterAlternatives:
+    """One configured delimiter and its alternatives, compiled for one-pass use
+    
+    A single alternative uses the str methods; several are matched with one
+    alternation regex, longest first so that a delimiter containing another
+    wins.
+    """
+    
+    __slots__ = ('first', 'pattern')
+    
+    def __init__(self, alternatives: Any):
+        if not isinstance(alternatives, list):
+            alternatives = [alternatives] if alternatives else []
+        alternatives = [alternative for alternative in alternatives if alternative]
+        self.first = alternatives[0] if alternatives else None
+        self.pattern = None
+        if len(alternatives) != 1:
+            # No alternatives compiles to a pattern that never matches
+            ordered = sorted(set(alternatives), key=len, reverse=True)
+            self.pattern = re.compile('|'.join(map(re.escape, ordered)) or '(?!)')
+    
+    def split(self, text: str, maxsplit: int = -1) -> List[str]:
+        """Split text on every alternative"""
+        if self.pattern is None:
+            return text.split(self.first, maxsplit)
+        return self.pattern.split(text, max(maxsplit, 0))
+    
+    def found_in(self, text: str) -> bool:
+        """Whether any alternative occurs in text"""
+        if self.pattern is None:
+            return self.first in text
+        return self.pattern.search(text) is not None
+    
+    def normalise(self, text: str) -> str:
+        """Text with every alternative replaced by the first one (text itself if unchanged)"""
+        if self.pattern is None or self.first is None:
+            return text
+        return self.pattern.sub(self.first.replace('\\', '\\\\'), text)
+
+
+def _bulk_integers(buffer: 'np.ndarray', starts: 'np.ndarray', ends: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """Values of fields holding plain integers, with a mask of the fields that do
+    
+    A field is an optional '-' followed by 1 to 18 digits, so every value
+    fits in an int64; anything else is left to the scalar conversion.
+    """
+    last = len(buffer) - 1
+    negative = (ends - starts > 1) & (buffer[np.clip(starts, 0, last)] == ord('-'))
+    starts = starts + negative
+    widths = ends - starts
+    valid = (widths >= 1) & (widths <= 18)
+    if not valid.any():
+        return np.zeros(len(starts), dtype=np.int64), valid
+    
+    positions = np.arange(int(widths[valid].max()))
+    inside = positions < widths[:, None]
+    digits = buffer[np.clip(starts[:, None] + positions, 0, last)].astype(np.int64) - ord('0')
+    valid &= (((digits >= 0) & (digits <= 9)) | ~inside).all(axis=1)
+    scales = 10 ** np.maximum(widths[:, None] - 1 - positions, 0)
+    values = np.where(inside, digits * scales, 0).sum(axis=1)
+    return np.where(negative, -values, values), valid
+
+
+def _bulk_timestamps(buffer: 'np.ndarray', starts: 'np.ndarray', ends: 'np.ndarray',
+                     layout: str) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Epoch microseconds of YYYY-MM-DD HH:MM:SS fields, with a mask of the fields that are
+    
+    layout gives the separators at offsets 4, 7, 10, 13 and 16 (see
+    TimestampParser._FIXED_LAYOUTS). Only whole-second values without a
+    zone, which are taken as UTC, are converted.
+    """
+    last = len(buffer) - 1
+    chars = buffer[np.clip(starts[:, None] + np.arange(19), 0, last)].astype(np.int64)
+    valid = ends - starts == 19
+    for position, separator in zip((4, 7, 10, 13, 16), layout):
+        valid &= chars[:, position] == ord(separator)
+    digits = chars[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]] - ord('0')
+    valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+    
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month, day, hour, minute, second = (digits[:, i] * 10 + digits[:, i + 1] for i in range(4, 14, 2))
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(month, 1, 12) - 1]
+    month_days += (month == 2) & leap
+    valid &= ((year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= month_days)
+              & (hour <= 23) & (minute <= 59) & (second <= 59))
+    
+    # Days since 1970-01-01 of a proleptic Gregorian date, counted from March
+    shifted = year - (month <= 2)
+    era = shifted // 400
+    year_of_era = shifted - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+    return (days * 86400 + hour * 3600 + minute * 60 + second) * 1_000_000, valid
+
+
 class LogParser:
     """Parses log entries based on configuration"""
     
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager
         self.delimiters = config_manager.delimiters
+        self.timestamp_parsers = {
+            category.name: TimestampParser(category.format)
+            for category in config_manager.categories
+            if category.get_field_type() == FieldType.DATETIME
+        }
+        self.lazy_fields = config_manager.lazy_fields
+        self.decode_errors = config_manager.decode_errors
+        # Parsed values of string categories by field text (see _field_value); the
+        # dictionaries are cleared rather than replaced, as the entry parser holds them
+        self.value_dictionaries: Dict[str, Dict[str, Any]] = {
+            category.name: {} for category in config_manager.categories
+            if category.get_field_type() == FieldType.STRING
+        }
+        self.unshared_categories = set()  # Categories past FIELD_DICTIONARY_LIMIT
+        self.category_positions = {category.name: (i, category) for i, category in enumerate(config_manager.categories)}
+        # Delimiters are compiled once, honouring every configured alternative
+        self.category_separators = DelimiterAlternatives(self.delimiters['categorySeparator'])
+        self.separator = self.category_separators.first
+        self.separator_length = len(self.separator)
+        self.pair_separators = DelimiterAlternatives(self.delimiters.get('keyValuePairsSeparator'))
+        self.key_value_separators = DelimiterAlternatives(self.delimiters.get('keyValueSeparator'))
+        self.element_separators = DelimiterAlternatives(self.delimiters.get('arrayElementSeparator'))
+        container_starts = self.delimiters.get('ContainerStartDelimiter', ['('])
+        container_ends = self.delimiters.get('ContainerEndDelimiter', [')'])
+        self.containers = list(zip(
+            container_starts if isinstance(container_starts, list) else [container_starts],
+            container_ends if isinstance(container_ends, list) else [container_ends]))
+        self.block_columns = self._plan_block_columns()
+        self._parse_entry = self._compile_entry_parser()
+    
+    def __getstate__(self) -> Dict:
+        state = dict(vars(self))
+        del state['_parse_entry']  # Generated code is rebuilt on unpickling
+        return state
     
-    def parse_file(self, file_path: str) -> List[LogEntry]:
-        """Parse entire log file without locking it"""
-        # Open file with share mode to allow other processes to read/write
-        # Using 'r' mode with buffering=1 for line buffering
-        import io
+    def __setstate__(self, state: Dict):
+        vars(self).update(state)
+        self._parse_entry = self._compile_entry_parser()
+    
+    def parse_file(self, file_path: str, checkpoint: Optional['FileCheckpoint'] = None,
+                   into: Optional[List[LogEntry]] = None) -> List[LogEntry]:
+        """Parse entire log file without locking it
         
-        # Read file without exclusive lock - allows other processes to access it
+        Entries are added to into (e.g. a LogStore) when given, else to a new list.
+        A file that still cannot be read after one retry raises OSError.
+        """
+        logs = [] if into is None else into
+        initial = replace(checkpoint) if checkpoint else None
         try:
-            # Try Windows-specific approach first for better compatibility
-            import os
-            if os.name == 'nt':  # Windows
-                # Open with FILE_SHARE_READ | FILE_SHARE_WRITE flags
-                import msvcrt
-                with open(file_path, 'r', encoding='utf-8', buffering=1) as f:
-                    # Ensure file is not locked
-                    try:
-                        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
-                        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
-                    except:
-                        pass  # File might be in use, but we can still try to read
-                    content = f.read()
-            else:
-                # Unix/Linux - files are not locked by default
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-        except IOError as e:
+            logs.extend(self.iter_entries(file_path, checkpoint=checkpoint))
+            return logs
+        except IOError:
             # If file is locked or being written to, try again with a small delay
-            import time
             time.sleep(0.1)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except:
-                # Return empty list if file cannot be read
-                return []
+            del logs[:]
+            if checkpoint:
+                vars(checkpoint).update(vars(initial))
+            # A second failure is raised for the caller to report, rather than shown as an empty log
+            logs.extend(self.iter_entries(file_path, checkpoint=checkpoint))
+            return logs
+    
+    def _reset_timestamps(self, file_path: str):
+        """Forget the inferred timestamp layouts, filling in years from the file's modification time"""
+        try:
+            reference = os.path.getmtime(file_path)
+        except OSError:
+            reference = None
+        for timestamp_parser in self.timestamp_parsers.values():
+            timestamp_parser.reset(reference)
+    
+    def iter_entries(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     checkpoint: Optional['FileCheckpoint'] = None) -> Iterator[LogEntry]:
+        """Yield log entries as they are parsed, reading the file in fixed-size chunks
         
-        # Check if logs use start/end delimiters for multi-line
-        if self.delimiters.get('logStartDelimiter') and self.delimiters.get('logEndDelimiter'):
-            logs = self._parse_multiline_logs(content)
-        else:
-            logs = self._parse_single_line_logs(content)
+        Only the current chunk and any entry that crosses its boundary are held
+        in memory, so peak memory does not depend on the size of the file.
         
-        # Set source file for all entries
-        for log in logs:
-            log.source_file = file_path
+        When a checkpoint is given, parsing resumes from its offset and the
+        checkpoint is advanced as the file is read; it describes the file once
+        the iterator has been exhausted.
+        """
+        if checkpoint is None:
+            checkpoint = FileCheckpoint()
         
-        return logs
+        # Timestamp layouts are inferred per file
+        self._reset_timestamps(file_path)
+        
+        with self._open_log_file(file_path) as f:
+            stat = os.fstat(f.fileno())
+            checkpoint.inode = stat.st_ino
+            if self.is_compressed(file_path):
+                checkpoint.stored_size = stat.st_size
+            if checkpoint.offset == 0:
+                checkpoint.head = f.read(CHECKPOINT_HEAD_SIZE)
+            checkpoint.partial_entries = 0
+            
+            # Check if logs use start/end delimiters for multi-line
+            if self._uses_entry_delimiters() and checkpoint.delimited is not False:
+                initial = replace(checkpoint)
+                mapped = self._map_file(f)
+                if mapped is not None:
+                    with mapped:
+                        found = yield from self._entries_from_records(
+                            self._iter_mapped_records(mapped, checkpoint), file_path, delimited=True)
+                else:
+                    found = yield from self._entries_from_records(
+                        self._iter_delimited_records(f, chunk_size, checkpoint), file_path, delimited=True)
+                
+                if found or checkpoint.delimited:
+                    checkpoint.delimited = True
+                    return
+                
+                # If no delimiters found, try line-by-line parsing
+                vars(checkpoint).update(vars(initial))
+            
+            found = yield from self._entries_from_records(
+                self._iter_line_records(f, chunk_size, checkpoint), file_path)
+            if found:
+                checkpoint.delimited = False
     
-    def _parse_multiline_logs(self, content: str) -> List[LogEntry]:
-        """Parse logs that may span multiple lines using delimiters"""
-        logs = []
-        start_delim_list = self.delimiters['logStartDelimiter']
-        end_delim_list = self.delimiters['logEndDelimiter']
+    def _entries_from_records(self, records: Iterable[Tuple[int, str]], file_path: str,
+                              delimited: bool = False) -> Iterator[LogEntry]:
+        """Parse (number, text) records into entries; returns whether any were produced"""
+        if self.block_columns and not delimited:
+            return (yield from self._entries_from_line_blocks(records, file_path))
         
-        # Handle delimiters as arrays - use first delimiter if it's an array
-        start_delim = start_delim_list[0] if isinstance(start_delim_list, list) and start_delim_list else start_delim_list
-        end_delim = end_delim_list[0] if isinstance(end_delim_list, list) and end_delim_list else end_delim_list
+        found = False
+        for number, text in records:
+            entry = self._parse_log_entry(text, number, is_multiline=delimited and '\n' in text)
+            if entry:
+                found = True
+                entry.source_file = file_path
+                yield entry
+        return found
+    
+    def _entries_from_line_blocks(self, records: Iterable[Tuple[int, str]], file_path: str) -> Iterator[LogEntry]:
+        """Parse single-line records BLOCK_PARSE_ROWS at a time with the NumPy block parser"""
+        found = False
+        records = iter(records)
+        while True:
+            block = list(itertools.islice(records, BLOCK_PARSE_ROWS))
+            if not block:
+                return found
+            columns = self._convert_block([text for _, text in block])
+            for (number, text), bulk in zip(block, zip(*columns)):
+                entry = self._parse_entry(text, number, False, bulk)
+                found = True
+                entry.source_file = file_path
+                yield entry
+    
+    def _plan_block_columns(self) -> Optional[List[Tuple[int, str]]]:
+        """Categories the block parser converts in bulk, as (position, 'number' or 'timestamp')
         
-        # Find all log entries between delimiters
-        pattern = re.escape(start_delim) + r'(.*?)' + re.escape(end_delim)
-        matches = re.finditer(pattern, content, re.DOTALL)
+        None when the block parser is not used: without NumPy, with lazy
+        fields, or when the category separator is not one single-byte
+        delimiter that can be searched for in the encoded block.
+        """
+        if np is None or self.lazy_fields or not self.config.block_parser:
+            return None
+        if self.category_separators.pattern is not None or len(self.separator.encode('utf-8')) != 1:
+            return None
+        columns = []
+        for i, category in enumerate(self.config.categories):
+            if category.get_field_type() == FieldType.NUMBER:
+                columns.append((i, 'number'))
+            elif category.name in self.timestamp_parsers:
+                columns.append((i, 'timestamp'))
+        return columns or None
+    
+    def _convert_block(self, texts: List[str]) -> List[List[Any]]:
+        """Bulk-converted values of the block columns for a block of single-line entries
         
-        for i, match in enumerate(matches, 1):
-            log_text = match.group(1).strip()
-            entry = self._parse_log_entry(log_text, i, is_multiline='\n' in log_text)
-            if entry:
-                logs.append(entry)
+        The block is encoded once and its line ends and category separators
+        are found with vectorised byte searches, which give the bounds of each
+        field. Fields that are not plain integers, or timestamps in the layout
+        their parser is using, are left _UNPARSED for the scalar conversion.
+        """
+        rows = len(texts)
+        for i, kind in self.block_columns:
+            timestamp_parser = self.timestamp_parsers.get(self.config.categories[i].name)
+            if kind == 'timestamp' and timestamp_parser.format is None:
+                # Infer the layout from the first entry, as the scalar parser would
+                parts = self.category_separators.split(texts[0], i + 1)
+                if len(parts) > i:
+                    timestamp_parser.parse(parts[i].strip())
         
-        # If no delimiters found, try line-by-line parsing
-        if not logs:
-            return self._parse_single_line_logs(content)
+        data = '\n'.join(texts).encode('utf-8', 'surrogatepass')
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        line_ends = np.append(np.flatnonzero(buffer == 10), len(data))
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+        separators = np.flatnonzero(buffer == ord(self.separator))
+        counts = np.bincount(np.searchsorted(line_ends, separators), minlength=rows)
+        firsts = np.cumsum(counts) - counts  # Index of each row's first separator
+        bounds = np.append(separators, len(data))
         
-        return logs
+        columns = []
+        for i, kind in self.block_columns:
+            if i == 0:
+                starts = line_starts
+            else:
+                starts = bounds[np.minimum(firsts + i - 1, len(separators))] + 1
+            ends = np.where(counts > i, bounds[np.minimum(firsts + i, len(separators))], line_ends)
+            if kind == 'number':
+                values, valid = _bulk_integers(buffer, starts, ends)
+            else:
+                layout = TimestampParser._FIXED_LAYOUTS.get(
+                    self.timestamp_parsers[self.config.categories[i].name].format)
+                if layout is None:
+                    columns.append([_UNPARSED] * rows)
+                    continue
+                values, valid = _bulk_timestamps(buffer, starts, ends, layout)
+            column = values.tolist()
+            for row in np.flatnonzero(~(valid & (counts >= i))).tolist():
+                column[row] = _UNPARSED
+            columns.append(column)
+        return columns
     
-    def _parse_single_line_logs(self, content: str) -> List[LogEntry]:
-        """Parse logs where each line is a separate entry"""
-        logs = []
-        lines = content.strip().split('\n')
+    def _open_log_file(self, file_path: str, seek_points: Optional[List] = None,
+                       tee: Optional[Callable[[int, bytes], None]] = None) -> BinaryIO:
+        """Open a log file for binary reading without locking it
         
-        for i, line in enumerate(lines, 1):
-            if line.strip():
-                entry = self._parse_log_entry(line.strip(), i)
-                if entry:
-                    logs.append(entry)
+        Compressed files (see COMPRESSED_OPENERS) are decompressed as they are
+        read. A gzip file opened with a list of seek points is read through a
+        GzipReader that uses and extends them, and hands what it decompresses
+        to tee.
+        """
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix == '.gz' and seek_points is not None:
+            return GzipReader(file_path, seek_points, tee)
+        if suffix in COMPRESSED_OPENERS:
+            return COMPRESSED_OPENERS[suffix](file_path, 'rb')
         
-        return logs
+        # Read file without exclusive lock - allows other processes to access it
+        f = open(file_path, 'rb')
+        if os.name == 'nt':  # Windows
+            import msvcrt
+            # Ensure file is not locked
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            except:
+                pass  # File might be in use, but we can still try to read
+        return f
     
-    def _parse_log_entry(self, text: str, line_number: int, is_multiline: bool = False) -> Optional[LogEntry]:
-        """Parse a single log entry"""
-        if not text:
-            return None
+    def is_compressed(self, file_path: str) -> bool:
+        """Whether a file is read through a decompressor"""
+        return os.path.splitext(file_path)[1].lower() in COMPRESSED_OPENERS
+    
+    def _decode(self, data: bytes) -> str:
+        """Decode raw file bytes, normalising line endings like text mode does
         
-        entry = LogEntry(raw_text=text, line_number=line_number, is_multiline=is_multiline)
+        Invalid UTF-8 is handled by the 'DecodeErrors' handler, so a bad byte
+        only affects the entry it is in. With 'surrogateescape' the original
+        bytes are written back out on export.
+        """
+        text = data.decode('utf-8', self.decode_errors)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _iter_line_records(self, f: BinaryIO, chunk_size: int,
+                           checkpoint: 'FileCheckpoint') -> Iterator[Tuple[int, str]]:
+        """Yield (line_number, text) for each non-blank line of a binary stream"""
+        f.seek(checkpoint.offset)
+        line_number = checkpoint.next_number - 1
+        pending = bytearray()
         
-        # Split by category separator
-        separator_list = self.delimiters['categorySeparator']
-        separator = separator_list[0] if isinstance(separator_list, list) and separator_list else separator_list
-        parts = text.split(separator)
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            
+            # Only complete lines are decoded; the tail waits for the next chunk
+            cut = chunk.rfind(b'\n')
+            if cut < 0:
+                pending += chunk
+                continue
+            pending += chunk[:cut + 1]
+            lines = self._decode(pending).split('\n')
+            checkpoint.offset += len(pending)
+            checkpoint.next_number = line_number + len(lines)
+            pending = bytearray(chunk[cut + 1:])
+            
+            for line in lines[:-1]:
+                line_number += 1
+                line = line.strip()
+                if line:
+                    yield line_number, line
         
-        # Parse each category in order
+        # An unterminated last line is returned, but stays unconsumed in the checkpoint
+        checkpoint.partial = bytes(pending)
+        checkpoint.size = checkpoint.offset + len(pending)
+        if pending:
+            for line in self._decode(pending).split('\n'):
+                line_number += 1
+                line = line.strip()
+                if line:
+                    checkpoint.partial_entries += 1
+                    yield line_number, line
+    
+    def _uses_entry_delimiters(self) -> bool:
+        """Check if logs use start/end delimiters for multi-line entries"""
+        return bool(self.delimiters.get('logStartDelimiter') and self.delimiters.get('logEndDelimiter'))
+    
+    def _entry_delimiters(self) -> Tuple[str, str]:
+        """Get the (start, end) log entry delimiters"""
+        start_delim_list = self.delimiters['logStartDelimiter']
+        end_delim_list = self.delimiters['logEndDelimiter']
+        
+        # Handle delimiters as arrays - use first delimiter if it's an array
+        start_delim = start_delim_list[0] if isinstance(start_delim_list, list) and start_delim_list else start_delim_list
+        end_delim = end_delim_list[0] if isinstance(end_delim_list, list) and end_delim_list else end_delim_list
+        return start_delim, end_delim
+    
+    def _map_file(self, f: BinaryIO) -> Optional[mmap.mmap]:
+        """Memory-map an open file read-only, or None if it cannot be mapped"""
+        if not isinstance(f, io.BufferedReader):
+            return None  # Decompressed streams have no bytes on disk to map
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            return None
+    
+    def _scan_delimited(self, buffer, start, end, pos: int = 0) -> Iterator[Tuple[int, int, bool]]:
+        """Find entry bodies between start and end delimiters
+        
+        Works on str, bytes or mmap buffers using plain find(). Yields
+        (body_start, body_end, terminated) offsets; an entry that is missing its
+        end delimiter runs to the end of the buffer with terminated=False.
+        """
+        find = buffer.find
+        start_len = len(start)
+        end_len = len(end)
+        
+        while True:
+            start_pos = find(start, pos)
+            if start_pos < 0:
+                return
+            
+            body_start = start_pos + start_len
+            end_pos = find(end, body_start)
+            if end_pos < 0:
+                yield body_start, len(buffer), False
+                return
+            
+            yield body_start, end_pos, True
+            pos = end_pos + end_len
+    
+    def _iter_mapped_records(self, mapped: mmap.mmap, checkpoint: 'FileCheckpoint') -> Iterator[Tuple[int, str]]:
+        """Yield (entry_number, text) for each delimited entry of a memory-mapped file
+        
+        Delimiters are located at the byte level and only the entry bodies are
+        decoded. A trailing entry without an end delimiter is still returned.
+        """
+        start, end = (delim.encode('utf-8') for delim in self._entry_delimiters())
+        index = checkpoint.next_number - 1
+        # Keep just enough bytes to complete a split start delimiter
+        consumed = max(checkpoint.offset, len(mapped) - len(start) + 1)
+        
+        for body_start, body_end, terminated in self._scan_delimited(mapped, start, end, checkpoint.offset):
+            index += 1
+            text = self._decode(mapped[body_start:body_end]).strip()
+            if terminated:
+                consumed = max(body_end + len(end), len(mapped) - len(start) + 1)
+                checkpoint.offset = body_end + len(end)
+                checkpoint.next_number = index + 1
+            else:
+                consumed = body_start - len(start)
+                checkpoint.partial_entries += 1 if text else 0
+            yield index, text
+        
+        checkpoint.offset = consumed
+        checkpoint.partial = mapped[consumed:]
+        checkpoint.size = len(mapped)
+    
+    def _iter_delimited_records(self, f: BinaryIO, chunk_size: int,
+                                checkpoint: 'FileCheckpoint') -> Iterator[Tuple[int, str]]:
+        """Yield (entry_number, text) for each delimited entry of a binary stream
+        
+        Used for streams that cannot be memory-mapped. Entries and delimiters may
+        straddle chunk boundaries; anything after the last complete entry is
+        carried over into the next chunk.
+        """
+        start, end = (delim.encode('utf-8') for delim in self._entry_delimiters())
+        f.seek(checkpoint.offset)
+        index = checkpoint.next_number - 1
+        
+        buffer = b''
+        while True:
+            chunk = f.read(chunk_size)
+            at_eof = not chunk
+            buffer += chunk
+            # Keep just enough bytes to complete a split start delimiter
+            carry = max(0, len(buffer) - len(start) + 1)
+            
+            for body_start, body_end, terminated in self._scan_delimited(buffer, start, end):
+                if not terminated:
+                    carry = body_start - len(start)
+                    if not at_eof:
+                        break
+                
+                index += 1
+                text = self._decode(buffer[body_start:body_end]).strip()
+                if terminated:
+                    carry = max(body_end + len(end), carry)
+                    checkpoint.next_number = index + 1
+                else:
+                    checkpoint.partial_entries += 1 if text else 0
+                yield index, text
+            
+            if at_eof:
+                break
+            checkpoint.offset += carry
+            buffer = buffer[carry:]
+        
+        checkpoint.offset += carry
+        checkpoint.partial = buffer[carry:]
+        checkpoint.size = checkpoint.offset + len(checkpoint.partial)
+    
+    def parse_file_parallel(self, file_path: str, workers: int = 0,
+                            checkpoint: Optional['FileCheckpoint'] = None) -> List[LogEntry]:
+        """Parse a file in a pool of worker processes
+        
+        The file is split into byte ranges that start and end on line or entry
+        boundaries. Ranges are parsed concurrently and reassembled in file
+        order with global line/entry numbers. Falls back to parse_file() if
+        worker processes cannot be used.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        
+        workers = workers or os.cpu_count() or 1
+        delimited, ranges = self.split_ranges(file_path, workers)
+        if len(ranges) < 2:
+            return self.parse_file(file_path, checkpoint)
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                     initargs=(self.config.config,)) as executor:
+                results = executor.map(_parse_range_worker, [file_path] * len(ranges),
+                                       [start for start, _ in ranges], [end for _, end in ranges],
+                                       [delimited] * len(ranges))
+                logs = []
+                base = 0
+                for (start, _), (entries, range_checkpoint) in zip(ranges, results):
+                    for entry in entries:
+                        entry.line_number += base
+                    logs.extend(entries)
+                    base += range_checkpoint.next_number - 1
+        except (OSError, BrokenProcessPool):
+            return self.parse_file(file_path, checkpoint)
+        
+        if checkpoint is not None:
+            # The last range describes the end of the file
+            range_checkpoint.offset += start
+            range_checkpoint.size += start
+            range_checkpoint.next_number = base + 1
+            range_checkpoint.delimited = delimited
+            with self._open_log_file(file_path) as f:
+                range_checkpoint.head = f.read(CHECKPOINT_HEAD_SIZE)
+                range_checkpoint.inode = os.fstat(f.fileno()).st_ino
+            vars(checkpoint).update(vars(range_checkpoint))
+        
+        return logs
+    
+    def split_ranges(self, file_path: str, count: int) -> Tuple[bool, List[Tuple[int, int]]]:
+        """Split a file into byte ranges that begin on line or entry boundaries
+        
+        Returns whether the file is parsed by entry delimiters, and the
+        (start, end) ranges covering the whole file. Ranges are cut right
+        after a newline, or right after an end delimiter - which can only
+        close an entry or sit between entries - so each range parses the same
+        as it would in a sequential read.
+        """
+        with self._open_log_file(file_path) as f:
+            mapped = self._map_file(f)
+            if mapped is None:
+                return False, []
+            
+            with mapped:
+                size = len(mapped)
+                delimited = False
+                boundary = b'\n'
+                if self._uses_entry_delimiters():
+                    start, end = (delim.encode('utf-8') for delim in self._entry_delimiters())
+                    if mapped.find(start) >= 0:
+                        delimited = True
+                        boundary = end
+                
+                count = max(count, -(-size // PARALLEL_RANGE_SIZE))
+                cuts = [0]
+                for i in range(1, count):
+                    pos = mapped.find(boundary, max(size * i // count, cuts[-1]))
+                    if pos < 0:
+                        break
+                    cut = pos + len(boundary)
+                    if cut > cuts[-1] and cut < size:
+                        cuts.append(cut)
+                cuts.append(size)
+        
+        return delimited, list(zip(cuts, cuts[1:]))
+    
+    def parse_range(self, file_path: str, start: int, end: int,
+                    delimited: bool) -> Tuple[List[LogEntry], 'FileCheckpoint']:
+        """Parse one byte range of a file
+        
+        Entries are numbered from 1 within the range; the returned checkpoint
+        is relative to the range start and its next_number tells how many
+        line/entry numbers the range used.
+        """
+        with self._open_log_file(file_path) as f:
+            f.seek(start)
+            data = f.read(end - start)
+        
+        checkpoint = FileCheckpoint()
+        stream = io.BytesIO(data)
+        if delimited:
+            records = self._iter_delimited_records(stream, len(data) or 1, checkpoint)
+        else:
+            records = self._iter_line_records(stream, len(data) or 1, checkpoint)
+        entries = list(self._entries_from_records(records, file_path, delimited=delimited))
+        return entries, checkpoint
+    
+    def index_file(self, file_path: str, index: 'LogIndex') -> 'LogIndex':
+        """Add the entries of a file past the last checkpoint of an index
+        
+        An empty index is filled from the start of the file. The entry at the
+        last checkpoint is indexed again, as it may have been incomplete.
+        Offsets of compressed files are in decompressed bytes; gzip files also
+        get seek points (see GzipReader) and, if the index has a directory, a
+        copy with saved seek points (see LogIndex).
+        """
+        self._reset_timestamps(file_path)
+        
+        copy = None
+        if (index.directory and os.path.splitext(file_path)[1].lower() == '.gz'
+                and (index.copy_points or not index.offsets)):
+            try:
+                os.makedirs(index.directory, exist_ok=True)
+                copy = GzipBlockWriter(index.copy_path(), index.copy_points)
+            except OSError:
+                pass  # The copy is best effort, like saving the index
+        index.copy_points = []
+        try:
+            self._index_records(file_path, index, copy and copy.write)
+        finally:
+            if copy is not None:
+                index.copy_points = copy.close()
+        return index
+    
+    def _index_records(self, file_path: str, index: 'LogIndex', tee: Optional[Callable[[int, bytes], None]]):
+        """Add the checkpoints of index_file(), handing what a gzip file decompresses to tee"""
+        with self._open_log_file(file_path, seek_points=index.seek_points, tee=tee) as f:
+            stat = os.fstat(f.fileno())
+            index.inode, index.size, index.mtime_ns = stat.st_ino, stat.st_size, stat.st_mtime_ns
+            
+            if index.offsets:
+                last = len(index.offsets) - 1
+                offset, number = index.offsets[last], index.numbers[last]
+                epoch = index.epochs[last - 1] if last else _NO_EPOCH
+                del index.offsets[last:], index.numbers[last:], index.epochs[last:]
+                position = last * index.stride
+                if index.delimited:
+                    records = self._iter_delimited_offsets(f, offset, number)
+                else:
+                    records = self._iter_line_offsets(f, offset, number)
+            else:
+                epoch, position = _NO_EPOCH, 0
+                records = None
+                if self._uses_entry_delimiters():
+                    # Like iter_entries, fall back to lines if no entry is delimited
+                    records = self._iter_delimited_offsets(f, 0, 1)
+                    first = next(records, None)
+                    records = itertools.chain([first], records) if first else None
+                index.delimited = records is not None
+                if records is None:
+                    records = self._iter_line_offsets(f, 0, 1)
+            
+            for position, (offset, number, text) in enumerate(records, position):
+                if position % index.stride == 0:
+                    parsed = self._record_epoch(self._decode(text))
+                    if parsed is not None:
+                        epoch = parsed
+                    index.offsets.append(offset)
+                    index.numbers.append(number)
+                    index.epochs.append(epoch)
+                index.count = position + 1
+    
+    def _iter_line_offsets(self, f: BinaryIO, offset: int, number: int) -> Iterator[Tuple[int, int, bytes]]:
+        """Yield (offset, line_number, raw_text) of each non-blank line of a stream from an offset"""
+        f.seek(offset)
+        pending = b''
+        while True:
+            chunk = f.read(DEFAULT_CHUNK_SIZE)
+            buffer = pending + chunk
+            find = buffer.find
+            pos = 0
+            while True:
+                end = find(b'\n', pos)
+                if end < 0:
+                    break
+                text = buffer[pos:end]
+                if text.strip():
+                    yield offset + pos, number, text
+                pos = end + 1
+                number += 1
+            offset += pos
+            pending = buffer[pos:]
+            
+            if not chunk:
+                if pending.strip():
+                    yield offset, number, pending
+                return
+    
+    def _iter_delimited_offsets(self, f: BinaryIO, offset: int, number: int) -> Iterator[Tuple[int, int, bytes]]:
+        """Yield (offset, entry_number, raw_body) of each delimited entry of a stream from an offset"""
+        start, end = (delim.encode('utf-8') for delim in self._entry_delimiters())
+        f.seek(offset)
+        buffer = b''
+        while True:
+            chunk = f.read(DEFAULT_CHUNK_SIZE)
+            at_eof = not chunk
+            buffer += chunk
+            # Keep just enough bytes to complete a split start delimiter
+            carry = max(0, len(buffer) - len(start) + 1)
+            
+            for body_start, body_end, terminated in self._scan_delimited(buffer, start, end):
+                if not terminated:
+                    carry = body_start - len(start)
+                    if not at_eof:
+                        break
+                yield offset + body_start - len(start), number, buffer[body_start:body_end]
+                number += 1
+                if terminated:
+                    carry = max(body_end + len(end), carry)
+            
+            if at_eof:
+                return
+            offset += carry
+            buffer = buffer[carry:]
+    
+    def _record_epoch(self, text: str) -> Optional[int]:
+        """Epoch of the Timestamp field of an unparsed entry, or None"""
+        timestamp_parser = self.timestamp_parsers.get('Timestamp')
+        if not timestamp_parser:
+            return None
+        position = self.category_positions['Timestamp'][0]
+        parts = self.category_separators.split(text.strip(), position + 1)
+        if len(parts) <= position:
+            return None
+        return timestamp_parser.parse(parts[position].strip())
+    
+    def iter_indexed_records(self, index: 'LogIndex', position: int,
+                             count: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (number, text) records of an indexed file from an entry position on
+        
+        Reading starts at the nearest checkpoint at or before the position, so
+        at most stride - 1 entries are skipped over. A gzip file is read from
+        its copy when it has one (see LogIndex).
+        """
+        checkpoint_index = min(position // index.stride, len(index.offsets) - 1)
+        if checkpoint_index < 0:
+            return
+        checkpoint = FileCheckpoint(offset=index.offsets[checkpoint_index],
+                                    next_number=index.numbers[checkpoint_index])
+        skip = position - checkpoint_index * index.stride
+        
+        f = None
+        if index.copy_points:
+            try:
+                f = GzipReader(index.copy_path(), index.copy_points)
+            except OSError:
+                index.copy_points = []  # Removed since; read the file itself
+        if f is None:
+            f = self._open_log_file(index.file_path, seek_points=index.seek_points)
+        with f:
+            if index.delimited:
+                records = self._iter_delimited_records(f, INDEX_CHUNK_SIZE, checkpoint)
+            else:
+                records = self._iter_line_records(f, INDEX_CHUNK_SIZE, checkpoint)
+            yield from itertools.islice(records, skip, None if count is None else skip + count)
+    
+    def iter_indexed_entries(self, index: 'LogIndex', position: int,
+                             count: Optional[int] = None) -> Iterator[LogEntry]:
+        """Yield the entries of count records of an indexed file from an entry position on"""
+        self._reset_timestamps(index.file_path)
+        records = self.iter_indexed_records(index, position, count)
+        yield from self._entries_from_records(records, index.file_path, delimited=index.delimited)
+    
+    def _parse_multiline_logs(self, content: str) -> List[LogEntry]:
+        """Parse logs that may span multiple lines using delimiters"""
+        logs = []
+        start_delim, end_delim = self._entry_delimiters()
+        
+        for i, (body_start, body_end, _) in enumerate(self._scan_delimited(content, start_delim, end_delim), 1):
+            log_text = content[body_start:body_end].strip()
+            entry = self._parse_log_entry(log_text, i, is_multiline='\n' in log_text)
+            if entry:
+                logs.append(entry)
+        
+        # If no delimiters found, try line-by-line parsing
+        if not logs:
+            return self._parse_single_line_logs(content)
+        
+        return logs
+    
+    def _parse_single_line_logs(self, content: str) -> List[LogEntry]:
+        """Parse logs where each line is a separate entry"""
+        lines = content.strip().split('\n')
+        records = ((i, line.strip()) for i, line in enumerate(lines, 1) if line.strip())
+        return list(self._entries_from_records(records, None))
+    
+    def _parse_log_entry(self, text: str, line_number: int, is_multiline: bool = False) -> Optional[LogEntry]:
+        """Parse a single log entry"""
+        if not text:
+            return None
+        
+        if self.lazy_fields:
+            # Only find where each category ends; values are parsed when read.
+            # Alternative separators are normalised so every one has the same length
+            field_text = self.category_separators.normalise(text)
+            ends = tuple(itertools.accumulate(map(len, field_text.split(self.separator))))
+            fields = LazyFields(self, field_text, ends)
+            return LogEntry(raw_text=text, line_number=line_number, fields=fields,
+                            is_multiline=is_multiline, epochs=LazyEpochs(self, fields))
+        
+        return self._parse_entry(text, line_number, is_multiline)
+    
+    def _parse_entry_generic(self, text: str, line_number: int, is_multiline: bool = False) -> LogEntry:
+        """Parse the fields of an entry one category at a time
+        
+        The reference for the code generated by _compile_entry_parser(),
+        which gives the same entries.
+        """
+        entry = LogEntry(raw_text=text, line_number=line_number, is_multiline=is_multiline)
+        
+        # Split by category separator
+        parts = self.category_separators.split(text)
+        
+        # Parse each category in order
         for i, category in enumerate(self.config.categories):
             if i < len(parts):
-                value = self._parse_field(parts[i].strip(), category)
+                value = self._field_value(parts[i].strip(), category)
                 entry.fields[category.name] = value
+                timestamp_parser = self.timestamp_parsers.get(category.name)
+                if timestamp_parser:
+                    epoch = timestamp_parser.parse(value)
+                    if epoch is not None:
+                        entry.epochs[category.name] = epoch
         
         return entry
     
-    def _parse_field(self, value: str, category: LogCategory) -> Any:
-        """Parse field based on its type"""
-        field_type = category.get_field_type()
+    def _compile_entry_parser(self) -> Callable[..., LogEntry]:
+        """Generate an eager entry parser specialised to the category list
+        
+        Like namedtuple, the source of the function is written for this
+        configuration: each category's conversion is inlined in order, with
+        its name, value dictionary and timestamp parser bound as globals, so
+        no field type is dispatched on per entry. Values already converted by
+        the block parser are passed in bulk, one per block column.
+        """
+        block_slots = {i: slot for slot, (i, _) in enumerate(self.block_columns or ())}
+        namespace = {
+            'LogEntry': LogEntry,
+            '_UNPARSED': _UNPARSED,
+            '_NO_BULK': (_UNPARSED,) * len(block_slots),
+            'fixed_layouts': TimestampParser._FIXED_LAYOUTS,
+            'split': self.category_separators.split,
+            'field_value': self._field_value,
+        }
+        lines = [
+            'def parse_entry(text, line_number, is_multiline, bulk=_NO_BULK):',
+            '    parts = split(text)',
+            '    count = len(parts)',
+            '    fields = {}',
+            '    epochs = {}',
+        ]
+        for i, category in enumerate(self.config.categories):
+            namespace[f'name_{i}'] = category.name
+            namespace[f'category_{i}'] = category
+            lines += [f'    if count > {i}:',
+                      f'        value = parts[{i}].strip()']
+            
+            field_type = category.get_field_type()
+            if field_type == FieldType.NUMBER:
+                indent = '        '
+                if i in block_slots:
+                    # Values the block parser converted are taken as they are
+                    lines += [f'        converted = bulk[{block_slots[i]}]',
+                              '        if converted is not _UNPARSED:',
+                              '            value = converted',
+                              '        else:']
+                    indent += '    '
+                lines += [f'{indent}try:',
+                          f"{indent}    value = float(value) if '.' in value else int(value)",
+                          f'{indent}except ValueError:',
+                          f'{indent}    value = None']
+            elif field_type == FieldType.STRING:
+                if category.name in self.value_dictionaries:
+                    # Shared values are looked up inline; field_value parses and stores new ones
+                    namespace[f'values_{i}'] = self.value_dictionaries[category.name]
+                    lines += [f'        parsed = values_{i}.get(value, _UNPARSED)',
+                              f'        value = field_value(value, category_{i}) if parsed is _UNPARSED else parsed']
+                else:
+                    lines += [f'        value = field_value(value, category_{i})']
+            lines += [f'        fields[name_{i}] = value']
+            
+            if category.name in self.timestamp_parsers:
+                namespace[f'timestamp_{i}'] = self.timestamp_parsers[category.name].parse
+                if i in block_slots:
+                    # A bulk epoch stands for the scalar one while a fixed layout is in use;
+                    # after an entry in another layout the next ones are parsed one at a time
+                    namespace[f'timestamp_parser_{i}'] = self.timestamp_parsers[category.name]
+                    lines += [f'        epoch = bulk[{block_slots[i]}]',
+                              f'        if epoch is _UNPARSED or timestamp_parser_{i}.format not in fixed_layouts:',
+                              f'            epoch = timestamp_{i}(value)']
+                else:
+                    lines += [f'        epoch = timestamp_{i}(value)']
+                lines += ['        if epoch is not None:',
+                          f'            epochs[name_{i}] = epoch']
+        
+        lines.append('    return LogEntry(raw_text=text, line_number=line_number, fields=fields, '
+                     'is_multiline=is_multiline, epochs=epochs)')
+        exec('\n'.join(lines), namespace)
+        return namespace['parse_entry']
+    
+    def _field_value(self, text: str, category: LogCategory) -> Any:
+        """Parse a field, sharing one value between entries with the same text
+        
+        String categories keep a dictionary of the values parsed so far until
+        it reaches FIELD_DICTIONARY_LIMIT entries; after that the category is
+        parsed afresh for every entry until reset_values(). Shared values are
+        immutable: strings, FrozenDict and FrozenList.
+        """
+        dictionary = self.value_dictionaries.get(category.name)
+        if dictionary is None or category.name in self.unshared_categories:
+            return self._parse_field(text, category)
+        
+        value = dictionary.get(text, _UNPARSED)
+        if value is _UNPARSED:
+            value = self._parse_field(text, category)
+            if len(dictionary) < FIELD_DICTIONARY_LIMIT:
+                value = dictionary[text] = sys.intern(value) if isinstance(value, str) else _freeze(value)
+            else:
+                # Too many distinct values to share
+                self.unshared_categories.add(category.name)
+                dictionary.clear()
+        return value
+    
+    def reset_values(self):
+        """Forget the shared field values, so that a new load shares its own"""
+        for dictionary in self.value_dictionaries.values():
+            dictionary.clear()
+        self.unshared_categories.clear()
+    
+    def _parse_field(self, value: str, category: LogCategory) -> Any:
+        """Parse field based on its type"""
+        field_type = category.get_field_type()
+        
+        if field_type == FieldType.DATETIME:
+            return self._parse_datetime(value)
+        elif field_type == FieldType.NUMBER:
+            return self._parse_number(value)
+        else:  # STRING or other types
+            # Check if value is contained within delimiters
+            return self._parse_container_value(value)
+    
+    def _parse_datetime(self, value: str) -> str:
+        """Parse datetime field (the display string; its epoch goes in LogEntry.epochs)"""
+        return value
+    
+    def _parse_number(self, value: str) -> Optional[float]:
+        """Parse number field"""
+        try:
+            if '.' in value:
+                return float(value)
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+    
+    def _parse_container_value(self, value: str) -> Any:
+        """Parse value that may be contained within delimiters"""
+        if not value:
+            return value
+        
+        # Check if value is wrapped in container delimiters
+        inner_value = value
+        for start_delim, end_delim in self.containers:
+            if value.startswith(start_delim) and value.endswith(end_delim):
+                # Remove container delimiters
+                inner_value = value[len(start_delim):-len(end_delim)].strip()
+                break
+        
+        # Try to parse as structured data (key-value pairs)
+        if self.key_value_separators.found_in(inner_value):
+            return self._parse_structured_data(inner_value)
+        # Try to parse as array (comma-separated)
+        elif self.element_separators.found_in(inner_value):
+            return self._parse_array_data(inner_value)
+        # Return as string if no special structure detected
+        else:
+            return inner_value
+    
+    def _parse_structured_data(self, value: str) -> Dict[str, str]:
+        """Parse structured data (key-value pairs)"""
+        result = {}
+        
+        if not value:
+            return result
+        
+        # Split by any key-value pairs separator, then by the first key-value separator
+        split_pair = self.key_value_separators.split
+        for pair in self.pair_separators.split(value):
+            key_value = split_pair(pair, 1)
+            if len(key_value) == 2:
+                result[key_value[0].strip()] = key_value[1].strip()
+        
+        return result
+    
+    def _parse_array_data(self, value: str) -> List[str]:
+        """Parse array data (comma-separated values)"""
+        if not value:
+            return []
+        
+        return [item.strip() for item in self.element_separators.split(value) if item.strip()]
+
+
+# Parser of a parse worker process, built once per process by _init_parse_worker
+_worker_parser: Optional[LogParser] = None
+
+
+def _init_parse_worker(config: Dict):
+    """Build the parser used by a parse worker process"""
+    global _worker_parser
+    _worker_parser = LogParser(ConfigManager(config_dict=config))
+
+
+def _parse_range_worker(file_path: str, start: int, end: int, delimited: bool):
+    """Parse one byte range in a worker process"""
+    return _worker_parser.parse_range(file_path, start, end, delimited)
+
+
+def _parse_file_worker(file_path: str) -> Tuple[List[LogEntry], 'FileCheckpoint']:
+    """Parse a whole file in a worker process"""
+    checkpoint = FileCheckpoint()
+    return _worker_parser.parse_file(file_path, checkpoint), checkpoint
+
+
+def _merge_key(log: LogEntry) -> Optional[Tuple[int, str]]:
+    """Sort key of an entry in a merged view, None when it has no timestamp
+    
+    Recognised timestamps order by epoch; the rest fall back to their text.
+    """
+    timestamp = log.get_field('Timestamp')
+    if timestamp is None or timestamp == '':
+        return None
+    epoch = log.get_epoch('Timestamp')
+    return (-1 if epoch is None else epoch, timestamp if isinstance(timestamp, str) else str(timestamp))
+
+
+def _reorder_entries(entries: Iterable[LogEntry], window: int) -> Iterator[Tuple[Any, int, LogEntry]]:
+    """Yield (key, sequence, entry) in key order, holding back at most window entries
+    
+    Entries without a timestamp take the key of the entry before them, so
+    continuation lines stay with the entry they follow.
+    """
+    heap = []
+    key = (-1, '')
+    for sequence, entry in enumerate(entries):
+        entry_key = _merge_key(entry)
+        if entry_key is not None:
+            key = entry_key
+        item = (key, sequence, entry)
+        if len(heap) < window:
+            heapq.heappush(heap, item)
+        else:
+            yield heapq.heappushpop(heap, item)
+    while heap:
+        yield heapq.heappop(heap)
+
+
+def merge_entries(streams: Iterable[Iterable[LogEntry]], window: int = MERGE_REORDER_WINDOW) -> Iterator[LogEntry]:
+    """Lazily merge per-file entry streams into one timestamp-ordered stream
+    
+    Each stream is expected to be roughly in time order already; entries up
+    to window places out of order are put back in order, anything further out
+    is passed through where it falls. Equal timestamps keep stream order.
+    """
+    reordered = [_reorder_entries(stream, max(window, 1)) for stream in streams]
+    for _, _, entry in heapq.merge(*reordered, key=lambda item: item[0]):
+        yield entry
+
+
+# Markers for LogStore cells: field not present in the entry / reparse from raw text
+_ABSENT = object()
+_REPARSE = object()
+
+# Epoch stored by a LogStore for a timestamp that was not recognised
+_NO_EPOCH = -(1 << 63)
+
+# LogStore number cell kinds
+_NUMBER_ABSENT, _NUMBER_NONE, _NUMBER_INT, _NUMBER_FLOAT, _NUMBER_REPARSE = range(5)
+
+
+class LogStore(Sequence):
+    """Column-oriented storage of log entries
+    
+    Holds the same entries as a List[LogEntry] in a fraction of the memory.
+    Raw text is kept as UTF-8 in one buffer indexed by offsets, numbers and
+    epochs in typed arrays, and other fields as codes into a per-column
+    dictionary of distinct values. A column that grows past
+    STORE_DICTIONARY_LIMIT distinct values stops storing values; they are
+    reparsed from the raw text when the entry is read.
+    
+    Indexing builds a LogEntry view on demand, so reading the same entry
+    twice gives equal but distinct objects. Entries can be appended, another
+    store's entries put in front (prepend), and entries removed from the
+    end only.
+    """
+    
+    def __init__(self, parser: LogParser):
+        self.parser = parser
+        self._split_categories = parser.category_separators.split
+        self._categories = list(parser.config.categories)
+        
+        self._text = bytearray()
+        # Offset of each entry's text, then of the end of the text; _text
+        # starts at _offsets[0], which goes negative as text is prepended
+        self._offsets = array('q', [0])
+        self._line_numbers = array('q')
+        self._multiline = bytearray()
+        self._source_codes = array('I')
+        self._sources: List[Optional[str]] = []
+        self._source_index: Dict[Optional[str], int] = {}
+        
+        self._numbers: Dict[str, array] = {}
+        self._number_kinds: Dict[str, bytearray] = {}
+        self._codes: Dict[str, Optional[array]] = {}
+        self._values: Dict[str, List[Any]] = {}
+        self._value_index: Dict[str, Dict[str, int]] = {}
+        for category in self._categories:
+            if category.get_field_type() == FieldType.NUMBER:
+                self._numbers[category.name] = array('d')
+                self._number_kinds[category.name] = bytearray()
+            else:
+                self._codes[category.name] = array('I')
+                self._values[category.name] = [_ABSENT]
+                self._value_index[category.name] = {}
+        self._epochs = {name: array('q') for name in parser.timestamp_parsers}
+    
+    def __len__(self) -> int:
+        return len(self._line_numbers)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LogStore index out of range")
+        return self._entry(index)
+    
+    def __iter__(self) -> Iterator[LogEntry]:
+        for index in range(len(self)):
+            yield self._entry(index)
+    
+    def __delitem__(self, index):
+        """Remove entries from the end, e.g. del store[-n:]"""
+        start, stop, step = index.indices(len(self)) if isinstance(index, slice) else (None, None, None)
+        if start is None or stop != len(self) or step != 1:
+            raise ValueError("LogStore entries can only be removed from the end")
+        if start >= stop:
+            return
+        
+        del self._text[self._offsets[start] - self._offsets[0]:]
+        del self._offsets[start + 1:]
+        for column in (self._line_numbers, self._multiline, self._source_codes,
+                       *self._numbers.values(), *self._number_kinds.values(),
+                       *(codes for codes in self._codes.values() if codes is not None),
+                       *self._epochs.values()):
+            del column[start:]
+    
+    def append(self, entry: LogEntry):
+        """Add an entry at the end"""
+        self._text += entry.raw_text.encode('utf-8', 'surrogatepass')
+        self._offsets.append(self._offsets[0] + len(self._text))
+        self._line_numbers.append(entry.line_number)
+        self._multiline.append(entry.is_multiline)
+        
+        source = self._source_index.get(entry.source_file)
+        if source is None:
+            source = self._source_index[entry.source_file] = len(self._sources)
+            self._sources.append(entry.source_file)
+        self._source_codes.append(source)
+        
+        parts = None
+        fields = entry.fields
+        for i, category in enumerate(self._categories):
+            name = category.name
+            
+            if name in self._numbers:
+                value = fields.get(name, _ABSENT)
+                if value is _ABSENT:
+                    kind, number = _NUMBER_ABSENT, 0.0
+                elif value is None:
+                    kind, number = _NUMBER_NONE, 0.0
+                elif isinstance(value, float):
+                    kind, number = _NUMBER_FLOAT, value
+                elif isinstance(value, int) and abs(value) <= 1 << 53:
+                    kind, number = _NUMBER_INT, float(value)
+                else:
+                    kind, number = _NUMBER_REPARSE, 0.0
+                self._number_kinds[name].append(kind)
+                self._numbers[name].append(number)
+                continue
+            
+            codes = self._codes[name]
+            if codes is None:
+                continue  # Reparsed from the raw text
+            if name not in fields:
+                codes.append(0)
+                continue
+            
+            # Values are keyed by their text in the entry, which also covers
+            # parsed dicts and lists; a lazy entry only parses new values
+            if parts is None:
+                parts = self._split_categories(entry.raw_text)
+            key = parts[i].strip() if i < len(parts) else None
+            value_index = self._value_index[name]
+            code = value_index.get(key)
+            if code is None:
+                values = self._values[name]
+                if len(values) > STORE_DICTIONARY_LIMIT:
+                    self._spill(name)
+                    continue
+                code = value_index[key] = len(values)
+                values.append(fields[name])
+            codes.append(code)
+        
+        for name, epochs in self._epochs.items():
+            epoch = entry.get_epoch(name)
+            epochs.append(_NO_EPOCH if epoch is None else epoch)
+    
+    def extend(self, entries: Iterable[LogEntry]):
+        """Add entries at the end"""
+        for entry in entries:
+            self.append(entry)
+    
+    def prepend(self, other: 'LogStore'):
+        """Put the entries of another store with the same categories in front
+        
+        The stored entries keep their arrays and dictionary codes; only the
+        other store's entries are re-coded, so the cost is that of the
+        entries added plus moving the arrays once.
+        """
+        shift = self._offsets[0] - other._offsets[-1]
+        self._text[:0] = other._text
+        self._offsets[:0] = array('q', (offset + shift for offset in other._offsets[:-1]))
+        self._line_numbers[:0] = other._line_numbers
+        self._multiline[:0] = other._multiline
+        
+        sources = []
+        for source in other._sources:
+            code = self._source_index.get(source)
+            if code is None:
+                code = self._source_index[source] = len(self._sources)
+                self._sources.append(source)
+            sources.append(code)
+        self._source_codes[:0] = array('I', (sources[code] for code in other._source_codes))
+        
+        for name, numbers in self._numbers.items():
+            numbers[:0] = other._numbers[name]
+            self._number_kinds[name][:0] = other._number_kinds[name]
+        for name, codes in self._codes.items():
+            if codes is None:
+                continue
+            other_codes = other._codes[name]
+            if other_codes is None:
+                self._spill(name)
+                continue
+            # Other's codes in this store's dictionary, by the values' text keys
+            recode = [0] * len(other._values[name])
+            value_index, values = self._value_index[name], self._values[name]
+            for key, other_code in other._value_index[name].items():
+                code = value_index.get(key)
+                if code is None:
+                    code = value_index[key] = len(values)
+                    values.append(other._values[name][other_code])
+                recode[other_code] = code
+            if len(values) > STORE_DICTIONARY_LIMIT + 1:
+                self._spill(name)
+                continue
+            codes[:0] = array('I', (recode[code] for code in other_codes))
+        for name, epochs in self._epochs.items():
+            epochs[:0] = other._epochs[name]
+    
+    def select(self, name: str, matches: Callable[[Any], bool]) -> Optional[List[LogEntry]]:
+        """Entries whose value in a dictionary-encoded column satisfies matches
+        
+        matches is called once per distinct value, and only the selected
+        entries are built. Returns None if the column is not dictionary-encoded.
+        """
+        codes = self._codes.get(name)
+        if codes is None:
+            return None
+        selected = [code > 0 and bool(matches(value)) for code, value in enumerate(self._values[name])]
+        return [self._entry(row) for row, code in enumerate(codes) if selected[code]]
+    
+    def column(self, name: str) -> Optional[Tuple[array, List[Any]]]:
+        """Codes and distinct values of a dictionary-encoded column, None if it is not
+        
+        Code 0 marks entries without the field. Both are the store's own
+        arrays, so they grow as entries are appended.
+        """
+        codes = self._codes.get(name)
+        if codes is None:
+            return None
+        return codes, self._values[name]
+    
+    def number_column(self, name: str) -> Optional[Tuple[array, bytearray]]:
+        """Numbers and their kinds (_NUMBER_INT etc.) of a number column, None if there is none
+        
+        Both are the store's own arrays, so they grow as entries are appended.
+        """
+        if name not in self._numbers:
+            return None
+        return self._numbers[name], self._number_kinds[name]
+    
+    def epoch_column(self, name: str) -> Optional[array]:
+        """Epochs of a datetime column (_NO_EPOCH where there is none), None if there is no such column"""
+        return self._epochs.get(name)
+    
+    def _spill(self, name: str):
+        """Stop dictionary-encoding a column; its values are reparsed on read"""
+        self._codes[name] = None
+        self._values[name] = []
+        self._value_index[name] = {}
+    
+    def raw_text(self, index: int) -> str:
+        """Raw text of a stored entry, without building the entry"""
+        base = self._offsets[0]
+        return self._text[self._offsets[index] - base:self._offsets[index + 1] - base].decode('utf-8', 'surrogatepass')
+    
+    def _entry(self, index: int) -> LogEntry:
+        """Build the LogEntry view of a stored entry"""
+        raw_text = self.raw_text(index)
+        entry = LogEntry(raw_text=raw_text, line_number=self._line_numbers[index],
+                         is_multiline=bool(self._multiline[index]),
+                         source_file=self._sources[self._source_codes[index]])
+        
+        parts = None
+        for i, category in enumerate(self._categories):
+            name = category.name
+            if name in self._numbers:
+                kind = self._number_kinds[name][index]
+                if kind == _NUMBER_INT:
+                    value = int(self._numbers[name][index])
+                elif kind == _NUMBER_FLOAT:
+                    value = self._numbers[name][index]
+                elif kind == _NUMBER_NONE:
+                    value = None
+                elif kind == _NUMBER_ABSENT:
+                    value = _ABSENT
+                else:
+                    value = _REPARSE
+            else:
+                codes = self._codes[name]
+                value = _REPARSE if codes is None else self._values[name][codes[index]]
+            
+            if value is _REPARSE:
+                if parts is None:
+                    parts = self._split_categories(raw_text)
+                value = self.parser._parse_field(parts[i].strip(), category) if i < len(parts) else _ABSENT
+            if value is not _ABSENT:
+                entry.fields[name] = value
+        
+        for name, epochs in self._epochs.items():
+            if epochs[index] != _NO_EPOCH:
+                entry.epochs[name] = epochs[index]
+        return entry
+
+
+class ParseCache:
+    """On-disk cache of parsed files
+    
+    Each file is cached per parsing configuration (see config_hash) as a
+    JSON header line followed by the zlib-compressed JSON of its entries: a
+    table of the distinct field values, and per entry its raw text, line
+    number, field names and value codes, flags and epochs. Entries with
+    LazyFields keep only the values already read and where each category
+    ends, so writing them parses nothing but their timestamps, and they are
+    read back as LazyFields by a parser that has them on. Only plain data is read back,
+    but entries are shown as they were cached, so the directory must only be
+    writable by the user: anyone who can write there can change what the
+    viewer shows. An entry is served while the file keeps its inode and, if
+    its size is unchanged, its mtime; a file that has grown is served from
+    the cache and the caller parses the tail from the checkpoint. The least
+    recently used entries are evicted once the directory holds more than
+    max_bytes.
+    """
+    
+    VERSION = 3
+    SUFFIX = '.lvcache'
+    
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+    
+    @staticmethod
+    def config_hash(config: Dict) -> str:
+        """Hash of the parts of a configuration that change how files are parsed, for cache keys
+        
+        Colours, descriptions and display or performance settings are left
+        out, so changing them keeps what was cached.
+        """
+        lvc = config.get('logViewerConfig', {})
+        parsing = {
+            'delimiters': lvc.get('delimiters'),
+            'categories': [{key: category.get(key) for key in ('name', 'type', 'order', 'format')}
+                           for category in lvc.get('categories', [])],
+            'DecodeErrors': lvc.get('DecodeErrors', 'replace'),
+        }
+        return hashlib.sha256(json.dumps(parsing, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    def _path(self, file_path: str, config_hash: str) -> str:
+        key = hashlib.sha256(f"{os.path.abspath(file_path)}\0{config_hash}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key[:32] + self.SUFFIX)
+    
+    def get(self, file_path: str, config_hash: str,
+            parser: 'LogParser') -> Optional[Tuple[List[LogEntry], 'FileCheckpoint']]:
+        """Cached (logs, checkpoint) of a file, or None if missing or stale
+        
+        parser reads the fields of lazily cached entries (see LazyFields).
+        """
+        cache_path = self._path(file_path, config_hash)
+        try:
+            stat = os.stat(file_path)
+            with open(cache_path, 'rb') as f:
+                header = json.loads(f.readline())
+                if (header.get('version') != self.VERSION
+                        or header['path'] != os.path.abspath(file_path)
+                        or header['config_hash'] != config_hash
+                        or header['inode'] != stat.st_ino
+                        or stat.st_size < header['size']
+                        or (stat.st_size == header['size'] and stat.st_mtime_ns != header['mtime_ns'])):
+                    return None
+                logs = self._decode_logs(f.read(), parser)
+                checkpoint = header['checkpoint']
+                checkpoint = FileCheckpoint(**dict(checkpoint, partial=bytes.fromhex(checkpoint['partial']),
+                                                   head=bytes.fromhex(checkpoint['head'])))
+            os.utime(cache_path)  # Mark as recently used
+        except (OSError, ValueError, KeyError, TypeError, zlib.error):
+            return None
+        return logs, checkpoint
+    
+    def put(self, file_path: str, config_hash: str, logs: List[LogEntry], checkpoint: 'FileCheckpoint'):
+        """Store the parsed logs of a file, then evict entries over the size cap"""
+        try:
+            stat = os.stat(file_path)
+            os.makedirs(self.directory, exist_ok=True)
+            header = {
+                'version': self.VERSION,
+                'path': os.path.abspath(file_path),
+                'config_hash': config_hash,
+                'inode': stat.st_ino,
+                'size': checkpoint.stored_size or checkpoint.size,
+                'mtime_ns': stat.st_mtime_ns,
+                'checkpoint': dict(vars(checkpoint), partial=checkpoint.partial.hex(), head=checkpoint.head.hex()),
+            }
+            cache_path = self._path(file_path, config_hash)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                f.write(self._encode_logs(logs))
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            return  # Caching is best effort
+        self.evict()
+    
+    @staticmethod
+    def _encode_logs(logs: Iterable[LogEntry]) -> bytes:
+        """The compressed JSON of entries, each distinct field value object stored once"""
+        values = []      # Also keeps each value alive, so its id is not reused
+        references = []  # Entries holding each value
+        codes = {}
+        name_lists = {}  # Field names of entries, which are mostly alike, stored once
+        entries = []
+        for log in logs:
+            fields = log.fields
+            epochs = dict(log.epochs)
+            lazy = None
+            if isinstance(fields, LazyFields):
+                # Only the values read so far (the timestamps, just now) are stored
+                lazy = [list(fields._ends), None if fields._text == log.raw_text else fields._text]
+                fields = fields._values
+            names = tuple(fields)
+            names_code = name_lists.setdefault(names, len(name_lists))
+            value_codes = []
+            for value in fields.values():
+                code = codes.get(id(value))
+                if code is None:
+                    code = codes[id(value)] = len(values)
+                    values.append(value)
+                    references.append(0)
+                references[code] += 1
+                value_codes.append(code)
+            entries.append([log.raw_text, log.line_number, names_code, value_codes,
+                            log.is_multiline, log.source_file, epochs, lazy])
+        shared = [code for code, count in enumerate(references) if count > 1]
+        data = [values, shared, list(name_lists), entries]
+        return zlib.compress(json.dumps(data).encode('utf-8'), 1)
+    
+    @staticmethod
+    def _decode_logs(data: bytes, parser: 'LogParser') -> List[LogEntry]:
+        """Entries from _encode_logs(); values held by several entries are shared again, so frozen"""
+        values, shared, name_lists, entries = json.loads(zlib.decompress(data))
+        for code in shared:
+            values[code] = _freeze(values[code])
+        value_of = values.__getitem__
+        return [LogEntry(raw_text, line_number, dict(zip(name_lists[names_code], map(value_of, value_codes))),
+                         is_multiline, source_file, epochs) if lazy is None else
+                ParseCache._lazy_entry(parser, raw_text, line_number,
+                                       dict(zip(name_lists[names_code], map(value_of, value_codes))),
+                                       is_multiline, source_file, epochs, lazy)
+                for raw_text, line_number, names_code, value_codes, is_multiline, source_file, epochs, lazy in entries]
+    
+    @staticmethod
+    def _lazy_entry(parser: 'LogParser', raw_text: str, line_number: int, values: Dict[str, Any],
+                    is_multiline: bool, source_file: Optional[str], epochs: Dict[str, int], lazy: List) -> LogEntry:
+        """An entry cached with LazyFields, given the values read before it was cached
+        
+        A parser without LazyFields gets every field parsed, as it would have parsed them itself.
+        """
+        ends, text = lazy
+        fields = LazyFields(parser, raw_text if text is None else text, tuple(ends))
+        fields._values = values
+        if not parser.lazy_fields:
+            return LogEntry(raw_text, line_number, dict(fields), is_multiline, source_file, epochs)
+        lazy_epochs = LazyEpochs(parser, fields)
+        lazy_epochs._epochs = epochs
+        return LogEntry(raw_text, line_number, fields, is_multiline, source_file, lazy_epochs)
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        try:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.endswith(self.SUFFIX):
+                    stat = os.stat(os.path.join(self.directory, name))
+                    entries.append((stat.st_mtime_ns, stat.st_size, name))
+        except OSError:
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+
+
+class LogIndex:
+    """Sidecar index of where the entries of a log file start
+    
+    Holds the byte offset, line/entry number and epoch of every stride-th
+    entry (every entry when stride is 1), so a file can be opened at an
+    entry position, line or time by bisection and read a page at a time
+    without parsing what comes before it. An entry without a timestamp
+    carries the epoch of the checkpoint before it, which keeps the epochs
+    sorted for files written in time order.
+    
+    Saved in directory ('IndexDir', a per-user cache directory by default)
+    under a hash of the file's path, never next to the file, whose directory
+    may be read-only or shared. The file holds a JSON header line followed
+    by the raw checkpoint arrays. An index is current while the file keeps
+    its inode, size and mtime; a file that has only grown can be indexed on
+    from the last checkpoint with LogParser.index_file().
+    
+    Most seek points of a gzip file hold decompressor state, which cannot be
+    saved. So a gzip file is also copied, while it is indexed, to a gzip file
+    of members of GZIP_SEEK_SPAN bytes next to the index (see
+    GzipBlockWriter), whose member starts are saved as copy_points. Pages
+    are read from the copy, which a reloaded index seeks into directly.
+    """
+    
+    VERSION = 2
+    SUFFIX = '.lvidx'
+    COPY_SUFFIX = '.lvgz'
+    
+    def __init__(self, file_path: str, config_hash: str, stride: int = 1, directory: str = ''):
+        self.file_path = file_path
+        self.config_hash = config_hash
+        self.stride = max(1, stride)
+        self.directory = directory   # Where the index is saved; it is not saved when empty
+        self.delimited = False
+        self.count = 0               # Entries in the file
+        self.offsets = array('q')    # Byte offset of each checkpoint entry
+        self.numbers = array('q')    # Line/entry number of each checkpoint entry
+        self.epochs = array('q')     # Epoch of each checkpoint entry
+        self.seek_points = []        # Seek points of a gzip file (see GzipReader)
+        self.copy_points = []        # Seek points of the copy of a gzip file; empty without one
+        self.inode = 0
+        self.size = 0
+        self.mtime_ns = 0
+    
+    @staticmethod
+    def _path(directory: str, file_path: str, suffix: str) -> str:
+        key = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(directory, key[:32] + suffix)
+    
+    def copy_path(self) -> str:
+        """Where the seekable copy of a gzip file is written"""
+        return self._path(self.directory, self.file_path, self.COPY_SUFFIX)
+    
+    @classmethod
+    def load(cls, file_path: str, config_hash: str, directory: str) -> Optional['LogIndex']:
+        """Saved index of a file, or None if it is missing, for another config or
+        for a file that was replaced, truncated or rewritten in place"""
+        try:
+            with open(cls._path(directory, file_path, cls.SUFFIX), 'rb') as f:
+                header = json.loads(f.readline())
+                if (header.get('version') != cls.VERSION
+                        or header['path'] != os.path.abspath(file_path)
+                        or header['config_hash'] != config_hash
+                        or header['byteorder'] != sys.byteorder):
+                    return None
+                index = cls(file_path, config_hash, header['stride'], directory)
+                for values in (index.offsets, index.numbers, index.epochs):
+                    values.fromfile(f, header['checkpoints'])
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            return None
+        index.delimited, index.count = header['delimited'], header['count']
+        index.inode, index.size, index.mtime_ns = header['inode'], header['size'], header['mtime_ns']
+        index.seek_points = [(out_offset, in_offset, None) for out_offset, in_offset in header['seek_points']]
+        index.copy_points = [(out_offset, in_offset, None) for out_offset, in_offset in header['copy_points']]
+        if index.copy_points:
+            try:
+                if os.path.getsize(index.copy_path()) != index.copy_points[-1][1]:
+                    index.copy_points = []
+            except OSError:
+                index.copy_points = []
+        return None if index.status() == 'stale' else index
+    
+    def save(self):
+        """Write the index to its directory; indexing is best effort where that cannot be written"""
+        if not self.directory:
+            return
+        header = {
+            'version': self.VERSION,
+            'path': os.path.abspath(self.file_path),
+            'config_hash': self.config_hash,
+            'stride': self.stride,
+            'delimited': self.delimited,
+            'count': self.count,
+            'inode': self.inode,
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'byteorder': sys.byteorder,
+            'checkpoints': len(self.offsets),
+            # Decompressor copies cannot be saved; member starts need none
+            'seek_points': [point[:2] for point in self.seek_points if point[2] is None],
+            'copy_points': [point[:2] for point in self.copy_points if point[2] is None],
+        }
+        index_path = self._path(self.directory, self.file_path, self.SUFFIX)
+        temp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                for values in (self.offsets, self.numbers, self.epochs):
+                    values.tofile(f)
+            os.replace(temp_path, index_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def status(self) -> str:
+        """'current' if the file is unchanged since it was indexed, 'grown' if it
+        has only been appended to, else 'stale'"""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return 'stale'
+        if stat.st_ino != self.inode or stat.st_size < self.size:
+            return 'stale'
+        if stat.st_size == self.size:
+            return 'current' if stat.st_mtime_ns == self.mtime_ns else 'stale'
+        return 'grown'
+    
+    def checkpoint_for_number(self, number: int) -> int:
+        """Last checkpoint at or before a line/entry number"""
+        return max(bisect.bisect_right(self.numbers, number) - 1, 0)
+    
+    def checkpoint_for_epoch(self, epoch: int) -> int:
+        """Last checkpoint before the first one at or after an epoch"""
+        return max(bisect.bisect_left(self.epochs, epoch) - 1, 0)
+
+
+class TrigramIndex:
+    """Inverted index of the trigrams in the lowered raw text of loaded logs
+    
+    Entries are indexed in blocks of SEARCH_INDEX_BLOCK, each trigram mapping
+    to the blocks that hold it: a sorted array of block numbers while the
+    trigram is rare, and a bitmap of one bit per block once the array would
+    be larger, so no posting takes more than a bit per block. A search
+    intersects the blocks of the term's trigrams, rarest first, and checks
+    only their entries, plus the entries after the last full block, which
+    are not indexed yet. update() indexes the blocks filled since it last
+    ran, so the index follows entries appended to logs. Indexing holds lock,
+    which is also held while logs change, so update() can run on a worker
+    thread.
+    """
+    
+    # Three characters, read at offsets 0, 1 and 2 to find every trigram of a text
+    _TRIGRAM = re.compile('...', re.DOTALL)
+    
+    def __init__(self, logs: List[LogEntry]):
+        self.logs = logs
+        self.blocks = 0           # Full blocks indexed
+        self.ready = False        # Set once the first update() has caught up with logs
+        self.lock = threading.Lock()
+        self._arrays: Dict[str, array] = {}        # Sorted blocks of each rare trigram
+        self._bitmaps: Dict[str, bytearray] = {}   # Bit per block of each common trigram
+        self._bitmap_bytes = 0                     # Length of every bitmap
+    
+    def update(self) -> int:
+        """Index the blocks filled since the last update; returns how many"""
+        added = 0
+        while True:
+            with self.lock:
+                block = self.blocks
+                if (block + 1) * SEARCH_INDEX_BLOCK > len(self.logs):
+                    break
+                self._add(block)
+                self.blocks = block + 1
+            added += 1
+        self.ready = True
+        return added
+    
+    def truncate(self, size: int):
+        """Drop the blocks past the first size entries, once entries are removed from the end of logs
+        
+        Trigrams of the removed entries stay in the postings, where they only
+        add candidates that a search then rejects.
+        """
+        self.blocks = min(self.blocks, size // SEARCH_INDEX_BLOCK)
+    
+    def search(self, term: str) -> Optional[List[int]]:
+        """Rows of the entries whose lowered raw text contains the lowered term, in order
+        
+        Returns None when the index cannot narrow the search: for terms
+        shorter than a trigram, and for terms in so many blocks that scanning
+        the logs is as quick.
+        """
+        term = term.lower()
+        grams = self._trigrams(term)
+        if not grams:
+            return None
+        
+        with self.lock:
+            indexed = self.blocks
+            bitmaps = [self._bitmaps[gram] for gram in grams if gram in self._bitmaps]
+            arrays = sorted((self._arrays.get(gram, ()) for gram in grams if gram not in self._bitmaps), key=len)
+            if arrays:
+                blocks = arrays[0][:bisect.bisect_left(arrays[0], indexed)]
+                for posting in arrays[1:]:
+                    if not blocks:
+                        break
+                    if len(blocks) * 16 < len(posting):
+                        blocks = [block for block in blocks if _sorted_contains(posting, block)]
+                    else:
+                        wanted = set(blocks)
+                        blocks = [block for block in posting if block in wanted]
+                for bitmap in bitmaps:
+                    blocks = [block for block in blocks if bitmap[block >> 3] >> (block & 7) & 1]
+            else:
+                # Only common trigrams: intersect the bitmaps as integers
+                mask = (1 << indexed) - 1
+                for bitmap in bitmaps:
+                    mask &= int.from_bytes(bitmap, 'little')
+                if bin(mask).count('1') * 4 > indexed:
+                    return None
+                blocks = _set_bits(mask)
+            if len(blocks) * 4 > indexed:
+                return None
+            
+            text = self._text
+            rows = []
+            for block in blocks:
+                start = block * SEARCH_INDEX_BLOCK
+                texts = [text(row).lower() for row in range(start, start + SEARCH_INDEX_BLOCK)]
+                # Most blocks either miss the term or hold it once, so test the whole block first
+                if term in '\0'.join(texts):
+                    rows.extend(start + i for i, lowered in enumerate(texts) if term in lowered)
+            rows.extend(row for row in range(indexed * SEARCH_INDEX_BLOCK, len(self.logs))
+                        if term in text(row).lower())
+            return rows
+    
+    def _text(self, row: int) -> str:
+        """Raw text of a row of logs"""
+        if isinstance(self.logs, LogStore):
+            return self.logs.raw_text(row)
+        return self.logs[row].raw_text
+    
+    @classmethod
+    def _trigrams(cls, text: str) -> set:
+        """Distinct trigrams of a text"""
+        grams = set(cls._TRIGRAM.findall(text))
+        grams.update(cls._TRIGRAM.findall(text, 1))
+        grams.update(cls._TRIGRAM.findall(text, 2))
+        return grams
+    
+    def _add(self, block: int):
+        """Add the trigrams of one block to the postings"""
+        start = block * SEARCH_INDEX_BLOCK
+        # Rows are joined by a character no search term holds, so trigrams
+        # across rows only add candidates
+        text = '\0'.join(self._text(row) for row in range(start, start + SEARCH_INDEX_BLOCK)).lower()
+        arrays, bitmaps = self._arrays, self._bitmaps
+        byte, bit = block >> 3, 1 << (block & 7)
+        if byte >= self._bitmap_bytes:
+            self._bitmap_bytes = byte + 1
+            for bitmap in bitmaps.values():
+                bitmap.append(0)
+            if byte & (byte - 1) == 0:
+                self._compact()
+        for gram in self._trigrams(text):
+            bitmap = bitmaps.get(gram)
+            if bitmap is not None:
+                bitmap[byte] |= bit
+                continue
+            posting = arrays.get(gram)
+            if posting is None:
+                arrays[gram] = array('I', [block])
+            elif len(posting) * 32 > block:
+                # The array has outgrown a bitmap of the blocks so far
+                bitmap = bitmaps[gram] = bytearray(self._bitmap_bytes)
+                for old in arrays.pop(gram):
+                    bitmap[old >> 3] |= 1 << (old & 7)
+                bitmap[byte] |= bit
+            elif posting[-1] < block:
+                posting.append(block)
+            elif not _sorted_contains(posting, block):
+                # The block was dropped by truncate() and filled again
+                posting.insert(bisect.bisect_left(posting, block), block)
+    
+    def _compact(self):
+        """Turn the bitmaps of trigrams that have become rare back into arrays
+        
+        Runs each time the number of blocks doubles, so a trigram common only
+        in the first blocks does not keep a bit for every block that follows.
+        """
+        for gram, bitmap in list(self._bitmaps.items()):
+            mask = int.from_bytes(bitmap, 'little')
+            if bin(mask).count('1') * 64 < len(bitmap) * 8:
+                self._arrays[gram] = array('I', _set_bits(mask))
+                del self._bitmaps[gram]
+
+
+def _set_bits(mask: int) -> List[int]:
+    """Positions of the bits set in an integer, in order"""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+    positions = []
+    for match in re.finditer(b'[^\0]', data):
+        index = match.start()
+        value = data[index]
+        positions.extend(index * 8 + bit for bit in range(8) if value >> bit & 1)
+    return positions
+
+
+def _sorted_contains(values: Sequence, value: int) -> bool:
+    """Whether a sorted sequence holds a value"""
+    i = bisect.bisect_left(values, value)
+    return i < len(values) and values[i] == value
+
+
+# Translation tables turning a byte string of codes into the binary digits of
+# a bitmap, one per code
+_BITMAP_DIGITS = [bytes(b'1'[0] if byte == code else b'0'[0] for byte in range(256)) for code in range(256)]
+
+
+class RowBitmap:
+    """Set of row numbers, compressed roaring-style
+    
+    Rows are split into chunks of 2**BITMAP_CHUNK_BITS by their high bits,
+    and each chunk holding any row is one int whose set bits are the low
+    bits of its rows. Empty chunks take no space, and &, | and - combine
+    bitmaps chunk by chunk with integer operations.
+    """
+    
+    __slots__ = ('chunks',)
+    
+    def __init__(self, chunks: Optional[Dict[int, int]] = None):
+        self.chunks = chunks if chunks is not None else {}
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[int]) -> 'RowBitmap':
+        """Bitmap of some rows, in any order"""
+        chunk_bytes: Dict[int, bytearray] = {}
+        mask = (1 << BITMAP_CHUNK_BITS) - 1
+        for row in rows:
+            bits = chunk_bytes.get(row >> BITMAP_CHUNK_BITS)
+            if bits is None:
+                bits = chunk_bytes[row >> BITMAP_CHUNK_BITS] = bytearray(1 << (BITMAP_CHUNK_BITS - 3))
+            low = row & mask
+            bits[low >> 3] |= 1 << (low & 7)
+        return cls({chunk: int.from_bytes(bits, 'little') for chunk, bits in chunk_bytes.items()})
+    
+    @classmethod
+    def from_range(cls, start: int, stop: int) -> 'RowBitmap':
+        """Bitmap of the rows from start up to stop"""
+        chunks = {}
+        chunk_rows = 1 << BITMAP_CHUNK_BITS
+        while start < stop:
+            chunk = start >> BITMAP_CHUNK_BITS
+            low = start - (chunk << BITMAP_CHUNK_BITS)
+            high = min(stop - (chunk << BITMAP_CHUNK_BITS), chunk_rows)
+            chunks[chunk] = ((1 << (high - low)) - 1) << low
+            start = (chunk + 1) << BITMAP_CHUNK_BITS
+        return cls(chunks)
+    
+    def __and__(self, other: 'RowBitmap') -> 'RowBitmap':
+        small, large = sorted((self.chunks, other.chunks), key=len)
+        chunks = {}
+        for chunk, bits in small.items():
+            bits &= large.get(chunk, 0)
+            if bits:
+                chunks[chunk] = bits
+        return RowBitmap(chunks)
+    
+    def __or__(self, other: 'RowBitmap') -> 'RowBitmap':
+        chunks = dict(self.chunks)
+        for chunk, bits in other.chunks.items():
+            chunks[chunk] = chunks.get(chunk, 0) | bits
+        return RowBitmap(chunks)
+    
+    def __sub__(self, other: 'RowBitmap') -> 'RowBitmap':
+        chunks = {}
+        for chunk, bits in self.chunks.items():
+            bits &= ~other.chunks.get(chunk, 0)
+            if bits:
+                chunks[chunk] = bits
+        return RowBitmap(chunks)
+    
+    def invert(self, size: int) -> 'RowBitmap':
+        """The rows below size that are not in the bitmap"""
+        chunk_rows = 1 << BITMAP_CHUNK_BITS
+        full = (1 << chunk_rows) - 1
+        chunks = {}
+        for chunk in range((size + chunk_rows - 1) >> BITMAP_CHUNK_BITS):
+            bits = ~self.chunks.get(chunk, 0) & full
+            rows = size - (chunk << BITMAP_CHUNK_BITS)
+            if rows < chunk_rows:
+                bits &= (1 << rows) - 1
+            if bits:
+                chunks[chunk] = bits
+        return RowBitmap(chunks)
+    
+    def __len__(self) -> int:
+        return sum(bin(bits).count('1') for bits in self.chunks.values())
+    
+    def __iter__(self) -> Iterator[int]:
+        """Rows in ascending order"""
+        for chunk in sorted(self.chunks):
+            base = chunk << BITMAP_CHUNK_BITS
+            digits = bin(self.chunks[chunk])[:1:-1]  # Lowest bit first
+            i = digits.find('1')
+            while i >= 0:
+                yield base + i
+                i = digits.find('1', i + 1)
+
+
+class BitmapIndex:
+    """A RowBitmap per distinct value of a string category of loaded logs
+    
+    Each entry's value is kept as a one-byte code: the LogStore's dictionary
+    code, or in a list the position of the shared value object the parser
+    gave it. update() codes the entries appended since it last ran and
+    rebuilds the bitmaps of the chunks they fall in. A category with more
+    than BITMAP_INDEX_MAX_VALUES distinct values is not indexed; usable is
+    then False.
+    """
+    
+    def __init__(self, logs: List[LogEntry], name: str):
+        self.logs = logs
+        self.name = name
+        self.usable = True
+        self.codes = array('B')
+        self.values: List[Any] = []
+        self.bitmaps: List[RowBitmap] = []
+        self._value_codes: Dict[int, int] = {}  # id(value) -> code, in a list; values holds the objects
+    
+    def update(self):
+        """Code the entries appended since the last update and rebuild the chunks they fall in"""
+        start, stop = len(self.codes), len(self.logs)
+        if not self.usable or start >= stop:
+            return
+        if isinstance(self.logs, LogStore):
+            self._code_store(start, stop)
+        else:
+            self._code_list(start, stop)
+        if self.usable:
+            self._rebuild(start >> BITMAP_CHUNK_BITS)
+    
+    def truncate(self, size: int):
+        """Drop the entries past the first size, once they are removed from the end of logs"""
+        if size < len(self.codes):
+            del self.codes[size:]
+            self._rebuild(size >> BITMAP_CHUNK_BITS)
+    
+    def rows(self, matches: Callable[[Any], bool]) -> RowBitmap:
+        """Rows whose value satisfies matches, which is called once per distinct value
+        
+        The side with fewer values is combined, so 'not equals' ORs the
+        bitmap of the one excluded value and inverts it.
+        """
+        matched = [bool(matches(value)) for value in self.values]
+        inside = sum(matched) * 2 <= len(matched)
+        combined = RowBitmap()
+        for bitmap, match in zip(self.bitmaps, matched):
+            if match == inside:
+                combined = combined | bitmap
+        return combined if inside else combined.invert(len(self.codes))
+    
+    def _code_store(self, start: int, stop: int):
+        """Copy the codes of a dictionary-encoded LogStore column"""
+        column = self.logs.column(self.name)
+        if column is None or len(column[1]) > BITMAP_INDEX_MAX_VALUES + 1:  # With the code 0 placeholder
+            self.usable = False
+            return
+        codes, values = column
+        self.codes.extend(array('B', codes[start:stop]))
+        self.values = [None] + values[1:]  # Code 0 marks entries without the field
+    
+    def _code_list(self, start: int, stop: int):
+        """Code entries by the identity of their shared field values"""
+        logs, name = self.logs, self.name
+        value_codes, values, codes = self._value_codes, self.values, self.codes
+        for row in range(start, stop):
+            value = logs[row].get_field(name)
+            code = value_codes.get(id(value))
+            if code is None:
+                if len(values) >= BITMAP_INDEX_MAX_VALUES:
+                    self.usable = False
+                    return
+                code = value_codes[id(value)] = len(values)
+                values.append(value)
+            codes.append(code)
+    
+    def _rebuild(self, first_chunk: int):
+        """Rebuild the bitmaps of every chunk from first_chunk on"""
+        bitmaps = self.bitmaps
+        while len(bitmaps) < len(self.values):
+            bitmaps.append(RowBitmap())
+        for bitmap in bitmaps:
+            for chunk in [chunk for chunk in bitmap.chunks if chunk >= first_chunk]:
+                del bitmap.chunks[chunk]
+        
+        size = 1 << BITMAP_CHUNK_BITS
+        for chunk in range(first_chunk, (len(self.codes) + size - 1) >> BITMAP_CHUNK_BITS):
+            data = self.codes[chunk * size:(chunk + 1) * size].tobytes()
+            for code in set(data):
+                # Reversed so that the first row is the lowest binary digit
+                bitmaps[code].chunks[chunk] = int(data.translate(_BITMAP_DIGITS[code])[::-1], 2)
+
+
+class NumberIndex:
+    """The numbers of a number category of loaded logs, sorted, with their rows
+    
+    Range queries bisect the sorted values and take a slice of the rows, so
+    they cost O(log n + k). Entries appended since the last sort are kept in
+    a tail that queries scan, and merged into the sorted values once it
+    outgrows NUMBER_INDEX_TAIL_FRACTION of them. Entries without a number
+    are left out; NaN is kept aside, since it is outside every range.
+    """
+    
+    def __init__(self, logs: List[LogEntry], name: str):
+        self.logs = logs
+        self.name = name
+        self.values = array('d')
+        self.rows = array('I')
+        self.coded = 0            # Entries looked at, indexed or not
+        self._merged = 0          # Entries whose numbers are in values
+        self._tail_values = array('d')
+        self._tail_rows = array('I')
+        self._nan_rows = array('I')
+    
+    def update(self):
+        """Add the numbers of the entries appended since the last update"""
+        start, stop = self.coded, len(self.logs)
+        if start >= stop:
+            return
+        for row, number in self._numbers(start, stop):
+            if number != number:
+                self._nan_rows.append(row)
+            else:
+                self._tail_values.append(number)
+                self._tail_rows.append(row)
+        self.coded = stop
+        if len(self._tail_rows) * NUMBER_INDEX_TAIL_FRACTION > len(self.rows):
+            self._merge()
+    
+    def truncate(self, size: int):
+        """Drop the entries past the first size, once they are removed from the end of logs"""
+        if size >= self.coded:
+            return
+        self.coded = size
+        self._tail_values, self._tail_rows = _rows_below(size, self._tail_values, self._tail_rows)
+        self._nan_rows = _rows_below(size, self._nan_rows)[0]
+        if size < self._merged:
+            self.values, self.rows = _rows_below(size, self.values, self.rows)
+            self._merged = size
+    
+    def range_rows(self, low: float, high: float, low_open: bool, high_open: bool, inside: bool) -> RowBitmap:
+        """Rows whose number is inside the range from low to high, or outside it if inside is False
+        
+        low_open and high_open exclude the bounds themselves.
+        """
+        values, rows = self.values, self.rows
+        start = (bisect.bisect_right if low_open else bisect.bisect_left)(values, low)
+        stop = (bisect.bisect_left if high_open else bisect.bisect_right)(values, high)
+        if inside:
+            found = [rows[start:max(start, stop)]]
+        else:
+            found = [rows[:start], rows[max(start, stop):], self._nan_rows]
+        found.append([row for number, row in zip(self._tail_values, self._tail_rows)
+                      if ((low < number if low_open else low <= number) and
+                          (number < high if high_open else number <= high)) == inside])
+        return RowBitmap.from_rows(itertools.chain.from_iterable(found))
+    
+    def _numbers(self, start: int, stop: int) -> Iterator[Tuple[int, float]]:
+        """(row, number) of the entries from start to stop that have a number"""
+        column = self.logs.number_column(self.name) if isinstance(self.logs, LogStore) else None
+        if column is not None:
+            numbers, kinds = column
+            for row in range(start, stop):
+                kind = kinds[row]
+                if kind == _NUMBER_INT or kind == _NUMBER_FLOAT:
+                    yield row, numbers[row]
+                elif kind == _NUMBER_REPARSE:
+                    yield from self._number_of(row)
+            return
+        for row in range(start, stop):
+            yield from self._number_of(row)
+    
+    def _number_of(self, row: int) -> Iterator[Tuple[int, float]]:
+        """(row, number) of one entry, if its value converts to a number"""
+        value = self.logs[row].get_field(self.name)
+        if value is not None:
+            try:
+                yield row, float(value)
+            except (ValueError, TypeError, OverflowError):
+                pass
+    
+    def _merge(self):
+        """Sort the tail into the values; Timsort finds the sorted run and only sorts the tail"""
+        values = self.values + self._tail_values
+        rows = self.rows + self._tail_rows
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self.values = array('d', [values[i] for i in order])
+        self.rows = array('I', [rows[i] for i in order])
+        self._tail_values, self._tail_rows = array('d'), array('I')
+        self._merged = self.coded
+
+
+def _rows_below(size: int, *columns: array) -> List[array]:
+    """Columns kept where the last column, a row number, is below size"""
+    keep = [i for i, row in enumerate(columns[-1]) if row < size]
+    return [array(column.typecode, [column[i] for i in keep]) for column in columns]
+
+
+class TimeIndex:
+    """Time order of a datetime category of loaded logs, for files that are mostly in time order
+    
+    An entry is in order when its epoch is at least every earlier epoch.
+    For each block of TIME_INDEX_BLOCK entries the index keeps the latest
+    epoch before it and after it, so both sequences are sorted: a range
+    query bisects them, takes the in-order entries of the blocks inside the
+    range whole, and checks only the blocks at its ends. Entries out of
+    order are kept sorted by epoch on the side and bisected too. Entries
+    whose field did not parse as a time are listed for the caller to test.
+    """
+    
+    def __init__(self, logs: List[LogEntry], name: str):
+        self.logs = logs
+        self.name = name
+        self.coded = 0                     # Entries looked at
+        self.in_order = bytearray()        # 1 for each entry in order
+        self.unparsed_rows = array('I')    # Entries with the field but no epoch
+        self._floors = array('q')          # Latest epoch before each block
+        self._ceilings = array('q')        # Latest epoch up to the end of each block
+        self._latest = _NO_EPOCH
+        self._irregular = array('I')       # Entries not in order, in row order
+        self._irregular_bitmap: Optional[RowBitmap] = None
+        self._other_epochs = array('q')    # Epochs of entries out of order, sorted
+        self._other_rows = array('I')
+    
+    def update(self):
+        """Add the entries appended since the last update"""
+        start, stop = self.coded, len(self.logs)
+        if start >= stop:
+            return
+        epoch_of = self._epoch_getter()
+        for row in range(start, stop):
+            if row % TIME_INDEX_BLOCK == 0:
+                self._floors.append(self._latest)
+                self._ceilings.append(self._latest)
+            epoch = epoch_of(row)
+            if epoch is not None and epoch >= self._latest:
+                self._latest = self._ceilings[-1] = epoch
+                self.in_order.append(1)
+                continue
+            self.in_order.append(0)
+            self._irregular.append(row)
+            if epoch is None:
+                if self.logs[row].get_field(self.name) is not None:
+                    self.unparsed_rows.append(row)
+            else:
+                i = bisect.bisect_right(self._other_epochs, epoch)
+                self._other_epochs.insert(i, epoch)
+                self._other_rows.insert(i, row)
+        self.coded = stop
+        self._irregular_bitmap = None
+    
+    def truncate(self, size: int):
+        """Drop the entries past the first size, once they are removed from the end of logs
+        
+        The index goes back to the start of the block holding entry size,
+        and the next update() codes that block again.
+        """
+        if size >= self.coded:
+            return
+        block = size // TIME_INDEX_BLOCK
+        start = block * TIME_INDEX_BLOCK
+        self._latest = self._floors[block]
+        del self._floors[block:]
+        del self._ceilings[block:]
+        del self.in_order[start:]
+        self.unparsed_rows = _rows_below(start, self.unparsed_rows)[0]
+        self._irregular = _rows_below(start, self._irregular)[0]
+        self._other_epochs, self._other_rows = _rows_below(start, self._other_epochs, self._other_rows)
+        self._irregular_bitmap = None
+        self.coded = start
+    
+    def range_rows(self, low: float, high: float, low_open: bool, high_open: bool, inside: bool) -> RowBitmap:
+        """Rows whose epoch is inside the range from low to high, or outside it if inside is False
+        
+        low_open and high_open exclude the bounds themselves. Entries in
+        unparsed_rows are never included.
+        """
+        if inside:
+            return self._span(low, high, low_open, high_open)
+        return self._span(-math.inf, low, False, not low_open) | self._span(high, math.inf, not high_open, False)
+    
+    def first_row(self, epoch: int) -> int:
+        """Row of the first in-order entry at or after an epoch, len(logs) if there is none"""
+        epoch_of = self._epoch_getter()
+        block = bisect.bisect_left(self._ceilings, epoch)
+        for row in range(block * TIME_INDEX_BLOCK, min((block + 1) * TIME_INDEX_BLOCK, self.coded)):
+            if self.in_order[row] and epoch_of(row) >= epoch:
+                return row
+        return len(self.logs)
+    
+    def _span(self, low: float, high: float, low_open: bool, high_open: bool) -> RowBitmap:
+        """Rows whose epoch is within a range"""
+        def within(epoch):
+            return ((low < epoch if low_open else low <= epoch) and
+                    (epoch < high if high_open else epoch <= high))
+        
+        # Blocks with an in-order entry in range lie from first to last, and
+        # every in-order entry of the blocks between those is in range
+        first = (bisect.bisect_right if low_open else bisect.bisect_left)(self._ceilings, low)
+        last = (bisect.bisect_left if high_open else bisect.bisect_right)(self._floors, high) - 1
+        rows = RowBitmap()
+        if first < last - 1:
+            if self._irregular_bitmap is None:
+                self._irregular_bitmap = RowBitmap.from_rows(self._irregular)
+            rows = RowBitmap.from_range((first + 1) * TIME_INDEX_BLOCK, last * TIME_INDEX_BLOCK) - self._irregular_bitmap
+        
+        epoch_of = self._epoch_getter()
+        found = []
+        for block in ({first, last} if first <= last else ()):
+            block_rows = range(block * TIME_INDEX_BLOCK, min((block + 1) * TIME_INDEX_BLOCK, self.coded))
+            found.extend(row for row in block_rows if self.in_order[row] and within(epoch_of(row)))
+        
+        epochs = self._other_epochs
+        start = (bisect.bisect_right if low_open else bisect.bisect_left)(epochs, low)
+        stop = (bisect.bisect_left if high_open else bisect.bisect_right)(epochs, high)
+        found.extend(self._other_rows[start:max(start, stop)])
+        return rows | RowBitmap.from_rows(found)
+    
+    def _epoch_getter(self) -> Callable[[int], Optional[int]]:
+        """Function from a row to its epoch, None if it has none"""
+        column = self.logs.epoch_column(self.name) if isinstance(self.logs, LogStore) else None
+        if column is None:
+            logs, name = self.logs, self.name
+            return lambda row: logs[row].get_epoch(name)
+        return lambda row: None if column[row] == _NO_EPOCH else column[row]
+
+
+class ColumnIndex:
+    """Row indexes of the categories of loaded logs
+    
+    String categories get a BitmapIndex, number categories a NumberIndex and
+    datetime categories a TimeIndex on first use. Indexes are brought up to date with entries appended to
+    logs whenever they are queried; entries removed from the end must be
+    reported through truncate().
+    """
+    
+    def __init__(self, logs: List[LogEntry], field_types: Dict[str, FieldType]):
+        self.logs = logs
+        self.field_types = field_types
+        self._bitmaps: Dict[str, BitmapIndex] = {}
+        self._numbers: Dict[str, NumberIndex] = {}
+        self._times: Dict[str, TimeIndex] = {}
+    
+    def string_rows(self, name: str, matches: Callable[[Any], bool]) -> Optional[RowBitmap]:
+        """Rows whose value of a string category satisfies matches, None if it is not indexed"""
+        if self.field_types.get(name) != FieldType.STRING:
+            return None
+        index = self._bitmaps.get(name)
+        if index is None:
+            index = self._bitmaps[name] = BitmapIndex(self.logs, name)
+        index.update()
+        return index.rows(matches) if index.usable else None
+    
+    def number_rows(self, name: str, low: float, high: float, low_open: bool, high_open: bool,
+                    inside: bool) -> Optional[RowBitmap]:
+        """Rows whose number is inside (or outside) a range (see NumberIndex.range_rows), None
+        if name is not a number category"""
+        if self.field_types.get(name) != FieldType.NUMBER:
+            return None
+        index = self._numbers.get(name)
+        if index is None:
+            index = self._numbers[name] = NumberIndex(self.logs, name)
+        index.update()
+        return index.range_rows(low, high, low_open, high_open, inside)
+    
+    def time_rows(self, name: str, low: float, high: float, low_open: bool, high_open: bool, inside: bool,
+                  fallback: Callable[[LogEntry], bool]) -> Optional[RowBitmap]:
+        """Rows whose epoch is inside (or outside) a range (see TimeIndex.range_rows), None if
+        name is not a datetime category
         
+        Entries whose field did not parse as a time are kept if they pass fallback.
+        """
+        index = self.time_index(name)
+        if index is None:
+            return None
+        rows = index.range_rows(low, high, low_open, high_open, inside)
+        unparsed = [row for row in index.unparsed_rows if fallback(self.logs[row])]
+        return rows | RowBitmap.from_rows(unparsed) if unparsed else rows
+    
+    def time_index(self, name: str) -> Optional[TimeIndex]:
+        """The time index of a datetime category, caught up with appended entries"""
+        if self.field_types.get(name) != FieldType.DATETIME:
+            return None
+        index = self._times.get(name)
+        if index is None:
+            index = self._times[name] = TimeIndex(self.logs, name)
+        index.update()
+        return index
+    
+    def truncate(self, size: int):
+        """Drop the entries past the first size, once they are removed from the end of logs"""
+        for index in (*self._bitmaps.values(), *self._numbers.values(), *self._times.values()):
+            index.truncate(size)
+
+
+@dataclass
+class FieldFilter:
+    """A filter on one category, with its values as the user typed them"""
+    category: str
+    operator: str
+    value: str
+    value2: str = ""         # Upper bound of 'between' and 'not between'
+    
+    @classmethod
+    def from_spec(cls, spec: str) -> 'FieldFilter':
+        """Parse 'Category:operator:value', with 'low..high' as the value of a range"""
+        category, operator, value = spec.split(':', 2)
+        value, _, value2 = value.partition('..')
+        return cls(category, operator, value, value2)
+
+
+class FilterEngine:
+    """Compiles the field filters, display filter and search term into one predicate
+    
+    Each operator is resolved and each value lowered, split or converted when
+    the predicate is built, not per entry; string filters test every distinct
+    field value once. The tests of a predicate run cheapest first (numbers
+    and times, then strings, then scans of the raw text), and an entry is
+    dropped at the first test it fails, so filtering is a single pass.
+    
+    The engine remembers its last query on a list of logs. A query that can
+    only keep entries the last one kept (a longer search term, a narrower
+    range, an extra filter) is evaluated over the last result, plus any
+    entries appended since, rather than over all the logs.
+    """
+    
+    STRING_OPERATORS = ["contains", "equals", "not contains", "not equals", "starts with", "ends with",
+                        "contains any", "contains all", "has key", "key equals"]
+    NUMBER_OPERATORS = ["equals", "not equals", "greater than", "less than", "between", "not between"]
+    DATETIME_OPERATORS = ["contains", "equals", "not contains", "before", "after", "between", "not between"]
+    DISPLAY_MODES = ["Show All", "Only JSON/XML", "Hide JSON/XML"]
+    
+    # Order in which the tests of a predicate run
+    _COSTS = {FieldType.NUMBER: 0, FieldType.DATETIME: 1, FieldType.STRING: 2, 'display': 3, 'search': 4}
+    
+    def __init__(self, config_manager: ConfigManager):
+        self.field_types = {category.name: category.get_field_type() for category in config_manager.categories}
+        # (logs, their length, active filters, display, lowered search term, result, its length) of
+        # the last query that dropped entries
+        self._previous: Optional[Tuple[Any, int, List[FieldFilter], str, str, List[LogEntry], int]] = None
+    
+    def forget(self):
+        """Forget the last query, once entries of its logs have been removed or replaced"""
+        self._previous = None
+    
+    @classmethod
+    def operators_for(cls, field_type: FieldType) -> List[str]:
+        """Operators offered for a field type, the default first"""
+        if field_type == FieldType.STRING:
+            return cls.STRING_OPERATORS
+        if field_type == FieldType.NUMBER:
+            return cls.NUMBER_OPERATORS
         if field_type == FieldType.DATETIME:
-            return self._parse_datetime(value)
-        elif field_type == FieldType.NUMBER:
-            return self._parse_number(value)
-        else:  # STRING or other types
-            # Check if value is contained within delimiters
-            return self._parse_container_value(value)
+            return cls.DATETIME_OPERATORS
+        return ["contains", "equals"]
     
-    def _parse_datetime(self, value: str) -> str:
-        """Parse datetime field (keep as string for MVP)"""
-        # For MVP, just return the string. 
-        # Could enhance with actual datetime parsing later
-        return value
+    def compile(self, filters: Iterable[FieldFilter] = (), display: str = "Show All",
+                search: str = "") -> Optional[Callable[[LogEntry], bool]]:
+        """A predicate that an entry passes when it passes every active filter
+        
+        Filters with no value, or on an unknown category, are inactive.
+        Returns None when nothing is active.
+        """
+        tests = self._tests(filters, display, search)
+        if not tests:
+            return None
+        if len(tests) == 1:
+            return tests[0][1]
+        tests = [test for _, test in tests]
+        
+        def passes(log: LogEntry) -> bool:
+            for test in tests:
+                if not test(log):
+                    return False
+            return True
+        return passes
     
-    def _parse_number(self, value: str) -> Optional[float]:
-        """Parse number field"""
-        try:
-            if '.' in value:
-                return float(value)
-            return int(value)
-        except (ValueError, TypeError):
+    def apply(self, logs: List[LogEntry], filters: Iterable[FieldFilter] = (), display: str = "Show All",
+              search: str = "", search_index: Optional[TrigramIndex] = None,
+              column_index: Optional[ColumnIndex] = None) -> List[LogEntry]:
+        """The entries of logs that pass every active filter
+        
+        A refinement of the last query is evaluated over its result (see
+        the class docstring); otherwise see _filter().
+        """
+        filters = [field_filter for field_filter in filters if self._is_active(field_filter)]
+        candidates = self._refinement_candidates(logs, filters, display, search)
+        if candidates is None:
+            result = self._filter(logs, filters, display, search, search_index, column_index)
+        else:
+            predicate = self.compile(filters, display, search)
+            result = [log for log in candidates if predicate(log)] if predicate else list(candidates)
+        
+        if result is logs or len(result) == len(logs):
+            self._previous = None  # Nothing dropped, so a refinement would scan as much
+        else:
+            self._previous = (logs, len(logs), filters, display, search.strip().lower(), result, len(result))
+        return result
+    
+    def _filter(self, logs: List[LogEntry], filters: List[FieldFilter], display: str, search: str,
+                search_index: Optional[TrigramIndex], column_index: Optional[ColumnIndex]) -> List[LogEntry]:
+        """The entries of logs that pass every active filter, using the indexes given
+        
+        A column_index of logs resolves the string, number and datetime
+        range filters it indexes to row bitmaps, which are ANDed, and a search_index of logs narrows the
+        search to the rows it finds; only the remaining filters are tested
+        per entry. Otherwise, on a LogStore, one string filter first selects
+        rows by the dictionary codes of the matching values. With nothing
+        active a list is copied and a LogStore returned as is.
+        """
+        rows: Optional[RowBitmap] = None
+        if column_index is not None and column_index.logs is logs:
+            remaining = []
+            for field_filter in filters:
+                selected = self._indexed_rows(column_index, field_filter)
+                if selected is None:
+                    remaining.append(field_filter)
+                else:
+                    rows = selected if rows is None else rows & selected
+            filters = remaining
+        
+        term = search.strip()
+        found = None
+        if term and search_index is not None and search_index.logs is logs:
+            found = search_index.search(term)
+            if found is not None:
+                search = ""
+                if rows is not None:
+                    rows = rows & RowBitmap.from_rows(found)
+        
+        if rows is not None:
+            logs = [logs[row] for row in rows]
+        elif found is not None:
+            logs = [logs[row] for row in found]
+        elif isinstance(logs, LogStore):
+            for i, field_filter in enumerate(filters):
+                if self.field_types.get(field_filter.category) != FieldType.STRING:
+                    continue
+                matches = self._string_matcher(field_filter)
+                selected = logs.select(field_filter.category, matches) if matches else None
+                if selected is not None:
+                    logs = selected
+                    # A copy, as the caller keeps the list it passed in
+                    filters = filters[:i] + filters[i + 1:]
+                    break
+        
+        predicate = self.compile(filters, display, search)
+        if predicate is None:
+            return logs if isinstance(logs, LogStore) else list(logs)
+        return [log for log in logs if predicate(log)]
+    
+    def _refinement_candidates(self, logs: List[LogEntry], filters: List[FieldFilter], display: str,
+                               search: str) -> Optional[List[LogEntry]]:
+        """Entries a query can be evaluated over if it refines the last one, else None
+        
+        These are the last result and the entries appended to logs since.
+        """
+        if self._previous is None:
+            return None
+        previous_logs, previous_size, previous_filters, previous_display, previous_term, result, count = \
+            self._previous
+        if previous_logs is not logs or previous_size > len(logs):
+            return None
+        if display != previous_display and previous_display != "Show All":
+            return None
+        if previous_term not in search.strip().lower():
             return None
+        if not all(any(self._narrows(new, old) for new in filters) for old in previous_filters):
+            return None
+        
+        # The result may have had entries appended since, by a caller filtering new entries
+        candidates = result if len(result) == count else result[:count]
+        if len(logs) > previous_size:
+            candidates = candidates + list(logs[previous_size:])
+        return candidates
     
-    def _parse_container_value(self, value: str) -> Any:
-        """Parse value that may be contained within delimiters"""
-        if not value:
-            return value
+    def _is_active(self, field_filter: FieldFilter) -> bool:
+        """Whether a filter has a test, i.e. a value and a known category"""
+        return bool(self._tests([field_filter], "Show All", ""))
+    
+    def _narrows(self, new: FieldFilter, old: FieldFilter) -> bool:
+        """Whether every entry that passes new passes old"""
+        if new.category != old.category:
+            return False
+        if (new.operator, new.value.strip(), new.value2.strip()) == (old.operator, old.value.strip(),
+                                                                     old.value2.strip()):
+            return True
         
-        # Check if value is wrapped in container delimiters
-        container_start_list = self.delimiters.get('ContainerStartDelimiter', ['('])
-        container_end_list = self.delimiters.get('ContainerEndDelimiter', [')'])
-        
-        # Check each possible container delimiter
-        inner_value = None
-        for start_delim, end_delim in zip(
-            container_start_list if isinstance(container_start_list, list) else [container_start_list],
-            container_end_list if isinstance(container_end_list, list) else [container_end_list]
-        ):
-            if value.startswith(start_delim) and value.endswith(end_delim):
-                # Remove container delimiters
-                inner_value = value[len(start_delim):-len(end_delim)].strip()
-                break
+        field_type = self.field_types.get(old.category)
+        if field_type == FieldType.NUMBER:
+            return self._range_within(self._number_range(new), self._number_range(old))
+        if new.operator != old.operator:
+            return False
+        if field_type == FieldType.DATETIME:
+            if not self._range_within(self._datetime_range(new), self._datetime_range(old)):
+                return False
+            # Entries whose time did not parse compare as text, so the text bounds must narrow too;
+            # before and after ignore the second value
+            if new.operator == "before":
+                return new.value.strip() <= old.value.strip()
+            if new.operator == "after":
+                return new.value.strip() >= old.value.strip()
+            new_low, new_high = sorted((new.value.strip(), new.value2.strip() or new.value.strip()))
+            old_low, old_high = sorted((old.value.strip(), old.value2.strip() or old.value.strip()))
+            if new.operator == "between":
+                return old_low <= new_low and new_high <= old_high
+            return new_low <= old_low and old_high <= new_high
         
-        if inner_value is None:
-            # No matching container delimiters found, use original value
-            inner_value = value
+        new_value, old_value = new.value.strip().lower(), old.value.strip().lower()
+        if new.operator == "contains":
+            return old_value in new_value
+        if new.operator == "starts with":
+            return new_value.startswith(old_value)
+        if new.operator == "ends with":
+            return new_value.endswith(old_value)
+        return False
+    
+    @staticmethod
+    def _range_within(new: Optional[Tuple], old: Optional[Tuple]) -> bool:
+        """Whether every value a range from _number_range or _datetime_range keeps is kept by another"""
+        if new is None or old is None or new[4] != old[4]:
+            return False
         
-        # Try to parse as structured data (key-value pairs)
-        kv_sep_list = self.delimiters['keyValueSeparator']
-        kv_sep = kv_sep_list[0] if isinstance(kv_sep_list, list) and kv_sep_list else kv_sep_list
-        arr_sep_list = self.delimiters['arrayElementSeparator']
-        arr_sep = arr_sep_list[0] if isinstance(arr_sep_list, list) and arr_sep_list else arr_sep_list
+        def covers(outer, inner):
+            outer_low, outer_high, outer_low_open, outer_high_open = outer[:4]
+            inner_low, inner_high, inner_low_open, inner_high_open = inner[:4]
+            return ((outer_low < inner_low or (outer_low == inner_low and (inner_low_open or not outer_low_open))) and
+                    (inner_high < outer_high or (inner_high == outer_high and (inner_high_open or not outer_high_open))))
+        # A range keeping its inside must lie within the old one; one keeping
+        # its outside must exclude at least what the old one excludes
+        return covers(old, new) if new[4] else covers(new, old)
+    
+    def _indexed_rows(self, column_index: ColumnIndex, field_filter: FieldFilter) -> Optional[RowBitmap]:
+        """Rows of column_index.logs that pass a filter, None if it is inactive or not indexed"""
+        field_type = self.field_types.get(field_filter.category)
+        if field_type == FieldType.STRING:
+            matches = self._string_matcher(field_filter)
+            return column_index.string_rows(field_filter.category, matches) if matches else None
+        if field_type == FieldType.NUMBER:
+            number_range = self._number_range(field_filter)
+            return column_index.number_rows(field_filter.category, *number_range) if number_range else None
+        if field_type == FieldType.DATETIME:
+            time_range = self._datetime_range(field_filter)
+            if time_range is None:
+                return None
+            return column_index.time_rows(field_filter.category, *time_range,
+                                          fallback=self._datetime_test(field_filter))
+        return None
+    
+    def _tests(self, filters: Iterable[FieldFilter], display: str,
+               search: str) -> List[Tuple[Any, Callable[[LogEntry], bool]]]:
+        """(cost, test) of each active filter, cheapest first"""
+        tests = []
+        for field_filter in filters:
+            field_type = self.field_types.get(field_filter.category)
+            if field_type == FieldType.STRING:
+                test = self._string_test(field_filter)
+            elif field_type == FieldType.NUMBER:
+                test = self._number_test(field_filter)
+            elif field_type == FieldType.DATETIME:
+                test = self._datetime_test(field_filter)
+            else:
+                test = None
+            if test:
+                tests.append((self._COSTS[field_type], test))
         
-        if kv_sep in inner_value:
-            return self._parse_structured_data(inner_value)
-        # Try to parse as array (comma-separated)
-        elif arr_sep in inner_value:
-            return self._parse_array_data(inner_value)
-        # Return as string if no special structure detected
-        else:
-            return inner_value
+        if display == "Only JSON/XML":
+            tests.append((self._COSTS['display'], lambda log: _is_json_or_xml(log.raw_text)))
+        elif display == "Hide JSON/XML":
+            tests.append((self._COSTS['display'], lambda log: not _is_json_or_xml(log.raw_text)))
+        
+        term = search.strip().lower()
+        if term:
+            tests.append((self._COSTS['search'], lambda log: term in log.raw_text.lower()))
+        
+        tests.sort(key=lambda item: item[0])
+        return tests
     
-    def _parse_structured_data(self, value: str) -> Dict[str, str]:
-        """Parse structured data (key-value pairs)"""
-        result = {}
+    def _string_test(self, field_filter: FieldFilter) -> Optional[Callable[[LogEntry], bool]]:
+        """Test of a string filter, evaluated once per distinct field value"""
+        matches = self._string_matcher(field_filter)
+        if matches is None:
+            return None
+        name = field_filter.category
+        results = {}  # id(field value) -> (field value, matched); holding the value keeps its id unique
+        
+        def test(log: LogEntry) -> bool:
+            field_value = log.get_field(name)
+            result = results.get(id(field_value))
+            if result is None:
+                result = results[id(field_value)] = (field_value, matches(field_value))
+            return result[1]
+        return test
+    
+    @staticmethod
+    def _string_matcher(field_filter: FieldFilter) -> Optional[Callable[[Any], bool]]:
+        """Test of one string field value, or None if the filter has no value
         
+        Structured values (dict) match on their keys and key=value text,
+        arrays (list) on their elements and anything else on its lowered text.
+        """
+        value = field_filter.value.strip()
         if not value:
-            return result
+            return None
+        operator = field_filter.operator
+        lowered = value.lower()
+        items = [item.strip().lower() for item in value.split(',')]
+        key, _, expected = value.partition('=')
         
-        # Split by key-value pairs separator
-        kv_separator_list = self.delimiters['keyValuePairsSeparator']
-        kv_separator = kv_separator_list[0] if isinstance(kv_separator_list, list) and kv_separator_list else kv_separator_list
-        pairs = value.split(kv_separator)
+        def never(field_value):
+            return False
         
-        # Parse each key-value pair
-        kv_delim_list = self.delimiters['keyValueSeparator']
-        kv_delim = kv_delim_list[0] if isinstance(kv_delim_list, list) and kv_delim_list else kv_delim_list
-        for pair in pairs:
-            if kv_delim in pair:
-                key, val = pair.split(kv_delim, 1)
-                result[key.strip()] = val.strip()
+        dict_test = list_test = text_test = never
+        if operator == "has key":
+            dict_test = lambda field_value: value in field_value
+        elif operator == "key equals":
+            dict_test = lambda field_value: key in field_value and (not expected or str(field_value[key]) == expected)
+        elif operator in ("contains", "not contains"):
+            negate = operator == "not contains"
+            dict_test = lambda field_value: negate != (
+                lowered in ' '.join(f"{k}={v}" for k, v in field_value.items()).lower())
+            list_test = lambda field_value: negate != any(lowered in str(item).lower() for item in field_value)
+            text_test = lambda text: negate != (lowered in text)
+        elif operator in ("contains any", "contains all"):
+            combine = any if operator == "contains any" else all
+            
+            def list_test(field_value):
+                elements = [str(item).lower() for item in field_value]
+                return combine(any(search in element for element in elements) for search in items)
+            text_test = lambda text: combine(search in text for search in items)
+        elif operator == "equals":
+            text_test = lambda text: text == lowered
+        elif operator == "not equals":
+            text_test = lambda text: text != lowered
+        elif operator == "starts with":
+            text_test = lambda text: text.startswith(lowered)
+        elif operator == "ends with":
+            text_test = lambda text: text.endswith(lowered)
         
-        return result
+        def matches(field_value: Any) -> bool:
+            if field_value is None:
+                return False
+            if isinstance(field_value, dict):
+                return dict_test(field_value)
+            if isinstance(field_value, list):
+                return list_test(field_value)
+            return text_test(str(field_value).lower())
+        return matches
     
-    def _parse_array_data(self, value: str) -> List[str]:
-        """Parse array data (comma-separated values)"""
-        if not value:
-            return []
+    @staticmethod
+    def _number_range(field_filter: FieldFilter) -> Optional[Tuple[float, float, bool, bool, bool]]:
+        """(low, high, low_open, high_open, inside) of a number filter, None if it is inactive
+        
+        The filter keeps numbers inside the range from low to high when
+        inside is True and outside it otherwise; an open end excludes its
+        bound. A filter is inactive when its values are not numbers, which
+        includes "nan": no number compares with it, so a sorted index could
+        not agree with testing entries one by one.
+        """
+        if not field_filter.value.strip():
+            return None
+        try:
+            bound = float(field_filter.value)
+            bound2 = float(field_filter.value2) if field_filter.value2.strip() else None
+        except ValueError:
+            return None
+        if math.isnan(bound) or (bound2 is not None and math.isnan(bound2)):
+            return None
+        
+        operator = field_filter.operator
+        if operator in ("equals", "not equals"):
+            return bound, bound, False, False, operator == "equals"
+        if operator == "greater than":
+            return bound, math.inf, True, False, True
+        if operator == "less than":
+            return -math.inf, bound, False, True, True
+        if operator in ("between", "not between") and bound2 is not None:
+            return min(bound, bound2), max(bound, bound2), False, False, operator == "between"
+        return math.inf, -math.inf, False, False, True  # Matches nothing
+    
+    @classmethod
+    def _number_test(cls, field_filter: FieldFilter) -> Optional[Callable[[LogEntry], bool]]:
+        """Test of a number filter (see _number_range)"""
+        number_range = cls._number_range(field_filter)
+        if number_range is None:
+            return None
+        low, high, low_open, high_open, inside = number_range
+        name = field_filter.category
+        
+        def test(log: LogEntry) -> bool:
+            field_value = log.get_field(name)
+            if field_value is None:
+                return False
+            try:
+                number = float(field_value)
+            except (ValueError, TypeError, OverflowError):
+                return False
+            return ((low < number if low_open else low <= number) and
+                    (number < high if high_open else number <= high)) == inside
+        return test
+    
+    @staticmethod
+    def _datetime_range(field_filter: FieldFilter) -> Optional[Tuple[float, float, bool, bool, bool]]:
+        """(low, high, low_open, high_open, inside) in epochs of a datetime range filter (see
+        _number_range), None unless the operator is a range and its bounds parse as timestamps"""
+        value1, value2 = field_filter.value.strip(), field_filter.value2.strip()
+        operator = field_filter.operator
+        if not value1 or operator not in ("before", "after", "between", "not between"):
+            return None
+        bound_parser = TimestampParser()
+        epoch1 = bound_parser.parse(value1)
+        if epoch1 is None:
+            return None
+        if operator == "before":
+            return -math.inf, epoch1, False, True, True
+        if operator == "after":
+            return epoch1, math.inf, True, False, True
+        epoch2 = bound_parser.parse(value2) if value2 else None
+        if epoch2 is None:
+            return None
+        return min(epoch1, epoch2), max(epoch1, epoch2), False, False, operator == "between"
+    
+    @staticmethod
+    def _datetime_test(field_filter: FieldFilter) -> Optional[Callable[[LogEntry], bool]]:
+        """Test of a datetime filter
+        
+        Range operators compare epochs when both the bound and the entry's time
+        parse as timestamps, and the text otherwise; the other operators
+        compare the lowered text.
+        """
+        value1, value2 = field_filter.value.strip(), field_filter.value2.strip()
+        if not value1:
+            return None
+        operator = field_filter.operator
+        name = field_filter.category
+        
+        bound_parser = TimestampParser()
+        epoch1 = bound_parser.parse(value1)
+        epoch2 = bound_parser.parse(value2) if value2 else None
+        if operator in ("between", "not between") and epoch2 is None:
+            epoch1 = None
+        
+        epoch_compare = text_compare = None
+        if operator in ("before", "after", "between", "not between"):
+            if operator == "before":
+                epoch_compare = lambda epoch: epoch < epoch1
+                text_compare = lambda text: text < value1
+            elif operator == "after":
+                epoch_compare = lambda epoch: epoch > epoch1
+                text_compare = lambda text: text > value1
+            else:
+                inside = operator == "between"
+                if epoch1 is not None:
+                    low, high = min(epoch1, epoch2), max(epoch1, epoch2)
+                    epoch_compare = lambda epoch: (low <= epoch <= high) == inside
+                if value2:
+                    text_low, text_high = min(value1, value2), max(value1, value2)
+                    text_compare = lambda text: (text_low <= text <= text_high) == inside
+            if epoch1 is None:
+                epoch_compare = None
+        else:
+            lowered = value1.lower()
+            if operator == "contains":
+                text_compare = lambda text: lowered in text.lower()
+            elif operator == "equals":
+                text_compare = lambda text: text.lower() == lowered
+            elif operator == "not contains":
+                text_compare = lambda text: lowered not in text.lower()
         
-        separator_list = self.delimiters['arrayElementSeparator']
-        separator = separator_list[0] if isinstance(separator_list, list) and separator_list else separator_list
-        return [item.strip() for item in value.split(separator) if item.strip()]
+        def test(log: LogEntry) -> bool:
+            field_value = log.get_field(name)
+            if field_value is None:
+                return False
+            if epoch_compare is not None:
+                epoch = log.get_epoch(name)
+                if epoch is not None:
+                    return epoch_compare(epoch)
+            return text_compare is not None and text_compare(str(field_value))
+        return test
+
+
+def _is_json_or_xml(text: str) -> bool:
+    """Whether raw text looks like it holds JSON or XML (see FilterEngine display modes)"""
+    return '{' in text or '[' in text or ('<' in text and '>' in text)
 
 
 class LogViewer:
@@ -421,16 +3845,610 @@ class LogViewer:
         self.parser = LogParser(self.config_manager)
         self.logs: List[LogEntry] = []
         self.filtered_logs: List[LogEntry] = []
+        self.file_path: Optional[str] = None
+        self.checkpoint: Optional[FileCheckpoint] = None
+        self.indexes: Dict[str, LogIndex] = {}
+        self.filter_engine = FilterEngine(self.config_manager)
+        # Trigram index of the loaded logs' raw text, when 'SearchIndex' is on
+        self.search_index: Optional[TrigramIndex] = None
+        # Per-category row indexes of the loaded logs, built as filters use them
+        self.column_index: Optional[ColumnIndex] = None
+        # Segments of the loaded rotation set not loaded yet, oldest first
+        self.older_segments: List[str] = []
+        # The active filters as (filters, display, search) of apply_filters(), or as
+        # (field name, value, operator) of filter_by_field(); entries loaded or
+        # appended later are filtered with them. None when nothing is filtered
+        self.filter_query: Optional[Tuple[List[FieldFilter], str, str]] = None
+        self.field_query: Optional[Tuple[str, Any, str]] = None
+        
+        self.parse_cache: Optional[ParseCache] = None
+        if self.config_manager.parse_cache_dir:
+            self.parse_cache = ParseCache(self.config_manager.parse_cache_dir,
+                                          self.config_manager.parse_cache_max_bytes)
+        self.config_hash = ParseCache.config_hash(self.config_manager.config)
+    
+    def set_config_manager(self, config_manager: ConfigManager):
+        """Use another configuration for the loaded logs
+        
+        The filter engine and column index know each category's type, so
+        they are rebuilt. Field filters are dropped, as their categories or
+        operators may no longer exist; the display filter and search stay.
+        """
+        self.config_manager = config_manager
+        self.filter_engine = FilterEngine(config_manager)
+        self.column_index = None
+        display, search = self.filter_query[1:] if self.filter_query else ("Show All", "")
+        self.apply_filters((), display, search)
+    
+    def load_file(self, file_path: str, workers: Optional[int] = None) -> int:
+        """Load and parse log file
+        
+        Large files are parsed in parallel when more than one worker is
+        configured ('ParseWorkers' in the config, overridden by workers).
+        With a parse cache ('ParseCacheDir'), an unchanged file is read from
+        the cache and a grown one from the cache plus its new tail.
+        """
+        self.parser.reset_values()
+        logs, checkpoint = self._read_file(file_path, workers)
+        self.logs = logs
+        self.filtered_logs = self._run_filter_query()
+        self.file_path = file_path
+        self.checkpoint = checkpoint
+        self.older_segments = []
+        return len(self.logs)
+    
+    def _read_file(self, file_path: str, workers: Optional[int] = None) -> Tuple[List[LogEntry], FileCheckpoint]:
+        """Parse a file, or take it from the parse cache, without loading it into the viewer"""
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Log file not found: {file_path}")
+        
+        cached = self._load_cached(file_path)
+        if cached:
+            return cached
+        
+        if workers is None:
+            workers = self.config_manager.parse_workers
+        checkpoint = FileCheckpoint()
+        if workers != 1 and os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+            logs = self._new_logs(self.parser.parse_file_parallel(file_path, workers, checkpoint))
+        else:
+            logs = self.parser.parse_file(file_path, checkpoint, into=self._new_logs())
+        self._store_cached(file_path, logs, checkpoint)
+        return logs, checkpoint
+    
+    def load_rotation_set(self, segments: List[str], since: Any = None) -> int:
+        """Load the newest segment of a rotation set, leaving the older ones for later
+        
+        segments are ordered oldest first (see rotation_set). The newest is
+        loaded and auto-refreshed like a single file; older segments are
+        parsed only when load_older() or load_older_until() asks for them,
+        or here when since (see load_older_until) reaches back past the
+        newest segment. Returns the number of entries loaded.
+        """
+        *older, newest = segments
+        count = self.load_file(newest)
+        self.older_segments = older
+        if since is not None:
+            count += self.load_older_until(since)
+        return count
+    
+    def iter_rotation_set(self, segments: List[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[LogEntry]:
+        """Stream the entries of a rotation set as one log, oldest segment first
+        
+        Each segment is opened only when the stream reaches it.
+        """
+        return itertools.chain.from_iterable(
+            self.parser.iter_entries(path, chunk_size) for path in segments if os.path.exists(path))
+    
+    def load_older(self) -> int:
+        """Load the next older segment of the rotation set in front of the loaded logs
+        
+        Returns the number of entries added, 0 when no older segment is left.
+        The loaded logs are extended in place, so the segment costs its own
+        entries rather than a copy of everything loaded; the indexes, whose
+        rows it shifts, are dropped. The active filters are run again.
+        """
+        if not self.older_segments:
+            return 0
+        entries, _ = self._read_file(self.older_segments[-1])
+        self.older_segments.pop()
+        with self._search_index_lock():
+            if isinstance(self.logs, LogStore):
+                self.logs.prepend(entries if isinstance(entries, LogStore) else self._new_logs(entries))
+            else:
+                self.logs[:0] = entries
+            self.search_index = None
+            self.column_index = None
+        self.filter_engine.forget()  # Its last result's rows have moved
+        self.filtered_logs = self._run_filter_query()
+        return len(entries)
+    
+    def load_older_until(self, when: Any) -> int:
+        """Load older segments until the loaded logs reach back to a time
+        
+        The time is a timestamp string or epoch microseconds. Returns the
+        number of entries added.
+        """
+        epoch = self._epoch_of(when)
+        count = 0
+        while not self.reaches_back_to(epoch):
+            count += self.load_older()
+        return count
+    
+    def reaches_back_to(self, when: Any) -> bool:
+        """Whether the loaded logs start at or before a time, or no older segment is left"""
+        if not self.older_segments:
+            return True
+        epoch = self._epoch_of(when)
+        first = next((log_epoch for log in self.logs for log_epoch in log.epochs.values()), None)
+        return first is not None and first <= epoch
+    
+    def _load_cached(self, file_path: str) -> Optional[Tuple[List[LogEntry], FileCheckpoint]]:
+        """Logs of a file from the parse cache, brought up to date with anything appended"""
+        if not self.parse_cache:
+            return None
+        cached = self.parse_cache.get(file_path, self.config_hash, self.parser)
+        if not cached:
+            return None
+        
+        entries, checkpoint = cached
+        logs = self._new_logs(entries)
+        update = self._poll(file_path, checkpoint)
+        if update is None:
+            return logs, checkpoint
+        
+        if update.reload:
+            logs = self._new_logs(update.entries)
+        else:
+            if update.retracted:
+                del logs[-update.retracted:]
+            logs.extend(update.entries)
+        self._store_cached(file_path, logs, update.checkpoint)
+        return logs, update.checkpoint
+    
+    def _store_cached(self, file_path: str, logs: List[LogEntry], checkpoint: FileCheckpoint):
+        """Save the parsed logs of a file in the parse cache, if there is one"""
+        if self.parse_cache:
+            self.parse_cache.put(file_path, self.config_hash, logs, checkpoint)
+    
+    def load_files(self, file_paths: Iterable[str], workers: Optional[int] = None,
+                   progress: Optional[Callable[[str, int, int, int], None]] = None,
+                   parsed_files: Optional[Dict[str, Tuple[List[LogEntry], FileCheckpoint]]] = None
+                   ) -> Dict[str, List[LogEntry]]:
+        """Parse several files concurrently with this viewer's configuration
+        
+        Files are parsed in a pool of worker processes ('ParseWorkers' in the
+        config, overridden by workers) that each build the parser once, not
+        once per file. As each file completes, progress is called with
+        (file_path, entry_count, files_done, files_total). Files already in
+        parsed_files (entries and checkpoint) are taken from it rather than
+        parsed again. Missing files are skipped. Returns the entries of each
+        file, in the order given.
+        """
+        paths = [path for path in file_paths if os.path.exists(path)]
+        if workers is None:
+            workers = self.config_manager.parse_workers
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        
+        results = {}
+        
+        def completed(path, entries):
+            results[path] = entries
+            if progress:
+                progress(path, len(entries), len(results), len(paths))
+        
+        def parsed(path, entries, checkpoint):
+            self._store_cached(path, entries, checkpoint)
+            completed(path, entries)
+        
+        for path in paths:
+            if parsed_files and path in parsed_files:
+                parsed(path, *parsed_files[path])
+                continue
+            cached = self._load_cached(path)
+            if cached:
+                completed(path, cached[0])
+        uncached = [path for path in paths if path not in results]
+        workers = min(workers, len(uncached))
+        
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            from concurrent.futures.process import BrokenProcessPool
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                         initargs=(self.config_manager.config,)) as executor:
+                    futures = {executor.submit(_parse_file_worker, path): path for path in uncached}
+                    for future in as_completed(futures):
+                        parsed(futures[future], *future.result())
+            except (OSError, BrokenProcessPool):
+                pass  # Parse whatever is left in-process
+        
+        for path in uncached:
+            if path not in results:
+                checkpoint = FileCheckpoint()
+                parsed(path, self.parser.parse_file(path, checkpoint), checkpoint)
+        
+        return {path: results[path] for path in paths}
+    
+    def iter_merged(self, file_paths: Iterable[str], window: int = MERGE_REORDER_WINDOW,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[LogEntry]:
+        """Stream the entries of several files merged by timestamp (see merge_entries)"""
+        paths = [path for path in file_paths if os.path.exists(path)]
+        parsers = self._stream_parsers(len(paths))
+        streams = [parser.iter_entries(path, chunk_size) for parser, path in zip(parsers, paths)]
+        return merge_entries(streams, window)
+    
+    def _stream_parsers(self, count: int) -> List[LogParser]:
+        """Parsers for count files that are read side by side
+        
+        Timestamp layouts and years are inferred per file and kept on the
+        parser, so interleaved streams each need their own; a single stream
+        uses the viewer's parser.
+        """
+        if count <= 1:
+            return [self.parser] * count
+        return [LogParser(self.config_manager) for _ in range(count)]
+    
+    def merge_files(self, file_paths: Iterable[str], workers: Optional[int] = None,
+                    progress: Optional[Callable[[str, int, int, int], None]] = None,
+                    first_screen: Optional[Callable[[List[LogEntry]], None]] = None) -> int:
+        """Load several files into one timestamp-ordered view
+        
+        Per-file streams are merged with merge_entries. With worker processes
+        or a parse cache (see load_files) the files are loaded first,
+        otherwise they are streamed and merged in one pass. If first_screen is given, the first
+        MERGE_FIRST_SCREEN merged entries are loaded into the viewer and passed
+        to it before the remaining entries have been parsed.
+        """
+        paths = [path for path in file_paths if os.path.exists(path)]
+        if workers is None:
+            workers = self.config_manager.parse_workers
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        self.parser.reset_values()
+        
+        if workers > 1 or self.parse_cache:
+            heads = {}
+            if first_screen:
+                self._show_merged(self._merged_head(paths, heads), first_screen)
+            merged = self._new_logs(merge_entries(self.load_files(paths, workers, progress, heads).values()))
+        else:
+            done = []
+            
+            def tracked(parser, path):
+                count = 0
+                for entry in parser.iter_entries(path):
+                    count += 1
+                    yield entry
+                done.append(path)
+                if progress:
+                    progress(path, count, len(done), len(paths))
+            
+            parsers = self._stream_parsers(len(paths))
+            stream = merge_entries([tracked(parser, path) for parser, path in zip(parsers, paths)])
+            merged = self._new_logs()
+            if first_screen:
+                head = list(itertools.islice(stream, MERGE_FIRST_SCREEN))
+                self._show_merged(head, first_screen)
+                merged.extend(head)
+            merged.extend(stream)
+        
+        self._set_merged(merged)
+        return len(merged)
+    
+    def _merged_head(self, paths: List[str],
+                     parsed_files: Dict[str, Tuple[List[LogEntry], FileCheckpoint]]) -> List[LogEntry]:
+        """First MERGE_FIRST_SCREEN merged entries, reading only the head of each file
+        
+        Files that were read to the end on the way are added to parsed_files so
+        that they are not parsed again. Every file is closed before returning.
+        """
+        def recorded(parser, path):
+            checkpoint = FileCheckpoint()
+            entries = []
+            for entry in parser.iter_entries(path, MERGE_HEAD_CHUNK_SIZE, checkpoint):
+                entries.append(entry)
+                yield entry
+            parsed_files[path] = (entries, checkpoint)
+        
+        parsers = self._stream_parsers(len(paths))
+        streams = [recorded(parser, path) for parser, path in zip(parsers, paths)]
+        head = merge_entries(streams)
+        try:
+            return list(itertools.islice(head, MERGE_FIRST_SCREEN))
+        finally:
+            head.close()
+            for stream in streams:
+                stream.close()
+    
+    def _show_merged(self, logs: List[LogEntry], first_screen: Callable[[List[LogEntry]], None]):
+        """Load a partial merged view and hand it to the first_screen callback"""
+        self._set_merged(logs)
+        first_screen(logs)
     
-    def load_file(self, file_path: str) -> int:
-        """Load and parse log file"""
+    def _set_merged(self, logs: List[LogEntry]):
+        """Replace the loaded logs with a merged view"""
+        self.logs = logs
+        self.filtered_logs = self._run_filter_query()
+        self.file_path = None
+        self.checkpoint = None
+        self.older_segments = []
+    
+    def open_index(self, file_path: str, stride: Optional[int] = None) -> LogIndex:
+        """Sidecar index of a file, brought up to date with anything appended
+        
+        A missing or stale index is built with the given stride ('IndexStride'
+        in the config by default) and saved in the index directory ('IndexDir').
+        Indexes are kept for the life of the viewer, along with their gzip seek
+        points.
+        """
+        if stride is None:
+            stride = self.config_manager.index_stride
+        directory = self.config_manager.index_dir
+        index = self.indexes.get(file_path) or LogIndex.load(file_path, self.config_hash, directory)
+        status = index.status() if index and index.stride == stride else 'stale'
+        if status != 'current':
+            if status == 'stale':
+                index = LogIndex(file_path, self.config_hash, stride, directory)
+            self.parser.index_file(file_path, index)
+            index.save()
+        self.indexes[file_path] = index
+        return index
+    
+    def load_page(self, file_path: str, position: int, count: int = INDEX_PAGE_SIZE) -> int:
+        """Load count entries of a file from an entry position, through its index
+        
+        Only the page is read and parsed, so this works on files far larger
+        than memory. The page replaces the loaded logs and is not
+        auto-refreshed.
+        """
         if not Path(file_path).exists():
             raise FileNotFoundError(f"Log file not found: {file_path}")
         
-        self.logs = self.parser.parse_file(file_path)
-        self.filtered_logs = self.logs.copy()
+        index = self.open_index(file_path)
+        self.parser.reset_values()
+        self.logs = self._new_logs(self.parser.iter_indexed_entries(index, max(position, 0), count))
+        self.filtered_logs = self._run_filter_query()
+        self.file_path = file_path
+        self.checkpoint = None
+        self.older_segments = []
         return len(self.logs)
     
+    def find_line(self, file_path: str, line_number: int) -> int:
+        """Entry position of the first entry at or after a line (entry number for delimited files)"""
+        index = self.open_index(file_path)
+        return self._seek_position(index, index.checkpoint_for_number(line_number),
+                                   lambda number, text: number >= line_number)
+    
+    def find_time(self, file_path: str, when: Any) -> int:
+        """Entry position of the first entry at or after a time
+        
+        The time is a timestamp string or epoch microseconds; the file is
+        assumed to be written in time order.
+        """
+        epoch = self._epoch_of(when)
+        
+        def reached(number: int, text: str) -> bool:
+            entry_epoch = self.parser._record_epoch(text)
+            return entry_epoch is not None and entry_epoch >= epoch
+        
+        index = self.open_index(file_path)
+        return self._seek_position(index, index.checkpoint_for_epoch(epoch), reached)
+    
+    def find_loaded_time(self, when: Any) -> int:
+        """Position in the filtered logs of the first entry at or after a time
+        
+        Times are those of the first datetime category, and the logs are
+        assumed to be mostly in time order. Unfiltered logs are searched
+        through the time index and filtered ones bisected, so either takes
+        O(log n). Returns len(filtered_logs) if every entry is earlier.
+        """
+        epoch = self._epoch_of(when)
+        name = next(iter(self.parser.timestamp_parsers), None)
+        if name is None:
+            raise ValueError("No datetime category is configured")
+        if len(self.filtered_logs) == len(self.logs):
+            return self.prepare_column_index().time_index(name).first_row(epoch)
+        
+        low, high = 0, len(self.filtered_logs)
+        while low < high:
+            middle = (low + high) // 2
+            middle_epoch = self.filtered_logs[middle].get_epoch(name)
+            if middle_epoch is None or middle_epoch < epoch:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    @staticmethod
+    def _epoch_of(when: Any) -> int:
+        """Epoch microseconds of a timestamp string, or of an epoch already in microseconds"""
+        epoch = when if isinstance(when, int) else TimestampParser().parse(str(when))
+        if epoch is None:
+            raise ValueError(f"Unrecognised timestamp: {when}")
+        return epoch
+    
+    def _seek_position(self, index: LogIndex, checkpoint: int,
+                       reached: Callable[[int, str], bool]) -> int:
+        """Position of the first entry from an index checkpoint on that has been reached
+        
+        Checkpoint entries bound the target, so only the entries up to the next
+        checkpoint are read.
+        """
+        position = checkpoint * index.stride
+        for number, text in self.parser.iter_indexed_records(index, position, index.stride):
+            if reached(number, text):
+                return position
+            position += 1
+        return min(position, index.count)
+    
+    def _new_logs(self, entries: Iterable[LogEntry] = ()) -> List[LogEntry]:
+        """A container for loaded logs: a LogStore if 'ColumnarStore' is set, else a list"""
+        if not self.config_manager.columnar_store:
+            return list(entries)
+        store = LogStore(self.parser)
+        store.extend(entries)
+        return store
+    
+    def _unfiltered(self) -> List[LogEntry]:
+        """The filtered logs with no filter applied
+        
+        A LogStore is shared rather than copied, which would mean building
+        every entry; code that adds to the filtered logs checks for this.
+        With no filter active, the filter engine's last query has nothing
+        left to refine, so it is forgotten.
+        """
+        self.filter_engine.forget()
+        return self.logs if isinstance(self.logs, LogStore) else self.logs.copy()
+    
+    def poll_file(self) -> Optional[FileUpdate]:
+        """Parse whatever was appended to the loaded file since the last load or poll
+        
+        Only the bytes after the checkpoint are read. A truncated, rotated or
+        rewritten file is parsed again from the start and the update is
+        flagged as a reload. The loaded logs are not modified, so this can run
+        on a worker thread; hand the result to apply_update(). Returns None
+        when the file has not changed.
+        """
+        if not self.file_path or not self.checkpoint:
+            return None
+        return self._poll(self.file_path, self.checkpoint)
+    
+    def _poll(self, file_path: str, checkpoint: FileCheckpoint) -> Optional[FileUpdate]:
+        """Parse what was appended to a file after a checkpoint (see poll_file)"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None  # Rotated away and not recreated yet
+        
+        # Compressed files are read again whole whenever they change
+        compressed = bool(checkpoint.stored_size)
+        if compressed and (stat.st_ino, stat.st_size) == (checkpoint.inode, checkpoint.stored_size):
+            return None
+        
+        if compressed or self._file_replaced(file_path, checkpoint, stat):
+            new_checkpoint = FileCheckpoint()
+            entries = list(self.parser.iter_entries(file_path, checkpoint=new_checkpoint))
+            return FileUpdate(file_path, entries, new_checkpoint, reload=True)
+        
+        if stat.st_size == checkpoint.size:
+            return None
+        
+        new_checkpoint = replace(checkpoint)
+        entries = list(self.parser.iter_entries(file_path, checkpoint=new_checkpoint))
+        return FileUpdate(file_path, entries, new_checkpoint, retracted=checkpoint.partial_entries)
+    
+    def _file_replaced(self, file_path: str, checkpoint: FileCheckpoint, stat: os.stat_result) -> bool:
+        """Check if a file was truncated, rotated or rewritten since the checkpoint"""
+        if stat.st_ino != checkpoint.inode:
+            return True
+        if stat.st_size < checkpoint.offset + len(checkpoint.partial):
+            return True
+        
+        with self.parser._open_log_file(file_path) as f:
+            if f.read(len(checkpoint.head)) != checkpoint.head:
+                return True
+            f.seek(checkpoint.offset)
+            return f.read(len(checkpoint.partial)) != checkpoint.partial
+    
+    def apply_update(self, update: FileUpdate) -> List[LogEntry]:
+        """Merge a poll_file() result into the loaded logs and return the new entries
+        
+        New entries pass through the active filters (see filter_query) into
+        the filtered logs; a reloaded file is filtered again as a whole.
+        """
+        if update.file_path != self.file_path:
+            return []  # A different file was loaded meanwhile
+        
+        self.checkpoint = update.checkpoint
+        if update.reload:
+            self.logs = self._new_logs(update.entries)
+            self.filtered_logs = self._run_filter_query()
+            if self.older_segments:
+                # The live file was rotated, which renamed every older segment
+                self.older_segments = rotation_set(self.file_path)[:-1]
+            return update.entries
+        
+        shared = self.filtered_logs is self.logs
+        unfiltered = self.filter_query is None and self.field_query is None
+        with self._search_index_lock():
+            if update.retracted:
+                # The previous read ended in an incomplete entry that has now been re-read
+                self.filter_engine.forget()
+                retracted = self.logs[-update.retracted:]
+                del self.logs[-update.retracted:]
+                if self.search_index is not None:
+                    self.search_index.truncate(len(self.logs))
+                if self.column_index is not None:
+                    self.column_index.truncate(len(self.logs))
+                if shared:
+                    pass  # Already removed with the logs
+                elif unfiltered:
+                    del self.filtered_logs[-update.retracted:]
+                else:
+                    # Entries from a LogStore are views, so compare rather than match identity
+                    while self.filtered_logs and any(self.filtered_logs[-1] == log for log in retracted):
+                        self.filtered_logs.pop()
+            
+            self.logs.extend(update.entries)
+        if shared:
+            pass  # Already added with the logs
+        elif unfiltered:
+            self.filtered_logs.extend(update.entries)
+        elif self.field_query is not None:
+            self.filtered_logs.extend(self._select_by_field(update.entries, *self.field_query))
+        else:
+            passes = self.filter_engine.compile(*self.filter_query)
+            self.filtered_logs.extend(entry for entry in update.entries if passes(entry))
+        return update.entries
+    
+    def _search_index_lock(self):
+        """Lock to hold while the loaded logs change, if a search index of them may be reading them"""
+        index = self.search_index
+        if index is not None and index.logs is self.logs:
+            return index.lock
+        return contextlib.nullcontext()
+    
+    def prepare_search_index(self, background: bool = True) -> Optional[TrigramIndex]:
+        """The search index of the loaded logs, caught up with appended entries
+        
+        Returns None when 'SearchIndex' is off in the config. Logs with no
+        index yet (or newly replaced ones) get one built, in the background
+        unless background is False; None is returned until it is ready, and
+        searches scan the logs meanwhile.
+        """
+        if not self.config_manager.search_index:
+            return None
+        index = self.search_index
+        if index is None or index.logs is not self.logs:
+            index = self.search_index = TrigramIndex(self.logs)
+            if background:
+                threading.Thread(target=index.update, daemon=True).start()
+                return None
+        elif not index.ready:
+            return None
+        index.update()
+        return index
+    
+    def prepare_column_index(self) -> ColumnIndex:
+        """The column index of the loaded logs, replaced when the logs are"""
+        if self.column_index is None or self.column_index.logs is not self.logs:
+            self.column_index = ColumnIndex(self.logs, self.filter_engine.field_types)
+        return self.column_index
+    
+    def refresh_file(self) -> int:
+        """Append entries written to the loaded file since the last refresh"""
+        update = self.poll_file()
+        if not update:
+            return 0
+        return len(self.apply_update(update))
+    
+    def iter_file(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[LogEntry]:
+        """Stream log entries from a file without loading it into the viewer"""
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Log file not found: {file_path}")
+        
+        return self.parser.iter_entries(file_path, chunk_size)
+    
     def display_logs(self, limit: int = None, detailed: bool = False):
         """Display loaded logs"""
         logs_to_display = self.filtered_logs[:limit] if limit else self.filtered_logs
@@ -478,31 +4496,78 @@ class LogViewer:
             print(log.raw_text)
     
     def filter_by_field(self, field_name: str, value: Any, operator: str = "equals"):
-        """Simple filtering by field value"""
-        filtered = []
+        """Simple filtering by field value
         
-        for log in self.logs:
-            field_value = log.get_field(field_name)
-            
+        Each distinct field value is tested once (see LogParser._field_value
+        and LogStore.select). The filter stays active like apply_filters().
+        """
+        self.filter_query = None
+        self.field_query = (field_name, value, operator)
+        return self.refilter()
+    
+    @staticmethod
+    def _field_matches(value: Any, operator: str) -> Callable[[Any], bool]:
+        """Test of a field value for filter_by_field()"""
+        def matches(field_value):
             if operator == "equals":
-                if field_value == value:
-                    filtered.append(log)
+                return field_value == value
             elif operator == "contains":
-                if value in str(field_value):
-                    filtered.append(log)
+                return value in str(field_value)
             elif operator == "in_array" and isinstance(field_value, list):
-                if value in field_value:
-                    filtered.append(log)
+                return value in field_value
             elif operator == "has_key" and isinstance(field_value, dict):
-                if value in field_value:
+                return value in field_value
+            return False
+        return matches
+    
+    def _select_by_field(self, logs: List[LogEntry], field_name: str, value: Any, operator: str) -> List[LogEntry]:
+        """The logs that pass a filter_by_field() filter"""
+        matches = self._field_matches(value, operator)
+        filtered = logs.select(field_name, matches) if isinstance(logs, LogStore) else None
+        if filtered is None:
+            filtered = []
+            results = {}  # id(field value) -> (field value, matched)
+            for log in logs:
+                field_value = log.get_field(field_name)
+                result = results.get(id(field_value))
+                if result is None:
+                    result = results[id(field_value)] = (field_value, matches(field_value))
+                if result[1]:
                     filtered.append(log)
+        return filtered
+    
+    def apply_filters(self, filters: Iterable[FieldFilter] = (), display: str = "Show All", search: str = "") -> int:
+        """Filter the loaded logs in one pass (see FilterEngine); returns the number that pass
         
-        self.filtered_logs = filtered
-        return len(filtered)
+        The filters stay active until reset_filters() or the next call, so
+        logs loaded or appended later are filtered with them.
+        """
+        filters = list(filters)
+        active = self.filter_engine.compile(filters, display, search) is not None
+        self.filter_query = (filters, display, search) if active else None
+        self.field_query = None
+        return self.refilter()
+    
+    def refilter(self) -> int:
+        """Run the active filters over the loaded logs again; returns the number that pass"""
+        self.filtered_logs = self._run_filter_query()
+        return len(self.filtered_logs)
+    
+    def _run_filter_query(self) -> List[LogEntry]:
+        """The loaded logs that pass the active filters"""
+        if self.field_query is not None:
+            return self._select_by_field(self.logs, *self.field_query)
+        if self.filter_query is None:
+            return self._unfiltered()
+        filters, display, search = self.filter_query
+        return self.filter_engine.apply(self.logs, filters, display, search,
+                                        self.prepare_search_index(), self.prepare_column_index())
     
     def reset_filters(self):
         """Reset filters to show all logs"""
-        self.filtered_logs = self.logs.copy()
+        self.filter_query = None
+        self.field_query = None
+        self.filtered_logs = self._unfiltered()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about loaded logs"""
@@ -514,14 +4579,80 @@ class LogViewer:
         
         # Count by log level if present
         if 'LogLevel' in stats['categories']:
-            levels = {}
-            for log in self.logs:
-                level = log.get_field('LogLevel')
-                if level:
-                    levels[level] = levels.get(level, 0) + 1
-            stats['log_levels'] = levels
+            stats['log_levels'] = self._count_levels(self.logs)[1]
         
         return stats
+    
+    def get_file_stats(self, file_path: str) -> Dict[str, Any]:
+        """Get statistics about a log file in a single streaming pass"""
+        stats = {'categories': [cat.name for cat in self.config_manager.categories]}
+        total, levels = self._count_levels(self.iter_file(file_path))
+        stats['total_logs'] = total
+        if 'LogLevel' in stats['categories']:
+            stats['log_levels'] = levels
+        return stats
+    
+    def _count_levels(self, logs: Iterable[LogEntry]) -> Tuple[int, Dict[str, int]]:
+        """Count entries and entries per log level"""
+        total = 0
+        levels = {}
+        for log in logs:
+            total += 1
+            level = log.get_field('LogLevel')
+            if level:
+                levels[level] = levels.get(level, 0) + 1
+        return total, levels
+    
+    def export_logs(self, output_path: str, logs: Optional[Iterable[LogEntry]] = None) -> int:
+        """Export log entries as text, CSV or JSON depending on the file extension
+        
+        Entries are written one at a time, so any iterable - including
+        iter_file() - can be exported without holding it in memory.
+        Defaults to the filtered logs. Returns the number of entries written.
+        """
+        if logs is None:
+            logs = self.filtered_logs
+        
+        count = 0
+        with open(output_path, 'w', encoding='utf-8', errors='surrogateescape') as f:
+            if output_path.endswith('.json'):
+                # Export as JSON array, one element at a time
+                f.write('[')
+                for log in logs:
+                    item = json.dumps({
+                        'line_number': log.line_number,
+                        'raw_text': log.raw_text,
+                        'fields': dict(log.fields)
+                    }, indent=2)
+                    f.write((',\n  ' if count else '\n  ') + item.replace('\n', '\n  '))
+                    count += 1
+                f.write('\n]' if count else ']')
+            elif output_path.endswith('.csv'):
+                # Export as CSV
+                import csv
+                writer = csv.writer(f)
+                
+                # Header
+                headers = ['Line', 'Raw Text'] + [cat.name for cat in self.config_manager.categories]
+                writer.writerow(headers)
+                
+                # Data
+                for log in logs:
+                    row = [log.line_number, log.raw_text]
+                    for cat in self.config_manager.categories:
+                        value = log.get_field(cat.name)
+                        if isinstance(value, (dict, list)):
+                            value = str(value)
+                        row.append(value)
+                    writer.writerow(row)
+                    count += 1
+            else:
+                # Export as text
+                for log in logs:
+                    f.write(f"Line {log.line_number}: {log.raw_text}\n")
+                    count += 1
+        
+        return count
 
 
 def main():
@@ -571,16 +4702,22 @@ def main():
             # Display first 5 logs
             viewer.display_logs(limit=5, detailed=False)
             
-            # Example filter
-            print("\n\nFiltering for ERROR logs...")
-            count = viewer.filter_by_field('LogLevel', 'ERROR')
-            print(f"Found {count} ERROR logs")
+            if len(sys.argv) > 2:
+                # Filters given as 'Category:operator:value' ('low..high' for ranges)
+                filters = [FieldFilter.from_spec(spec) for spec in sys.argv[2:]]
+                count = viewer.apply_filters(filters)
+                print(f"\n\n{count} logs match {', '.join(sys.argv[2:])}")
+            else:
+                # Example filter
+                print("\n\nFiltering for ERROR logs...")
+                count = viewer.filter_by_field('LogLevel', 'ERROR')
+                print(f"Found {count} ERROR logs")
             viewer.display_logs(limit=3, detailed=True)
             
         except Exception as e:
             print(f"Error: {e}")
     else:
-        print("Usage: python log_viewer.py <log_file>")
+        print("Usage: python log_viewer.py <log_file> [Category:operator:value ...]")
         print("\nCreating sample log file for testing...")
         
         # Create a sample log file
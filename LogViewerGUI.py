@@ -19,7 +19,9 @@ import os
 from pathlib import Path
 import json
 
-from LogViewer import LogViewer, LogEntry, LogCategory
+from LogViewer import (LogViewer, LogEntry, LogCategory, TimestampParser, is_log_file,
+                       group_rotation_sets, rotation_set, FieldFilter, FilterEngine, FieldType,
+                       INDEX_PAGE_SIZE)
 
 
 class LogViewerGUI:
@@ -34,6 +36,7 @@ class LogViewerGUI:
         self.log_viewer: Optional[LogViewer] = None
         self.log_text = None  # Current active tab's text widget
         self.current_file_path: Optional[str] = None
+        self.view_start = 0  # Position in the filtered logs of the first entry shown
         
         # GUI components
         self.setup_styles()
@@ -71,6 +74,7 @@ class LogViewerGUI:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open Log File", command=self.open_file, accelerator="Ctrl+O")
         file_menu.add_command(label="Open Multiple Files", command=self.open_multiple_files)
+        file_menu.add_command(label="Open Large File (Paged)", command=self.open_paged_file)
         file_menu.add_command(label="Merge Open Files", command=self.merge_open_files)
         file_menu.add_command(label="Open Folder", command=self.open_folder)
         file_menu.add_command(label="Merge Open Folder", command=self.merge_open_folder)
@@ -150,7 +154,7 @@ class LogViewerGUI:
         ttk.Label(toolbar, text="Display:").pack(side=tk.LEFT, padx=(10, 2))
         self.json_xml_filter_var = tk.StringVar(value="Show All")
         json_xml_combo = ttk.Combobox(toolbar, textvariable=self.json_xml_filter_var,
-                                      values=["Show All", "Only JSON/XML", "Hide JSON/XML"],
+                                      values=FilterEngine.DISPLAY_MODES,
                                       state="readonly", width=15)
         json_xml_combo.pack(side=tk.LEFT, padx=(0, 5))
         json_xml_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_display())
@@ -162,6 +166,14 @@ class LogViewerGUI:
                                   values=["50", "100", "500", "1000", "All"])
         limit_combo.pack(side=tk.LEFT, padx=(0, 5))
         limit_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_display())
+        
+        # Jump to time
+        ttk.Label(toolbar, text="Jump to:").pack(side=tk.LEFT, padx=(10, 2))
+        self.jump_time_var = tk.StringVar()
+        jump_entry = ttk.Entry(toolbar, textvariable=self.jump_time_var, width=20)
+        jump_entry.pack(side=tk.LEFT, padx=(0, 2))
+        jump_entry.bind('<Return>', lambda e: self.jump_to_time())
+        ttk.Button(toolbar, text="Go", command=self.jump_to_time).pack(side=tk.LEFT, padx=(0, 5))
     
     def create_filter_panel(self):
         """Create filtering panel with tabs"""
@@ -240,6 +252,51 @@ class LogViewerGUI:
         self.refresh_interval_var = tk.StringVar(value="5")
         ttk.Entry(refresh_frame, textvariable=self.refresh_interval_var, width=10).pack(anchor=tk.W)
         
+        # Performance Section
+        perf_frame = ttk.LabelFrame(scrollable_frame, text="Performance", padding=5)
+        perf_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(perf_frame, text="Parse worker processes (0 = one per CPU, 1 = off):").pack(anchor=tk.W)
+        self.parse_workers_var = tk.StringVar(value="1")
+        ttk.Entry(perf_frame, textvariable=self.parse_workers_var, width=10).pack(anchor=tk.W)
+        
+        self.lazy_fields_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(perf_frame, text="Lazy field parsing (parse fields when first shown or filtered)",
+                       variable=self.lazy_fields_var).pack(anchor=tk.W)
+        
+        self.block_parser_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(perf_frame, text="Block parsing of single-line logs (when NumPy is installed)",
+                       variable=self.block_parser_var).pack(anchor=tk.W)
+        
+        self.columnar_store_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(perf_frame, text="Columnar log storage (less memory for large files)",
+                       variable=self.columnar_store_var).pack(anchor=tk.W)
+        
+        self.search_index_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(perf_frame, text="Search index (faster search box, more memory)",
+                       variable=self.search_index_var).pack(anchor=tk.W)
+        
+        ttk.Label(perf_frame, text="Parse cache directory (empty = off; only you should be able to write to it):").pack(anchor=tk.W)
+        self.parse_cache_dir_var = tk.StringVar(value="")
+        ttk.Entry(perf_frame, textvariable=self.parse_cache_dir_var, width=40).pack(anchor=tk.W)
+        
+        ttk.Label(perf_frame, text="Parse cache size limit (MB):").pack(anchor=tk.W)
+        self.parse_cache_max_var = tk.StringVar(value="1024")
+        ttk.Entry(perf_frame, textvariable=self.parse_cache_max_var, width=10).pack(anchor=tk.W)
+        
+        ttk.Label(perf_frame, text="Invalid UTF-8 bytes:").pack(anchor=tk.W)
+        self.decode_errors_var = tk.StringVar(value="replace")
+        ttk.Combobox(perf_frame, textvariable=self.decode_errors_var, width=18, state="readonly",
+                     values=["replace", "surrogateescape", "backslashreplace"]).pack(anchor=tk.W)
+        
+        ttk.Label(perf_frame, text="Sidecar index stride (entries between offsets, 1 = every entry):").pack(anchor=tk.W)
+        self.index_stride_var = tk.StringVar(value="1")
+        ttk.Entry(perf_frame, textvariable=self.index_stride_var, width=10).pack(anchor=tk.W)
+        
+        ttk.Label(perf_frame, text="Sidecar index directory (empty = per-user cache):").pack(anchor=tk.W)
+        self.index_dir_var = tk.StringVar(value="")
+        ttk.Entry(perf_frame, textvariable=self.index_dir_var, width=40).pack(anchor=tk.W)
+        
         # Delimiters Section
         delim_frame = ttk.LabelFrame(scrollable_frame, text="Delimiters", padding=5)
         delim_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -407,6 +464,21 @@ Each tab maintains its own filters and view settings.
         refresh_interval_entry = ttk.Entry(refresh_frame, textvariable=refresh_interval_var, width=5)
         refresh_interval_entry.pack(side=tk.LEFT)
         
+        # Shown for rotation sets with older segments left to load
+        older_button = ttk.Button(refresh_frame, text="Load Older Segment",
+                                  command=lambda: self.load_older_segment(tab_id))
+        
+        # Shown for paged tabs, which hold one page of a large file at a time
+        page_frame = ttk.Frame(refresh_frame)
+        ttk.Button(page_frame, text="< Previous Page",
+                   command=lambda: self.show_page(tab_id, lambda viewer, position: position - INDEX_PAGE_SIZE)
+                   ).pack(side=tk.LEFT)
+        ttk.Button(page_frame, text="Next Page >",
+                   command=lambda: self.show_page(tab_id, lambda viewer, position: position + INDEX_PAGE_SIZE)
+                   ).pack(side=tk.LEFT, padx=(5, 0))
+        page_label = ttk.Label(page_frame, text="")
+        page_label.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Create scrolled text widget for this tab
         log_text = scrolledtext.ScrolledText(
             display_frame, 
@@ -415,6 +487,9 @@ Each tab maintains its own filters and view settings.
             state=tk.DISABLED
         )
         log_text.pack(fill=tk.BOTH, expand=True)
+        # Scrolling up past the first entry loads an older rotated segment
+        for sequence in ('<MouseWheel>', '<Button-4>'):
+            log_text.bind(sequence, lambda e: self.on_log_scroll(tab_id, e), add=True)
         
         # Store tab data
         self.tabs[tab_id] = {
@@ -425,6 +500,12 @@ Each tab maintains its own filters and view settings.
             'auto_refresh_var': auto_refresh_var,
             'refresh_interval_var': refresh_interval_var,
             'refresh_timer': None,
+            'older_button': older_button,
+            'loading_older': False,
+            'page_frame': page_frame,
+            'page_label': page_label,
+            'paged': False,
+            'page_position': 0,
             'file_path': None  # Will be set when loading files
         }
         
@@ -505,8 +586,12 @@ Each tab maintains its own filters and view settings.
                 self.log_viewer = None
                 self.log_text = None
             
-            # Update filters for the active tab
+            # Show the active tab's filters, run again over its logs as they are now
+            self.view_start = 0
             self.create_dynamic_filters()
+            if self.log_viewer:
+                self._show_filter_query(self.log_viewer)
+                self.log_viewer.refilter()
             self.refresh_display()
     
     def on_filter_tab_changed(self, event):
@@ -753,14 +838,7 @@ Each tab maintains its own filters and view settings.
     
     def _get_operators_for_type(self, field_type):
         """Get available operators for a field type"""
-        if field_type == "string":
-            return ["contains", "equals", "not contains", "not equals", "starts with", "ends with", "contains any", "contains all", "has key", "key equals"]
-        elif field_type == "number":
-            return ["equals", "not equals", "greater than", "less than", "between", "not between"]
-        elif field_type == "datetime":
-            return ["contains", "equals", "not contains", "before", "after", "between", "not between"]
-        else:
-            return ["contains", "equals"]
+        return FilterEngine.operators_for(FieldType(field_type))
     
     def open_file(self):
         """Open single log file in new tab"""
@@ -769,6 +847,7 @@ Each tab maintains its own filters and view settings.
             filetypes=[
                 ("Text files", "*.txt"),
                 ("Log files", "*.log"),
+                ("Compressed logs", "*.gz *.bz2 *.xz"),
                 ("All files", "*.*")
             ]
         )
@@ -783,6 +862,7 @@ Each tab maintains its own filters and view settings.
             filetypes=[
                 ("Text files", "*.txt"),
                 ("Log files", "*.log"),
+                ("Compressed logs", "*.gz *.bz2 *.xz"),
                 ("All files", "*.*")
             ]
         )
@@ -790,6 +870,21 @@ Each tab maintains its own filters and view settings.
         for file_path in file_paths:
             self.load_log_file_in_tab(file_path)
     
+    def open_paged_file(self):
+        """Open a log file too large to load whole in a new tab, one page at a time"""
+        file_path = filedialog.askopenfilename(
+            title="Select Large Log File",
+            filetypes=[
+                ("Text files", "*.txt"),
+                ("Log files", "*.log"),
+                ("Compressed logs", "*.gz *.bz2 *.xz"),
+                ("All files", "*.*")
+            ]
+        )
+        
+        if file_path:
+            self.load_paged_file_in_tab(file_path)
+    
     def merge_open_files(self):
         """Open multiple log files and merge them into one tab"""
         file_paths = filedialog.askopenfilenames(
@@ -797,6 +892,7 @@ Each tab maintains its own filters and view settings.
             filetypes=[
                 ("Text files", "*.txt"),
                 ("Log files", "*.log"),
+                ("Compressed logs", "*.gz *.bz2 *.xz"),
                 ("All files", "*.*")
             ]
         )
@@ -843,8 +939,18 @@ Each tab maintains its own filters and view settings.
         """Legacy method - redirects to tab-based loading"""
         self.load_log_file_in_tab(file_path)
     
-    def load_log_file_in_tab(self, file_path: str):
-        """Load a log file in a new tab"""
+    def load_log_file_in_tab(self, file_path: str, segments: Optional[List[str]] = None):
+        """Load a log file in a new tab
+        
+        The live file of a rotation set (app.log next to app.log.1, ...) is
+        loaded on its own; its older segments are loaded when asked for.
+        segments gives the set, oldest first, when it is already known.
+        """
+        if segments is None:
+            segments = rotation_set(file_path)
+            if segments[-1] != file_path:
+                segments = [file_path]  # An older segment opened on its own
+        
         # Create log viewer for this tab
         try:
             if hasattr(self, 'log_viewer') and self.log_viewer:
@@ -856,6 +962,8 @@ Each tab maintains its own filters and view settings.
             
             # Create tab
             file_name = Path(file_path).name
+            if len(segments) > 1:
+                file_name += f" (+{len(segments) - 1} rotated)"
             tab_id = self.create_log_tab(file_name, tab_log_viewer)
             
             # Store file path in tab data
@@ -867,7 +975,7 @@ Each tab maintains its own filters and view settings.
             
             def load_file():
                 try:
-                    count = tab_log_viewer.load_file(file_path)
+                    count = tab_log_viewer.load_rotation_set(segments)
                     self.root.after(0, lambda: self.on_file_loaded_in_tab(tab_id, file_path, count))
                 except Exception as e:
                     self.root.after(0, lambda: self.on_file_error(str(e)))
@@ -883,6 +991,72 @@ Each tab maintains its own filters and view settings.
             self.on_file_error(str(e))
             return None
     
+    def load_paged_file_in_tab(self, file_path: str):
+        """Open a log file in a new paged tab
+        
+        The file is indexed (see LogViewer.open_index) and only the page shown
+        is parsed, so files larger than memory can be browsed. Filters and
+        search apply to the page shown.
+        """
+        try:
+            if hasattr(self, 'log_viewer') and self.log_viewer:
+                # Use existing config
+                tab_log_viewer = LogViewer(config_dict=self.log_viewer.config_manager.config)
+            else:
+                # Load default config
+                tab_log_viewer = LogViewer(config_path="log_config.json")
+            
+            tab_id = self.create_log_tab(f"{Path(file_path).name} (paged)", tab_log_viewer)
+            self.tabs[tab_id]['file_path'] = file_path
+            self.tabs[tab_id]['paged'] = True
+            self.update_status(f"Indexing log file: {file_path}")
+            self.show_page(tab_id, lambda viewer, position: 0)
+            return tab_id
+            
+        except Exception as e:
+            self.on_file_error(str(e))
+            return None
+    
+    def show_page(self, tab_id, locate):
+        """Load a page of a paged tab's file on a worker thread
+        
+        locate(log_viewer, position) gives the entry position of the page to
+        show from that of the page shown. It runs on the worker thread, so it
+        may search the file's index.
+        """
+        if tab_id not in self.tabs or not self.tabs[tab_id]['paged']:
+            return
+        tab_data = self.tabs[tab_id]
+        tab_log_viewer = tab_data['log_viewer']
+        file_path = tab_data['file_path']
+        current = tab_data['page_position']
+        self.progress.start()
+        
+        def loaded(position, count, total):
+            if tab_id not in self.tabs:
+                self.progress.stop()
+                return
+            tab_data['page_position'] = position
+            tab_data['page_label'].config(text=f"Entries {position + 1}-{position + count} of {total}")
+            tab_data['page_frame'].pack(side=tk.LEFT, padx=(10, 0))
+            self.on_file_loaded_in_tab(tab_id, f"{Path(file_path).name} (page from entry {position + 1})", count)
+        
+        def load_page():
+            try:
+                index = tab_log_viewer.open_index(file_path)
+                position = max(locate(tab_log_viewer, current), 0)
+                if position >= index.count:
+                    position = max(index.count - INDEX_PAGE_SIZE, 0)  # Past the end: the last page
+                count = tab_log_viewer.load_page(file_path, position)
+                self.root.after(0, lambda: loaded(position, count, index.count))
+            except Exception as e:
+                message = str(e)
+                self.root.after(0, lambda: self.on_file_error(message))
+        
+        thread = threading.Thread(target=load_page)
+        thread.daemon = True
+        thread.start()
+    
     def _load_file_worker(self, file_path: str):
         """Worker thread for loading log file"""
         try:
@@ -943,25 +1117,17 @@ Each tab maintains its own filters and view settings.
             self.progress.start()
             self.update_status(f"Merging {len(file_paths)} files...")
             
+            def on_progress(file_path, count, done, total):
+                message = f"Merging files: {done}/{total} loaded ({Path(file_path).name}: {count} entries)"
+                self.root.after(0, lambda: self.update_status(message))
+            
             def load_and_merge():
                 try:
-                    all_logs = []
-                    for file_path in file_paths:
-                        temp_viewer = LogViewer(config_dict=tab_log_viewer.config_manager.config)
-                        temp_viewer.load_file(file_path)
-                        all_logs.extend(temp_viewer.logs)
-                    
-                    # Sort merged logs by timestamp if possible
-                    try:
-                        all_logs.sort(key=lambda log: log.get_field('Timestamp') or '')
-                    except:
-                        pass  # If sorting fails, keep original order
-                    
-                    # Set merged logs
-                    tab_log_viewer.logs = all_logs
-                    tab_log_viewer.filtered_logs = all_logs.copy()
-                    
-                    total_count = len(all_logs)
+                    # Files are parsed concurrently and merged into the tab's viewer;
+                    # the first screen is shown as soon as it has been merged
+                    total_count = tab_log_viewer.merge_files(
+                        file_paths, progress=on_progress,
+                        first_screen=lambda logs: self.root.after(0, lambda: self.on_merge_first_screen(tab_id, len(logs))))
                     self.root.after(0, lambda: self.on_file_loaded_in_tab(tab_id, f"{len(file_paths)} files merged", total_count))
                 except Exception as e:
                     self.root.after(0, lambda: self.on_file_error(str(e)))
@@ -987,7 +1153,7 @@ Each tab maintains its own filters and view settings.
             log_files = []
             for root, dirs, files in os.walk(folder_path):
                 for file in files:
-                    if any(file.lower().endswith(ext.lower()) for ext in log_filters):
+                    if is_log_file(file, log_filters):
                         log_files.append(os.path.join(root, file))
             
             if not log_files:
@@ -999,9 +1165,9 @@ Each tab maintains its own filters and view settings.
                 # For merged folder view, track the folder path
                 self.merge_files_in_tab(log_files, folder_path=folder_path)
             else:
-                # Track folder for individual file tabs
-                for log_file in log_files:
-                    tab_id = self.load_log_file_in_tab(log_file)
+                # Track folder for individual file tabs; a rotation set opens as one tab
+                for segments in group_rotation_sets(log_files):
+                    tab_id = self.load_log_file_in_tab(segments[-1], segments)
                     if tab_id and tab_id in self.tabs:
                         self.tabs[tab_id]['folder_path'] = folder_path
                         self.tabs[tab_id]['log_filters'] = log_filters
@@ -1016,14 +1182,93 @@ Each tab maintains its own filters and view settings.
         
         # Switch to this tab and refresh display
         if tab_id in self.tabs:
+            self.update_older_button(tab_id)
             tab_frame = self.tabs[tab_id]['frame']
             self.notebook.select(tab_frame)
             self.active_tab = tab_id
             self.log_viewer = self.tabs[tab_id]['log_viewer']
             self.log_text = self.tabs[tab_id]['log_text']
+            self.log_viewer.prepare_search_index()
+            self.view_start = 0
             
             # Update filters and display
             self.create_dynamic_filters()
+            self._show_filter_query(self.log_viewer)
+            self.refresh_display()
+    
+    def update_older_button(self, tab_id):
+        """Show how many older rotated segments a tab can still load, if any"""
+        older_button = self.tabs[tab_id]['older_button']
+        remaining = len(self.tabs[tab_id]['log_viewer'].older_segments)
+        if remaining:
+            older_button.config(text=f"Load Older Segment ({remaining} left)")
+            older_button.pack(side=tk.LEFT, padx=(10, 0))
+        else:
+            older_button.pack_forget()
+    
+    def load_older_segment(self, tab_id, since=None, then=None):
+        """Load the next older segment of a tab's rotation set, or back to a time
+        
+        then is called once the segments are loaded; by default the filters
+        are applied again.
+        """
+        if tab_id not in self.tabs or self.tabs[tab_id]['loading_older']:
+            return
+        tab_log_viewer = self.tabs[tab_id]['log_viewer']
+        if not tab_log_viewer.older_segments:
+            return
+        
+        self.tabs[tab_id]['loading_older'] = True
+        self.progress.start()
+        self.update_status("Loading older rotated segment...")
+        
+        def loaded(count):
+            self.progress.stop()
+            if tab_id not in self.tabs:
+                return
+            self.tabs[tab_id]['loading_older'] = False
+            self.update_older_button(tab_id)
+            self.update_status(f"Loaded {count} older log entries")
+            if self.active_tab == tab_id:
+                (then or self.apply_filters)()
+        
+        def failed(message):
+            if tab_id in self.tabs:
+                self.tabs[tab_id]['loading_older'] = False
+                self.update_older_button(tab_id)
+                if self.active_tab == tab_id:
+                    # Segments read before the failure are loaded; asking for the
+                    # failed one again would fail again
+                    self.apply_filters(load_older=False)
+            self.on_file_error(message)
+        
+        def load_older():
+            try:
+                if since is None:
+                    count = tab_log_viewer.load_older()
+                else:
+                    count = tab_log_viewer.load_older_until(since)
+                self.root.after(0, lambda: loaded(count))
+            except Exception as e:
+                self.root.after(0, lambda: failed(str(e)))
+        
+        thread = threading.Thread(target=load_older)
+        thread.daemon = True
+        thread.start()
+    
+    def on_log_scroll(self, tab_id, event):
+        """Load an older rotated segment when the view is scrolled up past its first entry"""
+        scrolling_up = getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0
+        if scrolling_up and tab_id in self.tabs and self.tabs[tab_id]['log_text'].yview()[0] <= 0:
+            self.load_older_segment(tab_id)
+    
+    def on_merge_first_screen(self, tab_id, count):
+        """Show the head of a merged view while the remaining files are parsed"""
+        self.update_status(f"Showing first {count} merged entries, still merging...")
+        
+        if tab_id in self.tabs and self.active_tab == tab_id:
+            self.log_viewer = self.tabs[tab_id]['log_viewer']
+            self.log_text = self.tabs[tab_id]['log_text']
             self.refresh_display()
     
     def on_file_error(self, error_msg):
@@ -1041,8 +1286,10 @@ Each tab maintains its own filters and view settings.
         limit_str = self.limit_var.get()
         limit = None if limit_str == "All" else int(limit_str)
         
-        # Get logs to display
-        logs_to_show = self.log_viewer.filtered_logs[:limit] if limit else self.log_viewer.filtered_logs
+        # Get logs to display, from the position jumped to
+        start = min(self.view_start, len(self.log_viewer.filtered_logs))
+        logs_to_show = self.log_viewer.filtered_logs[start:start + limit] if limit \
+            else self.log_viewer.filtered_logs[start:]
         
         # Clear display
         self.log_text.config(state=tk.NORMAL)
@@ -1050,7 +1297,7 @@ Each tab maintains its own filters and view settings.
         
         # Display logs
         detailed = self.show_detailed.get()
-        for i, log in enumerate(logs_to_show, 1):
+        for i, log in enumerate(logs_to_show, start + 1):
             if detailed:
                 self._display_detailed_log(log, i)
             else:
@@ -1187,255 +1434,113 @@ Each tab maintains its own filters and view settings.
                 self.log_text.tag_add(tag_name, abs_start, abs_end)
                 start_idx = pos + len(field_text)
     
-    def apply_filters(self):
-        """Apply multiple simultaneous filters to logs"""
+    def apply_filters(self, load_older=True):
+        """Apply multiple simultaneous filters to logs
+        
+        A date filter reaching back past the loaded logs loads older rotated
+        segments first, unless load_older is False.
+        """
         if not self.log_viewer:
             return
         
-        # Start with all logs
-        filtered_logs = self.log_viewer.logs.copy()
-        
-        # Apply JSON/XML display filters
-        if hasattr(self, 'json_xml_filter_var'):
-            filter_mode = self.json_xml_filter_var.get()
-            if filter_mode != "Show All":
-                display_filtered = []
-                for log in filtered_logs:
-                    # Check if log contains JSON or XML
-                    text = log.raw_text
-                    is_json = '{' in text or '[' in text  # Simple JSON detection
-                    is_xml = '<' in text and '>' in text  # Simple XML detection
-                    is_json_or_xml = is_json or is_xml
-                    
-                    # Apply filter based on mode
-                    if filter_mode == "Only JSON/XML":
-                        if is_json_or_xml:
-                            display_filtered.append(log)
-                    elif filter_mode == "Hide JSON/XML":
-                        if not is_json_or_xml:
-                            display_filtered.append(log)
-                
-                filtered_logs = display_filtered
-        
-        # Apply search filter
-        search_term = self.search_var.get().strip()
-        if search_term:
-            search_filtered = []
-            for log in filtered_logs:
-                if search_term.lower() in log.raw_text.lower():
-                    search_filtered.append(log)
-            filtered_logs = search_filtered
-        
-        # Apply field filters
-        for category_name, filter_info in self.filter_widgets.items():
-            filtered_logs = self._apply_single_filter(filtered_logs, category_name, filter_info)
+        since = self._earliest_filter_time() if load_older else None
+        if since is not None and not self.log_viewer.reaches_back_to(since):
+            self.load_older_segment(self.active_tab, since=since)
+            return
         
-        # Update filtered logs
-        self.log_viewer.filtered_logs = filtered_logs
+        # The viewer keeps the filters, and applies them to entries loaded later
+        count = self.log_viewer.apply_filters(self._field_filters(), self._display_filter(), self.search_var.get())
+        self.view_start = 0
         
         # Refresh display and stats
         self.refresh_display()
         self.update_statistics()
-        self.update_status(f"Applied filters - showing {len(filtered_logs)} of {len(self.log_viewer.logs)} entries")
-    
-    def _apply_single_filter(self, logs, category_name, filter_info):
-        """Apply a single filter to the log list"""
-        operator = filter_info['operator_var'].get()
-        field_type = filter_info['type']
-        
-        # Get filter values
-        if field_type == "string":
-            value = filter_info['value_var'].get().strip()
-            if not value:
-                return logs
-            
-            return self._filter_string_field(logs, category_name, operator, value)
-            
-        elif field_type == "number":
-            value1 = filter_info['value1_var'].get().strip()
-            value2 = filter_info['value2_var'].get().strip()
-            
-            if not value1:
-                return logs
-            
-            return self._filter_number_field(logs, category_name, operator, value1, value2)
-            
-        elif field_type == "datetime":
-            value1 = filter_info['value1_var'].get().strip()
-            value2 = filter_info['value2_var'].get().strip()
-            
-            if not value1:
-                return logs
-            
-            return self._filter_datetime_field(logs, category_name, operator, value1, value2)
-        
-        return logs
+        self.update_status(f"Applied filters - showing {count} of {len(self.log_viewer.logs)} entries")
     
-    def _filter_string_field(self, logs, category_name, operator, value):
-        """Filter logs by string field"""
-        filtered = []
+    def jump_to_time(self):
+        """Show the filtered logs from the first entry at or after the time in the jump box
         
-        for log in logs:
-            field_value = log.get_field(category_name)
-            
-            if field_value is None:
-                continue
-                
-            # Handle different field value types (parsed by container logic)
-            if isinstance(field_value, dict):
-                # For structured strings, check keys and values
-                if operator == "has key":
-                    if value in field_value:
-                        filtered.append(log)
-                elif operator == "key equals":
-                    key, val = value.split('=', 1) if '=' in value else (value, '')
-                    if key in field_value and (not val or str(field_value[key]) == val):
-                        filtered.append(log)
-                elif operator == "contains":
-                    field_str = ' '.join(f"{k}={v}" for k, v in field_value.items())
-                    if value.lower() in field_str.lower():
-                        filtered.append(log)
-                elif operator == "not contains":
-                    field_str = ' '.join(f"{k}={v}" for k, v in field_value.items())
-                    if value.lower() not in field_str.lower():
-                        filtered.append(log)
-                        
-            elif field_type == "array_string" and isinstance(field_value, list):
-                # For array strings, check array elements
-                if operator == "contains":
-                    if any(value.lower() in str(item).lower() for item in field_value):
-                        filtered.append(log)
-                elif operator == "not contains":
-                    if not any(value.lower() in str(item).lower() for item in field_value):
-                        filtered.append(log)
-                elif operator == "contains all":
-                    search_items = [item.strip().lower() for item in value.split(',')]
-                    field_items = [str(item).lower() for item in field_value]
-                    if all(any(search in field for field in field_items) for search in search_items):
-                        filtered.append(log)
-                elif operator == "contains any":
-                    search_items = [item.strip().lower() for item in value.split(',')]
-                    field_items = [str(item).lower() for item in field_value]
-                    if any(any(search in field for field in field_items) for search in search_items):
-                        filtered.append(log)
-                        
+        A paged tab loads the page of its file that starts there, or at a line
+        number typed in the jump box.
+        """
+        when = self.jump_time_var.get().strip()
+        if not self.log_viewer or not when:
+            return
+        
+        # A paged tab jumps through its file's index, to a line number or a time
+        tab_data = self.tabs.get(self.active_tab)
+        if tab_data and tab_data['paged']:
+            file_path = tab_data['file_path']
+            if when.isdigit():
+                self.show_page(self.active_tab, lambda viewer, position: viewer.find_line(file_path, int(when)))
+            elif TimestampParser().parse(when) is None:
+                messagebox.showerror("Jump to Time", f"Unrecognised timestamp: {when}")
             else:
-                # Regular string comparison
-                field_str = str(field_value).lower()
-                value_lower = value.lower()
-                
-                if operator == "contains":
-                    if value_lower in field_str:
-                        filtered.append(log)
-                elif operator == "equals":
-                    if field_str == value_lower:
-                        filtered.append(log)
-                elif operator == "not contains":
-                    if value_lower not in field_str:
-                        filtered.append(log)
-                elif operator == "not equals":
-                    if field_str != value_lower:
-                        filtered.append(log)
-                elif operator == "starts with":
-                    if field_str.startswith(value_lower):
-                        filtered.append(log)
-                elif operator == "ends with":
-                    if field_str.endswith(value_lower):
-                        filtered.append(log)
-                elif operator == "contains any":
-                    # Split comma-separated values and check if any are contained in field
-                    search_items = [item.strip().lower() for item in value.split(',')]
-                    if any(search in field_str for search in search_items):
-                        filtered.append(log)
-                elif operator == "contains all":
-                    # Split comma-separated values and check if all are contained in field
-                    search_items = [item.strip().lower() for item in value.split(',')]
-                    if all(search in field_str for search in search_items):
-                        filtered.append(log)
-        
-        return filtered
-    
-    def _filter_number_field(self, logs, category_name, operator, value1, value2):
-        """Filter logs by number field"""
-        try:
-            num1 = float(value1)
-            num2 = float(value2) if value2 else None
-        except ValueError:
-            return logs
+                self.show_page(self.active_tab, lambda viewer, position: viewer.find_time(file_path, when))
+            return
         
-        filtered = []
+        try:
+            position = self.log_viewer.find_loaded_time(when)
+        except ValueError as e:
+            messagebox.showerror("Jump to Time", str(e))
+            return
         
-        for log in logs:
-            field_value = log.get_field(category_name)
-            
-            if field_value is None:
+        if position >= len(self.log_viewer.filtered_logs):
+            self.update_status(f"No entries at or after {when}")
+            return
+        self.view_start = position
+        self.refresh_display()
+        self.update_status(f"Showing entries from #{position + 1}, the first at or after {when}")
+    
+    def _earliest_filter_time(self):
+        """Epoch of the earliest time the datetime filters ask for, or None if they have no lower bound"""
+        bounds = []
+        bound_parser = TimestampParser()
+        for filter_info in self.filter_widgets.values():
+            if filter_info['type'] != "datetime":
                 continue
-                
-            try:
-                field_num = float(field_value)
-                
-                if operator == "equals":
-                    if field_num == num1:
-                        filtered.append(log)
-                elif operator == "not equals":
-                    if field_num != num1:
-                        filtered.append(log)
-                elif operator == "greater than":
-                    if field_num > num1:
-                        filtered.append(log)
-                elif operator == "less than":
-                    if field_num < num1:
-                        filtered.append(log)
-                elif operator == "between" and num2 is not None:
-                    if min(num1, num2) <= field_num <= max(num1, num2):
-                        filtered.append(log)
-                elif operator == "not between" and num2 is not None:
-                    if not (min(num1, num2) <= field_num <= max(num1, num2)):
-                        filtered.append(log)
-                        
-            except (ValueError, TypeError):
+            operator = filter_info['operator_var'].get()
+            values = [filter_info['value1_var'].get().strip()]
+            if operator == "between":
+                values.append(filter_info['value2_var'].get().strip())
+            elif operator != "after":
                 continue
-        
-        return filtered
-    
-    def _filter_datetime_field(self, logs, category_name, operator, value1, value2):
-        """Filter logs by datetime field"""
-        filtered = []
-        
-        for log in logs:
-            field_value = log.get_field(category_name)
-            
-            if field_value is None:
+            epochs = [bound_parser.parse(value) for value in values]
+            if None not in epochs:
+                bounds.append(min(epochs))
+        return min(bounds) if bounds else None
+    
+    def _display_filter(self):
+        """The JSON/XML display filter as selected in the toolbar"""
+        return self.json_xml_filter_var.get() if hasattr(self, 'json_xml_filter_var') else "Show All"
+    
+    def _show_filter_query(self, log_viewer):
+        """Fill the filter panel, search box and display filter with a viewer's active filters"""
+        filters, display, search = log_viewer.filter_query or ([], "Show All", "")
+        self.search_var.set(search)
+        self.json_xml_filter_var.set(display)
+        for field_filter in filters:
+            filter_info = self.filter_widgets.get(field_filter.category)
+            if filter_info is None:
                 continue
-                
-            field_str = str(field_value)
-            
-            if operator == "contains":
-                if value1.lower() in field_str.lower():
-                    filtered.append(log)
-            elif operator == "equals":
-                if field_str.lower() == value1.lower():
-                    filtered.append(log)
-            elif operator == "not contains":
-                if value1.lower() not in field_str.lower():
-                    filtered.append(log)
-            elif operator in ["before", "after", "between", "not between"]:
-                # Simple string comparison for datetime ranges
-                # In a production system, you'd parse the datetime properly
-                if operator == "before":
-                    if field_str < value1:
-                        filtered.append(log)
-                elif operator == "after":
-                    if field_str > value1:
-                        filtered.append(log)
-                elif operator == "between" and value2:
-                    if min(value1, value2) <= field_str <= max(value1, value2):
-                        filtered.append(log)
-                elif operator == "not between" and value2:
-                    if not (min(value1, value2) <= field_str <= max(value1, value2)):
-                        filtered.append(log)
-        
-        return filtered
+            filter_info['operator_var'].set(field_filter.operator)
+            if 'value_var' in filter_info:
+                filter_info['value_var'].set(field_filter.value)
+            else:
+                filter_info['value1_var'].set(field_filter.value)
+                filter_info['value2_var'].set(field_filter.value2)
+    
+    def _field_filters(self):
+        """The field filters as entered in the filter panel"""
+        filters = []
+        for category_name, filter_info in self.filter_widgets.items():
+            operator = filter_info['operator_var'].get()
+            if 'value_var' in filter_info:
+                filters.append(FieldFilter(category_name, operator, filter_info['value_var'].get()))
+            else:
+                filters.append(FieldFilter(category_name, operator, filter_info['value1_var'].get(),
+                                           filter_info['value2_var'].get()))
+        return filters
     
     def clear_filters(self):
         """Clear all filters"""
@@ -1462,6 +1567,7 @@ Each tab maintains its own filters and view settings.
         
         # Reset filters to show all logs
         self.log_viewer.reset_filters()
+        self.view_start = 0
         self.refresh_display()
         self.update_statistics()
         self.update_status("Filters cleared")
@@ -1531,41 +1637,8 @@ Each tab maintains its own filters and view settings.
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    if file_path.endswith('.json'):
-                        # Export as JSON
-                        log_data = []
-                        for log in self.log_viewer.filtered_logs:
-                            log_data.append({
-                                'line_number': log.line_number,
-                                'raw_text': log.raw_text,
-                                'fields': log.fields
-                            })
-                        json.dump(log_data, f, indent=2)
-                    elif file_path.endswith('.csv'):
-                        # Export as CSV
-                        import csv
-                        writer = csv.writer(f)
-                        
-                        # Header
-                        headers = ['Line', 'Raw Text'] + [cat.name for cat in self.log_viewer.config_manager.categories]
-                        writer.writerow(headers)
-                        
-                        # Data
-                        for log in self.log_viewer.filtered_logs:
-                            row = [log.line_number, log.raw_text]
-                            for cat in self.log_viewer.config_manager.categories:
-                                value = log.get_field(cat.name)
-                                if isinstance(value, (dict, list)):
-                                    value = str(value)
-                                row.append(value)
-                            writer.writerow(row)
-                    else:
-                        # Export as text
-                        for log in self.log_viewer.filtered_logs:
-                            f.write(f"Line {log.line_number}: {log.raw_text}\n")
-                
-                messagebox.showinfo("Export", f"Exported {len(self.log_viewer.filtered_logs)} logs to {file_path}")
+                count = self.log_viewer.export_logs(file_path)
+                messagebox.showinfo("Export", f"Exported {count} logs to {file_path}")
                 
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
@@ -1587,7 +1660,7 @@ Each tab maintains its own filters and view settings.
                 # Update all existing tabs with new config if needed
                 for tab_id, tab_data in self.tabs.items():
                     # Reload with new config
-                    tab_data['log_viewer'].config_manager = temp_viewer.config_manager
+                    tab_data['log_viewer'].set_config_manager(temp_viewer.config_manager)
                     # Refresh tags for this tab
                     self.setup_text_tags_for_tab(tab_data['log_text'], tab_data['log_viewer'])
                 
@@ -1661,7 +1734,7 @@ For inquiries, please contact AndrewKWatts@gmail.com.
                 
                 # Also update all tabs with new config
                 for tab_id, tab_data in self.tabs.items():
-                    tab_data['log_viewer'].config_manager = temp_viewer.config_manager
+                    tab_data['log_viewer'].set_config_manager(temp_viewer.config_manager)
                     self.setup_text_tags_for_tab(tab_data['log_text'], tab_data['log_viewer'])
                 
                 # Always create filters based on the new config
@@ -1694,6 +1767,16 @@ For inquiries, please contact AndrewKWatts@gmail.com.
         # Load auto-refresh settings
         self.default_autorefresh_var.set(lvc.get('DefaultAutoRefresh', False))
         self.refresh_interval_var.set(str(lvc.get('RefreshInterval', 5)))
+        self.parse_workers_var.set(str(lvc.get('ParseWorkers', 1)))
+        self.lazy_fields_var.set(lvc.get('LazyFields', False))
+        self.block_parser_var.set(lvc.get('BlockParser', True))
+        self.search_index_var.set(lvc.get('SearchIndex', False))
+        self.columnar_store_var.set(lvc.get('ColumnarStore', False))
+        self.parse_cache_dir_var.set(lvc.get('ParseCacheDir', ''))
+        self.parse_cache_max_var.set(str(lvc.get('ParseCacheMaxMB', 1024)))
+        self.index_stride_var.set(str(lvc.get('IndexStride', 1)))
+        self.index_dir_var.set(lvc.get('IndexDir', ''))
+        self.decode_errors_var.set(lvc.get('DecodeErrors', 'replace'))
         
         # Load delimiters into the new UI
         delimiters = lvc.get('delimiters', {})
@@ -1755,7 +1838,7 @@ For inquiries, please contact AndrewKWatts@gmail.com.
             
             # Update all tabs with new config
             for tab_id, tab_data in self.tabs.items():
-                tab_data['log_viewer'].config_manager = temp_viewer.config_manager
+                tab_data['log_viewer'].set_config_manager(temp_viewer.config_manager)
                 self.setup_text_tags_for_tab(tab_data['log_text'], tab_data['log_viewer'])
             
             # Always create filters based on the new config
@@ -1806,6 +1889,8 @@ For inquiries, please contact AndrewKWatts@gmail.com.
                             }
                             if cat.description:
                                 cat_dict['description'] = cat.description
+                            if cat.format:
+                                cat_dict['format'] = cat.format
                             if cat.ColourType:
                                 cat_dict['ColourType'] = cat.ColourType
                                 cat_dict['Colouring'] = cat.Colouring
@@ -1814,15 +1899,29 @@ For inquiries, please contact AndrewKWatts@gmail.com.
             
             categories.append(cat_dict)
         
-        return {
-            'logViewerConfig': {
-                'LogFileFilters': filters,
-                'DefaultAutoRefresh': self.default_autorefresh_var.get(),
-                'RefreshInterval': int(self.refresh_interval_var.get() or 5),
-                'delimiters': delimiters,
-                'categories': categories
-            }
-        }
+        # Keep settings the editor does not show
+        lvc = {}
+        if self.log_viewer and self.log_viewer.config_manager:
+            lvc = dict(self.log_viewer.config_manager.config.get('logViewerConfig', {}))
+        
+        lvc.update({
+            'LogFileFilters': filters,
+            'DefaultAutoRefresh': self.default_autorefresh_var.get(),
+            'RefreshInterval': int(self.refresh_interval_var.get() or 5),
+            'ParseWorkers': int(self.parse_workers_var.get() or 1),
+            'LazyFields': self.lazy_fields_var.get(),
+            'BlockParser': self.block_parser_var.get(),
+            'SearchIndex': self.search_index_var.get(),
+            'ColumnarStore': self.columnar_store_var.get(),
+            'ParseCacheDir': self.parse_cache_dir_var.get().strip(),
+            'ParseCacheMaxMB': int(self.parse_cache_max_var.get() or 1024),
+            'IndexStride': int(self.index_stride_var.get() or 1),
+            'IndexDir': self.index_dir_var.get().strip(),
+            'DecodeErrors': self.decode_errors_var.get(),
+            'delimiters': delimiters,
+            'categories': categories
+        })
+        return {'logViewerConfig': lvc}
     
     # Delimiter Management Methods
     def create_delimiter_entry(self, delim_type, initial_value=""):
@@ -1916,7 +2015,8 @@ For inquiries, please contact AndrewKWatts@gmail.com.
                         'ColourType': cat.ColourType,
                         'Colouring': cat.Colouring,
                         'ColourMap': cat.ColourMap,
-                        'description': getattr(cat, 'description', '')
+                        'description': getattr(cat, 'description', ''),
+                        'format': cat.format
                     }
                     break
         
@@ -1999,10 +2099,8 @@ For inquiries, please contact AndrewKWatts@gmail.com.
                         # Folder-based tab - check for new files and reload existing ones
                         self.refresh_folder_tab(tab_id)
                     elif tab_data.get('file_path'):
-                        # Single file tab
-                        tab_data['log_viewer'].load_file(tab_data['file_path'])
-                        if self.active_tab == tab_id:
-                            self.refresh_display()
+                        # Single file tab - only parse what was appended
+                        self.refresh_file_tab(tab_id)
                     elif tab_data.get('merged_files'):
                         # Merged files tab
                         self.refresh_merged_tab(tab_id)
@@ -2026,6 +2124,46 @@ For inquiries, please contact AndrewKWatts@gmail.com.
             self.root.after_cancel(tab_data['refresh_timer'])
             tab_data['refresh_timer'] = None
     
+    def refresh_file_tab(self, tab_id):
+        """Read entries appended to a tab's file in the background"""
+        if tab_id not in self.tabs:
+            return
+        
+        tab_data = self.tabs[tab_id]
+        if tab_data.get('refresh_busy'):
+            return  # Previous refresh still running
+        tab_data['refresh_busy'] = True
+        log_viewer = tab_data['log_viewer']
+        
+        def poll():
+            try:
+                update = log_viewer.poll_file()
+            except Exception:
+                update = None  # Silently ignore errors during auto-refresh
+            self.root.after(0, lambda: self._on_file_tab_polled(tab_id, update))
+        
+        thread = threading.Thread(target=poll)
+        thread.daemon = True
+        thread.start()
+    
+    def _on_file_tab_polled(self, tab_id, update):
+        """Append the result of a background file poll to its tab"""
+        if tab_id not in self.tabs:
+            return
+        
+        tab_data = self.tabs[tab_id]
+        tab_data['refresh_busy'] = False
+        if not update:
+            return
+        
+        # The viewer runs its active filters over the new entries, or the reloaded file
+        tab_data['log_viewer'].apply_update(update)
+        if update.reload:
+            self.update_older_button(tab_id)
+        
+        if self.active_tab == tab_id:
+            self.refresh_display()
+    
     def refresh_folder_tab(self, tab_id):
         """Refresh a folder-based tab, checking for new files"""
         if tab_id not in self.tabs:
@@ -2043,16 +2181,14 @@ For inquiries, please contact AndrewKWatts@gmail.com.
             current_files = set()
             for root, dirs, files in os.walk(folder_path):
                 for file in files:
-                    if any(file.lower().endswith(ext.lower()) for ext in log_filters):
+                    if is_log_file(file, log_filters):
                         current_files.add(os.path.join(root, file))
             
             # For single file tabs from folder, just reload the existing file
             if tab_data.get('file_path'):
                 # Check if the file still exists
                 if tab_data['file_path'] in current_files:
-                    tab_data['log_viewer'].load_file(tab_data['file_path'])
-                    if self.active_tab == tab_id:
-                        self.refresh_display()
+                    self.refresh_file_tab(tab_id)
                 # Note: We don't add new files to individual file tabs
         except Exception as e:
             pass  # Silently handle errors
@@ -2072,7 +2208,7 @@ For inquiries, please contact AndrewKWatts@gmail.com.
                 current_files = []
                 for root, dirs, files in os.walk(folder_path):
                     for file in files:
-                        if any(file.lower().endswith(ext.lower()) for ext in log_filters):
+                        if is_log_file(file, log_filters):
                             current_files.append(os.path.join(root, file))
                 
                 # Check if we have new files
@@ -2097,31 +2233,32 @@ For inquiries, please contact AndrewKWatts@gmail.com.
             return
         
         tab_data = self.tabs[tab_id]
+        if tab_data.get('refresh_busy'):
+            return  # Previous reload still running
+        tab_data['refresh_busy'] = True
         tab_log_viewer = tab_data['log_viewer']
         
-        try:
-            all_logs = []
-            for file_path in file_paths:
-                if os.path.exists(file_path):  # Only load existing files
-                    temp_viewer = LogViewer(config_dict=tab_log_viewer.config_manager.config)
-                    temp_viewer.load_file(file_path)
-                    all_logs.extend(temp_viewer.logs)
-            
-            # Sort merged logs by timestamp if possible
+        def reload():
             try:
-                all_logs.sort(key=lambda log: log.get_field('Timestamp') or '')
-            except:
-                pass  # If sorting fails, keep original order
-            
-            # Update the tab's log viewer
-            tab_log_viewer.logs = all_logs
-            tab_log_viewer.filtered_logs = all_logs.copy()
-            
-            # Refresh display if this is the active tab
-            if self.active_tab == tab_id:
-                self.refresh_display()
-        except Exception as e:
-            pass  # Silently handle errors
+                # Only existing files are loaded, in parallel
+                tab_log_viewer.merge_files(file_paths)
+            except Exception as e:
+                pass  # Silently handle errors
+            self.root.after(0, lambda: self._on_merged_tab_reloaded(tab_id))
+        
+        thread = threading.Thread(target=reload)
+        thread.daemon = True
+        thread.start()
+    
+    def _on_merged_tab_reloaded(self, tab_id):
+        """Show the result of a background merged-tab reload"""
+        if tab_id not in self.tabs:
+            return
+        
+        self.tabs[tab_id]['refresh_busy'] = False
+        # Refresh display if this is the active tab
+        if self.active_tab == tab_id:
+            self.refresh_display()
     
     def run(self):
         """Start the GUI application"""
@@ -2249,6 +2386,10 @@ class CategoryEditDialog:
         if description:
             self.result['description'] = description
         
+        # Keep a configured timestamp layout
+        if self.initial_data.get('format'):
+            self.result['format'] = self.initial_data['format']
+        
         if self.color_type_var.get():
             self.result['ColourType'] = self.color_type_var.get()
             self.result['Colouring'] = self.coloring_var.get()
@@ -2435,6 +2576,10 @@ class ColorMappingDialog:
 
 def main():
     """Main entry point for GUI application"""
+    # Parse worker processes re-run this module when frozen by PyInstaller
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     app = LogViewerGUI()
     app.run()
 
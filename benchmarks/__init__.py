@@ -0,0 +1,17 @@
+#====== Log Viewer/benchmarks/__init__.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Log Viewer benchmarks: a seeded log generator and timed scenarios
+
+Run with: python -m benchmarks --help
+"""
+
+from .generator import LogGenerator, load_config, CONFIG_PATH
+from .scenarios import (Workload, SCENARIOS, DEFAULT_SCENARIOS, run_scenarios,
+                        compare_results, metric_direction)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+#====== Log Viewer/benchmarks/__main__.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Run the benchmark scenarios and write their results as JSON
+
+Usage: python -m benchmarks [--lines 1M] [--scenarios parse,filter|all] [--output results.json]
+                            [--compare baseline.json] [--seed N] [--multiline-ratio R]
+                            [--detail-keys N] [--tag-count N] [--repeat N] [--label TEXT]
+
+With --compare, metrics that got worse than the baseline by more than
+--tolerance are listed and the exit status is 1.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+
+from .generator import load_config
+from .scenarios import Workload, SCENARIOS, DEFAULT_SCENARIOS, run_scenarios, compare_results
+
+SIZE_SUFFIXES = {'K': 1000, 'M': 1000 ** 2}
+
+
+def parse_size(text: str) -> int:
+    """A line count such as 5000, 10K or 50M"""
+    text = text.strip().upper()
+    scale = SIZE_SUFFIXES.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def report(name, metrics):
+    """Print one scenario's metrics"""
+    print(f"{name}:")
+    if not metrics:
+        print("  skipped")
+    for metric, value in metrics.items():
+        print(f"  {metric:<28}{value:,.3f}" if isinstance(value, float) else f"  {metric:<28}{value:,}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Log Viewer benchmarks")
+    parser.add_argument("--lines", type=parse_size, default=100000, help="entries per generated file (1K to 50M)")
+    parser.add_argument("--scenarios", default=",".join(DEFAULT_SCENARIOS),
+                        help=f"comma-separated scenarios, or 'all' ({', '.join(SCENARIOS)})")
+    parser.add_argument("--config", help="configuration file (default: log_config.json)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--multiline-ratio", type=float, default=0.05, help="share of entries with a stack trace")
+    parser.add_argument("--detail-keys", type=int, default=3, help="key/value pairs in Details")
+    parser.add_argument("--tag-count", type=int, default=2, help="elements in Tags")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario; the best is kept")
+    parser.add_argument("--label", default="", help="name of this run, e.g. a version")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline results JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="change counted as a regression (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    names = list(SCENARIOS) if args.scenarios == "all" else [name.strip() for name in args.scenarios.split(",")]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workload = Workload(tmp, args.lines, load_config(args.config), seed=args.seed,
+                            multiline_ratio=args.multiline_ratio, detail_keys=args.detail_keys,
+                            tag_count=args.tag_count)
+        print(f"Benchmarks ({args.lines:,} lines, seed {args.seed})")
+        print("=" * 50)
+        results = run_scenarios(workload, names, repeat=args.repeat, label=args.label, report=report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, results, args.tolerance)
+        print(f"\nCompared with {baseline.get('label') or args.compare}:")
+        for row in rows:
+            flag = "  REGRESSION" if row['regression'] else ""
+            name = f"{row['scenario']}.{row['metric']}"
+            print(f"  {name:<40}{row['change']:.2f}x{flag}")
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+#====== Log Viewer/benchmarks/generator.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Seeded generator of synthetic log files laid out by a Log Viewer configuration
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# log_config.json shipped next to the application
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "log_config.json"
+
+LEVELS = ["INFO"] * 6 + ["DEBUG"] * 3 + ["WARNING"] * 2 + ["ERROR"]
+COMPONENTS = ["AuthService", "DatabaseService", "PaymentService", "StorageService",
+              "ApplicationService", "CacheService", "APIGateway", "NotificationService"]
+DETAIL_KEYS = ["action", "user", "status", "latency", "table", "endpoint", "method", "size",
+               "request", "session", "region", "attempt", "queue", "result", "reason", "host"]
+WORDS = ["login", "query", "charge", "upload", "evict", "ping", "success", "timeout", "denied",
+         "retry", "users", "orders", "cache", "primary", "replica", "GET", "POST", "ok"]
+TAGS = ["security", "database", "critical", "payment", "cache", "performance", "api",
+        "monitoring", "storage", "user_activity", "debug", "network"]
+ERROR_CODES = [0] * 8 + [1001, 1002, 2003, 3001, 5001]
+
+
+def load_config(path: Optional[str] = None) -> Dict:
+    """The configuration in log_config.json, or in another config file"""
+    with open(path or CONFIG_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _first(value) -> str:
+    """The first alternative of a delimiter setting, or '' if there is none"""
+    if isinstance(value, list):
+        return value[0] if value else ""
+    return value or ""
+
+
+class LogGenerator:
+    """Writes reproducible synthetic logs in the layout of a configuration
+
+    Every category of the configuration gets a plausible value for its type:
+    advancing timestamps, weighted log levels, Details made of detail_keys
+    key/value pairs, tag_count Tags and mostly-zero error codes. A share of
+    multiline_ratio entries carry a stack trace over several lines. The same
+    seed and settings always produce the same bytes.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, seed: int = 0, multiline_ratio: float = 0.0,
+                 detail_keys: int = 3, tag_count: int = 2, start: str = "2025-08-08 00:00:00"):
+        self.config = config or load_config()
+        self.seed = seed
+        self.multiline_ratio = multiline_ratio
+        self.detail_keys = max(0, min(detail_keys, len(DETAIL_KEYS)))
+        self.tag_count = max(0, tag_count)
+        self.start = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
+
+        lvc = self.config["logViewerConfig"]
+        delimiters = lvc["delimiters"]
+        self.entry_start = _first(delimiters.get("logStartDelimiter"))
+        self.entry_end = _first(delimiters.get("logEndDelimiter")) if self.entry_start else ""
+        self.category_separator = _first(delimiters["categorySeparator"])
+        self.pair_separator = _first(delimiters.get("keyValuePairsSeparator")) or ";"
+        self.key_value_separator = _first(delimiters.get("keyValueSeparator")) or "="
+        self.element_separator = _first(delimiters.get("arrayElementSeparator")) or ","
+        self.categories = sorted(lvc["categories"], key=lambda category: category.get("order", 0))
+
+    def entries(self, count: int) -> Iterator[str]:
+        """Yield count entries, each with its delimiters and a trailing newline"""
+        rng = random.Random(self.seed)
+        moment = self.start
+        for i in range(count):
+            moment += timedelta(milliseconds=rng.randrange(0, 2000))
+            multiline = rng.random() < self.multiline_ratio
+            values = [self._value(rng, category, moment, i, multiline) for category in self.categories]
+            yield f"{self.entry_start}{self.category_separator.join(values)}{self.entry_end}\n"
+
+    def write(self, path: str, count: int) -> int:
+        """Write count entries to a file; returns its size in bytes"""
+        size = 0
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            batch: List[str] = []
+            for entry in self.entries(count):
+                batch.append(entry)
+                if len(batch) >= 10000:
+                    size += f.write("".join(batch))
+                    batch.clear()
+            size += f.write("".join(batch))
+        return size
+
+    def _value(self, rng: random.Random, category: Dict, moment: datetime, i: int, multiline: bool) -> str:
+        """Text of one category of an entry"""
+        name = category["name"]
+        if category.get("type") == "datetime":
+            return moment.strftime("%Y-%m-%d %H:%M:%S")
+        if category.get("type") == "number":
+            return str(rng.choice(ERROR_CODES))
+        if name == "LogLevel":
+            return rng.choice(LEVELS)
+        if name == "Component":
+            return rng.choice(COMPONENTS)
+        if name == "Details":
+            keys = rng.sample(DETAIL_KEYS, self.detail_keys)
+            details = self.pair_separator.join(
+                f"{key}{self.key_value_separator}{rng.choice(WORDS)}{rng.randrange(100) if key == 'user' else ''}"
+                for key in keys)
+            if multiline:
+                details += "\nStack trace:" + "".join(
+                    f"\n  at Service.call{depth} (module{i % 50}.js:{rng.randrange(1, 400)})" for depth in range(3))
+            return details
+        if name == "Tags":
+            return self.element_separator.join(rng.choice(TAGS) for _ in range(self.tag_count))
+        return rng.choice(WORDS)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+#====== Log Viewer/benchmarks/scenarios.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Timed benchmark scenarios and the comparison of their JSON results
+
+Each scenario takes a Workload and returns its metrics by name. Metric
+names say which way is better: '..._per_second', 'speedup' and
+'reduction' are better higher, '...seconds' and '...bytes...' lower;
+anything else (such as 'entries') is informational.
+"""
+
+import copy
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Add the application directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from LogViewer import FieldFilter, LogViewer
+from .generator import LogGenerator, load_config
+
+
+class Workload:
+    """Generated log files shared by the scenarios of one run
+
+    Files are generated on first use, into directory, with the generator
+    settings of the run.
+    """
+
+    def __init__(self, directory: str, lines: int, config: Optional[Dict] = None, seed: int = 0,
+                 multiline_ratio: float = 0.0, detail_keys: int = 3, tag_count: int = 2):
+        self.directory = directory
+        self.lines = lines
+        self.config = config or load_config()
+        self.seed = seed
+        self.multiline_ratio = multiline_ratio
+        self.detail_keys = detail_keys
+        self.tag_count = tag_count
+        self._files: Dict[tuple, str] = {}
+
+    @property
+    def settings(self) -> Dict:
+        """Generator settings, as recorded in the results"""
+        return {'lines': self.lines, 'seed': self.seed, 'multiline_ratio': self.multiline_ratio,
+                'detail_keys': self.detail_keys, 'tag_count': self.tag_count}
+
+    def config_with(self, single_line: bool = False, **settings) -> Dict:
+        """A copy of the configuration with extra logViewerConfig settings
+
+        With single_line, the entry start and end delimiters are removed so
+        each line is an entry.
+        """
+        config = copy.deepcopy(self.config)
+        lvc = config['logViewerConfig']
+        lvc.update(settings)
+        if single_line:
+            lvc['delimiters'].pop('logStartDelimiter', None)
+            lvc['delimiters'].pop('logEndDelimiter', None)
+        return config
+
+    def file(self, name: str = "bench.log", lines: Optional[int] = None, seed: Optional[int] = None,
+             single_line: bool = False) -> str:
+        """Path of a generated file, written on first use"""
+        lines = self.lines if lines is None else lines
+        seed = self.seed if seed is None else seed
+        key = (name, lines, seed, single_line)
+        if key not in self._files:
+            generator = LogGenerator(self.config_with(single_line), seed=seed,
+                                     multiline_ratio=0.0 if single_line else self.multiline_ratio,
+                                     detail_keys=self.detail_keys, tag_count=self.tag_count)
+            path = os.path.join(self.directory, name)
+            generator.write(path, lines)
+            self._files[key] = path
+        return self._files[key]
+
+
+def _timed(function: Callable, *args, **kwargs):
+    """(result, seconds) of one call"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _loaded(workload: Workload, path: Optional[str] = None, **settings) -> LogViewer:
+    """A viewer with a generated file loaded in-process"""
+    viewer = LogViewer(config_dict=workload.config_with(**settings))
+    viewer.load_file(path or workload.file(), workers=1)
+    return viewer
+
+
+def scenario_parse(workload: Workload) -> Dict[str, float]:
+    """Load a file in-process"""
+    path = workload.file()
+    viewer = LogViewer(config_dict=workload.config_with())
+    count, seconds = _timed(viewer.load_file, path, workers=1)
+    return {'entries': count, 'seconds': seconds, 'entries_per_second': count / seconds,
+            'megabytes_per_second': os.path.getsize(path) / 2**20 / seconds}
+
+
+def scenario_filter(workload: Workload) -> Dict[str, float]:
+    """Filter a loaded file by log level, by a Details key, by a search term and by all three"""
+    viewer = _loaded(workload)
+    count = len(viewer.logs)
+    level = FieldFilter('LogLevel', 'equals', 'ERROR')
+    details = FieldFilter('Details', 'has key', 'user')
+    _, level_seconds = _timed(viewer.apply_filters, [level])
+    _, details_seconds = _timed(viewer.apply_filters, [details])
+    _, search_seconds = _timed(viewer.apply_filters, search='timeout')
+    _, combined_seconds = _timed(viewer.apply_filters, [level, details], search='timeout')
+    seconds = level_seconds + details_seconds + search_seconds
+    return {'entries': count, 'level_seconds': level_seconds, 'details_seconds': details_seconds,
+            'search_seconds': search_seconds, 'combined_seconds': combined_seconds,
+            'entries_per_second': 3 * count / seconds}
+
+
+def scenario_merge(workload: Workload, files: int = 4) -> Dict[str, float]:
+    """Merge several files with overlapping times into one view"""
+    lines = max(1, workload.lines // files)
+    paths = [workload.file(f"merge{i}.log", lines=lines, seed=workload.seed + i + 1) for i in range(files)]
+    viewer = LogViewer(config_dict=workload.config_with())
+    count, seconds = _timed(viewer.merge_files, paths, workers=1)
+    return {'entries': count, 'seconds': seconds, 'entries_per_second': count / seconds}
+
+
+def scenario_export(workload: Workload) -> Dict[str, float]:
+    """Export a loaded file as JSON and as CSV"""
+    viewer = _loaded(workload)
+    json_count, json_seconds = _timed(viewer.export_logs, os.path.join(workload.directory, "export.json"))
+    _, csv_seconds = _timed(viewer.export_logs, os.path.join(workload.directory, "export.csv"))
+    return {'entries': json_count, 'json_seconds': json_seconds, 'csv_seconds': csv_seconds,
+            'entries_per_second': 2 * json_count / (json_seconds + csv_seconds)}
+
+
+def _loaded_memory(workload: Workload, **settings) -> Dict[str, float]:
+    """Bytes held by a viewer after loading a file, and the peak while loading"""
+    tracemalloc.start()
+    try:
+        viewer = _loaded(workload, **settings)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    count = len(viewer.logs)
+    return {'entries': count, 'bytes_per_entry': current / count, 'peak_bytes_per_entry': peak / count}
+
+
+def scenario_memory(workload: Workload) -> Dict[str, float]:
+    """Memory held by the loaded logs"""
+    return _loaded_memory(workload)
+
+
+def scenario_store(workload: Workload) -> Dict[str, float]:
+    """Memory held by List[LogEntry] against a LogStore"""
+    listed = _loaded_memory(workload, ColumnarStore=False)
+    stored = _loaded_memory(workload, ColumnarStore=True)
+    return {'list_bytes_per_entry': listed['bytes_per_entry'], 'store_bytes_per_entry': stored['bytes_per_entry'],
+            'reduction': listed['bytes_per_entry'] / stored['bytes_per_entry']}
+
+
+def scenario_parallel(workload: Workload) -> Dict[str, float]:
+    """Serial against parallel load_file on the same file"""
+    path = workload.file()
+    workers = os.cpu_count() or 1
+    serial_count, serial_seconds = _timed(LogViewer(config_dict=workload.config_with()).load_file, path, workers=1)
+    _, parallel_seconds = _timed(LogViewer(config_dict=workload.config_with()).load_file, path, workers=workers)
+    return {'workers': workers, 'serial_seconds': serial_seconds, 'parallel_seconds': parallel_seconds,
+            'speedup': serial_seconds / parallel_seconds}
+
+
+def scenario_lazy(workload: Workload) -> Dict[str, float]:
+    """Eager against lazy field parsing: load, then count log levels"""
+    results = {}
+    for lazy in (False, True):
+        viewer = LogViewer(config_dict=workload.config_with(LazyFields=lazy))
+        _, load_seconds = _timed(viewer.load_file, workload.file(), workers=1)
+        _, read_seconds = _timed(viewer.get_stats)
+        label = "lazy" if lazy else "eager"
+        results[f'{label}_load_seconds'] = load_seconds
+        results[f'{label}_read_seconds'] = read_seconds
+    results['speedup'] = results['eager_load_seconds'] / results['lazy_load_seconds']
+    return results
+
+
+def scenario_compiled(workload: Workload) -> Dict[str, float]:
+    """The generated entry parser against the generic one"""
+    with open(workload.file(single_line=True), encoding="utf-8") as f:
+        texts = [line.strip() for line in f]
+    results = {}
+    for label in ("generic", "compiled"):
+        parser = LogViewer(config_dict=workload.config_with(single_line=True)).parser
+        parse = parser._parse_entry_generic if label == "generic" else parser._parse_entry
+        _, seconds = _timed(lambda: [parse(text, number, False) for number, text in enumerate(texts, 1)])
+        results[f'{label}_entries_per_second'] = len(texts) / seconds
+    results['speedup'] = results['compiled_entries_per_second'] / results['generic_entries_per_second']
+    return results
+
+
+def scenario_block(workload: Workload) -> Dict[str, float]:
+    """Loading single-line logs with and without the NumPy block parser"""
+    path = workload.file(single_line=True)
+    results = {}
+    for block in (False, True):
+        viewer = LogViewer(config_dict=workload.config_with(single_line=True, BlockParser=block))
+        if block and not viewer.parser.block_columns:
+            return {}  # NumPy is not installed
+        count, seconds = _timed(viewer.load_file, path, workers=1)
+        results[f'{"block" if block else "scalar"}_entries_per_second'] = count / seconds
+    results['speedup'] = results['block_entries_per_second'] / results['scalar_entries_per_second']
+    return results
+
+
+def scenario_search(workload: Workload) -> Dict[str, float]:
+    """The search box scanning the loaded logs against the trigram search index, for a common and a rare term"""
+    viewer = _loaded(workload, SearchIndex=True)
+    _, index_seconds = _timed(viewer.prepare_search_index, background=False)
+    # The tail of one entry's text (its Details and Tags) is rare in generated logs
+    rare = viewer.logs[len(viewer.logs) // 2].raw_text.splitlines()[0][-40:]
+    results = {'entries': len(viewer.logs), 'index_seconds': index_seconds}
+    for label, term in (('common', 'timeout'), ('rare', rare)):
+        _, scan_seconds = _timed(viewer.filter_engine.apply, viewer.logs, search=term)
+        _, indexed_seconds = _timed(viewer.apply_filters, search=term)
+        results[f'{label}_scan_seconds'] = scan_seconds
+        results[f'{label}_indexed_seconds'] = indexed_seconds
+    results['speedup'] = results['rare_scan_seconds'] / results['rare_indexed_seconds']
+    return results
+
+
+# Scenarios by name; the first five run by default
+SCENARIOS = {
+    'parse': scenario_parse,
+    'filter': scenario_filter,
+    'merge': scenario_merge,
+    'export': scenario_export,
+    'memory': scenario_memory,
+    'store': scenario_store,
+    'parallel': scenario_parallel,
+    'lazy': scenario_lazy,
+    'compiled': scenario_compiled,
+    'block': scenario_block,
+    'search': scenario_search,
+}
+
+DEFAULT_SCENARIOS = ['parse', 'filter', 'merge', 'export', 'memory']
+
+
+def metric_direction(metric: str) -> int:
+    """1 if a metric is better higher, -1 if better lower, 0 if it is informational"""
+    if metric.endswith(('per_second', 'speedup', 'reduction')):
+        return 1
+    if metric.endswith('seconds') or 'bytes' in metric:
+        return -1
+    return 0
+
+
+def _best(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """Best value of each metric over repeated runs"""
+    best = dict(runs[0])
+    for run in runs[1:]:
+        for metric, value in run.items():
+            direction = metric_direction(metric)
+            if direction and (value - best[metric]) * direction > 0:
+                best[metric] = value
+    return best
+
+
+def run_scenarios(workload: Workload, names: Iterable[str] = DEFAULT_SCENARIOS, repeat: int = 1,
+                  label: str = "", report: Optional[Callable[[str, Dict[str, float]], None]] = None) -> Dict:
+    """Run scenarios on a workload and return the results as a JSON-ready dict
+
+    Each scenario runs repeat times and keeps the best value of each metric.
+    report is called with (name, metrics) as each scenario finishes.
+    """
+    results = {}
+    for name in names:
+        metrics = _best([SCENARIOS[name](workload) for _ in range(max(1, repeat))])
+        results[name] = metrics
+        if report:
+            report(name, metrics)
+    return {
+        'label': label,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'settings': workload.settings,
+        'results': results,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, tolerance: float = 0.1) -> List[Dict]:
+    """Metrics present in both results, with their change and whether it is a regression
+
+    change is current / baseline; a regression is a change for the worse of
+    more than tolerance (0.1 = 10%).
+    """
+    rows = []
+    for name, metrics in current['results'].items():
+        old_metrics = baseline['results'].get(name, {})
+        for metric, value in metrics.items():
+            direction = metric_direction(metric)
+            old = old_metrics.get(metric)
+            if not direction or not old:
+                continue
+            change = value / old
+            worse = change < 1 - tolerance if direction > 0 else change > 1 + tolerance
+            rows.append({'scenario': name, 'metric': metric, 'baseline': old, 'current': value,
+                         'change': change, 'regression': worse})
+    return rows
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_auto_refresh.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for incremental (tail) refresh of loaded log files
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, FieldFilter
+
+SINGLE_LINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Message", "type": "string", "order": 3}
+        ]
+    }
+}
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": dict(SINGLE_LINE_CONFIG["logViewerConfig"]["delimiters"],
+                           logStartDelimiter="[", logEndDelimiter="]###"),
+        "categories": SINGLE_LINE_CONFIG["logViewerConfig"]["categories"]
+    }
+}
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def _full_parse(config, path):
+    viewer = LogViewer(config_dict=config)
+    viewer.load_file(path)
+    return [(log.line_number, log.raw_text) for log in viewer.logs]
+
+
+def test_appended_lines_only():
+    """Refresh parses only appended lines and completes a partial last line"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _append(path, "t1|INFO|started\nt2|DEBUG|half")
+
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        assert viewer.load_file(path) == 2
+        assert viewer.refresh_file() == 0  # Nothing appended yet
+
+        _append(path, " done\nt3|ERROR|boom\n")
+        offset_before = viewer.checkpoint.offset
+        assert viewer.refresh_file() == 2
+        assert viewer.checkpoint.offset > offset_before
+        assert [log.raw_text for log in viewer.logs] == ["t1|INFO|started", "t2|DEBUG|half done", "t3|ERROR|boom"]
+        assert len(viewer.filtered_logs) == 3
+        assert [(log.line_number, log.raw_text) for log in viewer.logs] == _full_parse(SINGLE_LINE_CONFIG, path)
+
+
+def test_filtered_view_is_kept():
+    """New entries are not forced into an active filter"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _append(path, "t1|INFO|a\nt2|ERROR|b\n")
+
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        viewer.load_file(path)
+        viewer.filter_by_field('LogLevel', 'ERROR')
+
+        _append(path, "t3|INFO|c\n")
+        update = viewer.poll_file()
+        assert [log.raw_text for log in viewer.apply_update(update)] == ["t3|INFO|c"]
+        assert len(viewer.logs) == 3
+        assert [log.raw_text for log in viewer.filtered_logs] == ["t2|ERROR|b"]
+
+
+def test_filters_stay_active():
+    """New and reloaded entries pass through the active filters, even ones that kept every entry"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _append(path, "t1|ERROR|a\nt2|ERROR|b\n")
+
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        viewer.load_file(path)
+        assert viewer.apply_filters([FieldFilter("LogLevel", "equals", "ERROR")]) == 2
+
+        _append(path, "t3|INFO|c\nt4|ERROR|d\n")
+        assert viewer.refresh_file() == 2
+        assert [log.raw_text for log in viewer.filtered_logs] == ["t1|ERROR|a", "t2|ERROR|b", "t4|ERROR|d"]
+
+        # Truncated: the whole file is filtered again
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("t9|INFO|fresh\nt10|ERROR|kept\n")
+        assert viewer.refresh_file() == 2
+        assert [log.raw_text for log in viewer.filtered_logs] == ["t10|ERROR|kept"]
+
+        viewer.reset_filters()
+        _append(path, "t11|INFO|shown\n")
+        viewer.refresh_file()
+        assert len(viewer.filtered_logs) == 3
+
+
+def test_truncation_and_rotation_reload():
+    """Truncated or replaced files are parsed again from the start"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _append(path, "t1|INFO|a\nt2|INFO|b\n")
+
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        viewer.load_file(path)
+
+        # Truncate (copytruncate style)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("t9|WARNING|fresh\n")
+        update = viewer.poll_file()
+        assert update.reload
+        viewer.apply_update(update)
+        assert [log.raw_text for log in viewer.logs] == ["t9|WARNING|fresh"]
+
+        # Rotate (rename and recreate), new file larger than the old one
+        os.rename(path, path + ".1")
+        _append(path, "t10|INFO|rotated and longer than before\nt11|INFO|x\n")
+        update = viewer.poll_file()
+        assert update.reload
+        viewer.apply_update(update)
+        assert len(viewer.logs) == 2 and viewer.logs[0].line_number == 1
+
+
+def test_delimited_entries_resume():
+    """Multi-line entries split between refreshes are parsed once complete"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _append(path, "[t1|INFO|one]###\n[t2|ERROR|two\nstack")
+
+        viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+        assert viewer.load_file(path) == 2  # Unterminated entry is shown
+
+        _append(path, " trace]###\n[t3|INFO|thr")
+        viewer.refresh_file()
+        _append(path, "ee]###\n")
+        viewer.refresh_file()
+
+        assert [log.raw_text for log in viewer.logs] == ["t1|INFO|one", "t2|ERROR|two\nstack trace", "t3|INFO|three"]
+        assert [log.line_number for log in viewer.logs] == [1, 2, 3]
+        assert viewer.logs[1].is_multiline
+        assert [(log.line_number, log.raw_text) for log in viewer.logs] == _full_parse(MULTILINE_CONFIG, path)
+
+
+if __name__ == "__main__":
+    test_appended_lines_only()
+    test_filtered_view_is_kept()
+    test_filters_stay_active()
+    test_truncation_and_rotation_reload()
+    test_delimited_entries_resume()
+    print("Auto-refresh tests passed!")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_benchmarks.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the benchmark generator and scenarios
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer
+from benchmarks import LogGenerator, Workload, load_config, run_scenarios, compare_results, SCENARIOS
+from benchmarks.__main__ import parse_size
+
+
+def test_generator_is_seeded_and_parses():
+    """The same seed gives the same file, which parses entry for entry"""
+    config = load_config()
+    generator = LogGenerator(config, seed=7, multiline_ratio=0.2, detail_keys=5, tag_count=4)
+    assert list(generator.entries(50)) == list(LogGenerator(config, seed=7, multiline_ratio=0.2,
+                                                            detail_keys=5, tag_count=4).entries(50))
+    assert list(generator.entries(50)) != list(LogGenerator(config, seed=8).entries(50))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "gen.log")
+        generator.write(path, 300)
+        viewer = LogViewer(config_dict=config)
+        assert viewer.load_file(path) == 300
+        assert any(log.is_multiline for log in viewer.logs)
+        details = viewer.logs[0].get_field('Details')
+        assert isinstance(details, dict) and len(details) == 5
+        assert len(viewer.logs[0].get_field('Tags')) == 4
+        assert all(log.get_epoch('Timestamp') is not None for log in viewer.logs)
+
+
+def test_scenarios_write_comparable_results():
+    """Every scenario runs on a small workload and compares with an earlier run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        workload = Workload(tmp, 200, multiline_ratio=0.1)
+        results = run_scenarios(workload, SCENARIOS, label="test")
+        results = json.loads(json.dumps(results))
+        assert set(results['results']) == set(SCENARIOS)
+        assert results['results']['parse']['entries'] == 200
+        assert results['settings']['lines'] == 200
+
+    slower = json.loads(json.dumps(results))
+    slower['results']['parse']['seconds'] *= 2
+    slower['results']['parse']['entries_per_second'] /= 2
+    rows = {(row['scenario'], row['metric']): row for row in compare_results(results, slower)}
+    assert rows[('parse', 'seconds')]['regression']
+    assert rows[('parse', 'entries_per_second')]['regression']
+    assert not rows[('export', 'json_seconds')]['regression']
+    assert ('parse', 'entries') not in rows
+    assert parse_size("50M") == 50000000 and parse_size("1k") == 1000 and parse_size("2500") == 2500
+
+
+if __name__ == "__main__":
+    test_generator_is_seeded_and_parses()
+    test_scenarios_write_comparable_results()
+    print("Benchmark tests passed!")
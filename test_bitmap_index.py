@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_bitmap_index.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the per-value bitmap indexes of string categories
+"""
+
+import sys
+import os
+import random
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, FilterEngine, LogStore, FieldFilter, RowBitmap, BITMAP_INDEX_MAX_VALUES
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "RequestId", "type": "string", "order": 4},
+            {"name": "ErrorCode", "type": "number", "order": 5}
+        ]
+    }
+}
+
+LEVELS = ["INFO", "DEBUG", "WARN", "ERROR"]
+COMPONENTS = ["Auth", "Database", "Cache", "Api", "Queue"]
+
+FILTER_SETS = [
+    [FieldFilter("LogLevel", "equals", "error")],
+    [FieldFilter("LogLevel", "not equals", "INFO")],
+    [FieldFilter("Component", "contains any", "auth, cache")],
+    [FieldFilter("LogLevel", "not equals", "debug"), FieldFilter("Component", "not contains", "a")],
+    [FieldFilter("LogLevel", "equals", "WARN"), FieldFilter("ErrorCode", "greater than", "500")],
+    [FieldFilter("RequestId", "starts with", "req-1")],
+]
+
+
+def _entry(i, partial=False):
+    text = (f"[2025-08-08 10:{i // 60 % 60:02d}:{i % 60:02d}|{LEVELS[i * 7 % 4]}|{COMPONENTS[i % 5]}|"
+            f"req-{i}|{i * 37 % 1000}")
+    return text if partial else text + "]###\n"
+
+
+def _small_chunks(test):
+    """Run a test with 8-row bitmap chunks, so a small file spans many chunks"""
+    saved = log_viewer_module.BITMAP_CHUNK_BITS
+    log_viewer_module.BITMAP_CHUNK_BITS = 3
+    try:
+        test()
+    finally:
+        log_viewer_module.BITMAP_CHUNK_BITS = saved
+
+
+def _check(viewer):
+    """Indexed filters keep the entries that testing every entry keeps"""
+    for filters in FILTER_SETS:
+        for search in ("", "req-2"):
+            expected = FilterEngine(viewer.config_manager).apply(viewer.logs, filters, search=search)
+            count = viewer.apply_filters(filters, search=search)
+            assert [log.line_number for log in viewer.filtered_logs] == \
+                [log.line_number for log in expected], (filters, search)
+            assert count == len(expected)
+
+
+def test_row_bitmap_operations():
+    """&, |, - and invert agree with sets of rows"""
+    def check():
+        rng = random.Random(5)
+        size = 200
+        for _ in range(20):
+            a = {rng.randrange(size) for _ in range(rng.randrange(size))}
+            b = {rng.randrange(size) for _ in range(rng.randrange(size))}
+            left, right = RowBitmap.from_rows(a), RowBitmap.from_rows(b)
+            assert list(left) == sorted(a) and len(left) == len(a)
+            assert list(left & right) == sorted(a & b)
+            assert list(left | right) == sorted(a | b)
+            assert list(left - right) == sorted(a - b)
+            assert list(left.invert(size - 3)) == sorted(set(range(size - 3)) - a)
+    check()
+    _small_chunks(check)
+
+
+def test_indexed_filters_match_scan():
+    """Lists and LogStores filter the same with and without bitmaps, across chunks"""
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("".join(_entry(i) for i in range(300)))
+            for store in (False, True):
+                config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+                viewer = LogViewer(config_dict=config)
+                viewer.load_file(path, workers=1)
+                assert isinstance(viewer.logs, LogStore) == store
+                _check(viewer)
+                bitmaps = viewer.column_index._bitmaps
+                assert bitmaps["LogLevel"].usable and bitmaps["Component"].usable
+                # One value per request, too many to index
+                assert not bitmaps["RequestId"].usable
+    _small_chunks(check)
+
+
+def test_index_follows_refresh():
+    """Appended entries, and an incomplete last entry that is re-read, are indexed"""
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("".join(_entry(i) for i in range(45)) + _entry(45, partial=True))
+            for store in (False, True):
+                config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+                viewer = LogViewer(config_dict=config)
+                viewer.load_file(path, workers=1)
+                _check(viewer)
+                index = viewer.column_index
+
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("0]###\n" + "".join(_entry(i) for i in range(46, 70)) + _entry(70, partial=True))
+                assert viewer.refresh_file() > 0
+                _check(viewer)
+                assert viewer.column_index is index
+
+                # Restore the file for the next storage mode
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("".join(_entry(i) for i in range(45)) + _entry(45, partial=True))
+    _small_chunks(check)
+
+
+def test_many_values_fall_back_to_scanning():
+    """A category past BITMAP_INDEX_MAX_VALUES distinct values is filtered entry by entry"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(f"[2025-08-08 10:00:00|INFO|Component{i}|req-1|1]###\n"
+                            for i in range(BITMAP_INDEX_MAX_VALUES + 10)))
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path, workers=1)
+        assert viewer.apply_filters([FieldFilter("Component", "equals", "component7")]) == 1
+        assert viewer.column_index.string_rows("Component", lambda value: True) is None
+
+
+if __name__ == "__main__":
+    test_row_bitmap_operations()
+    test_indexed_filters_match_scan()
+    test_index_follows_refresh()
+    test_many_values_fall_back_to_scanning()
+    print("Bitmap index tests passed!")
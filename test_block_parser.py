@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_block_parser.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the NumPy block parser (skipped when NumPy is not installed)
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer
+
+CATEGORIES = [
+    {"name": "Timestamp", "type": "datetime", "order": 1},
+    {"name": "LogLevel", "type": "string", "order": 2},
+    {"name": "Details", "type": "string", "order": 3},
+    {"name": "ErrorCode", "type": "number", "order": 4}
+]
+
+# Rows the block parser converts, and rows it leaves to the scalar path
+LINES = [
+    "2025-08-08 06:50:00|INFO|action=login;user=jöhn|0",
+    "2025-08-08 06:50:01|ERROR|note=naïve ✓|-1001",
+    "2024-02-29 23:59:59|WARN|leap|123456789012345678",
+    "2025-08-08 06:50:02.250Z|INFO|fraction|12.5",
+    "2025-02-29 00:00:00|INFO|not a leap year|+7",
+    "2025-08-08 24:00:00|INFO|bad hour| 42 ",
+    "0000-01-01 00:00:00|INFO|year zero|1234567890123456789",
+    "1970-01-01 00:00:00|DEBUG|epoch|-",
+    "2025-08-08 06:50:03|DEBUG",
+    "2025-08-08 06:50:04",
+    "|||",
+    "08/07/2025 10:00:00|INFO|other layout|5",
+    "2025-08-08 06:50:05|INFO|a|b|c|6",
+    # The layout inferred for an entry must not leak past the ISO entries after it
+    "12/25/2025 10:00:00|INFO|month first|1",
+    "2025-08-08 06:50:06|INFO|iso|2",
+    "08/07/2025 10:00:00|INFO|day first|3",
+]
+
+
+def _config(**settings):
+    return {"logViewerConfig": dict({
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": CATEGORIES
+    }, **settings)}
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, dict(log.fields), dict(log.epochs)) for log in logs]
+
+
+def test_blocks_match_scalar_parser():
+    """Block and scalar parsing give the same entries, across block boundaries"""
+    if log_viewer_module.np is None:
+        print("NumPy not installed, skipping")
+        return
+    original_rows = log_viewer_module.BLOCK_PARSE_ROWS
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(LINES * 3) + "\n")
+
+            scalar = LogViewer(config_dict=_config(BlockParser=False))
+            assert not scalar.parser.block_columns
+            expected = _snapshot(scalar.parser.iter_entries(path))
+
+            for rows in (1, 5, 4096):
+                log_viewer_module.BLOCK_PARSE_ROWS = rows
+                viewer = LogViewer(config_dict=_config())
+                assert viewer.parser.block_columns == [(0, 'timestamp'), (3, 'number')]
+                assert _snapshot(viewer.parser.iter_entries(path)) == expected
+
+            logs = LogViewer(config_dict=_config()).parser._parse_single_line_logs("\n".join(LINES))
+            assert _snapshot(logs) == expected[:len(LINES)]
+            assert logs[2].get_field('ErrorCode') == 123456789012345678
+            assert logs[2].get_epoch('Timestamp') == 1709251199 * 1_000_000
+    finally:
+        log_viewer_module.BLOCK_PARSE_ROWS = original_rows
+
+
+def test_block_parser_only_for_single_byte_separators():
+    """Alternative or multi-byte separators keep the scalar parser"""
+    config = _config()
+    config["logViewerConfig"]["delimiters"]["categorySeparator"] = ["|", "\t"]
+    assert LogViewer(config_dict=config).parser.block_columns is None
+    config["logViewerConfig"]["delimiters"]["categorySeparator"] = "¦"
+    assert LogViewer(config_dict=config).parser.block_columns is None
+    assert LogViewer(config_dict=_config(LazyFields=True)).parser.block_columns is None
+
+
+if __name__ == "__main__":
+    test_blocks_match_scalar_parser()
+    test_block_parser_only_for_single_byte_separators()
+    print("Block parser tests passed!")
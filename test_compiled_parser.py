@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_compiled_parser.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the generated entry parser
+"""
+
+import sys
+import pickle
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LogCategory, FieldType
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Details", "type": "structured_string", "order": 3},
+            {"name": "ErrorCode", "type": "number", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5}
+        ]
+    }
+}
+
+TEXTS = [
+    "2025-08-08 06:50:00|INFO|action=login;user=bob|0|a,b",
+    "2025-08-08 06:50:01|ERROR|(code=7)|12.5|x",
+    "not a time|WARN|plain|n/a",
+    "2025-08-08 06:50:02|DEBUG",
+    "|||",
+]
+
+
+def _snapshot(entry):
+    return (entry.raw_text, entry.line_number, entry.is_multiline, dict(entry.fields), dict(entry.epochs))
+
+
+def test_compiled_matches_generic():
+    """Generated and generic parsers produce the same entries"""
+    compiled = LogViewer(config_dict=CONFIG).parser
+    generic = LogViewer(config_dict=CONFIG).parser
+    for number, text in enumerate(TEXTS * 2, 1):
+        assert _snapshot(compiled._parse_log_entry(text, number, True)) == \
+            _snapshot(generic._parse_entry_generic(text, number, True))
+
+    entry = compiled._parse_log_entry(TEXTS[0], 1)
+    assert entry.get_field('ErrorCode') == 0
+    assert entry.get_field('Details') == {'action': 'login', 'user': 'bob'}
+    assert compiled._parse_log_entry(TEXTS[2], 3).get_field('ErrorCode') is None
+
+
+def test_unknown_types_parse_as_strings():
+    """Old type names such as 'structured_string' fall back to strings"""
+    assert LogCategory(name="x", type="structured_string", order=1).get_field_type() == FieldType.STRING
+    assert LogCategory(name="x", type="number", order=1).get_field_type() == FieldType.NUMBER
+
+
+def test_parser_pickles_without_generated_code():
+    """Unpickled parsers regenerate their entry parser"""
+    parser = LogViewer(config_dict=CONFIG).parser
+    parser._parse_log_entry(TEXTS[0], 1)
+    copy = pickle.loads(pickle.dumps(parser))
+    assert _snapshot(copy._parse_log_entry(TEXTS[1], 2)) == _snapshot(parser._parse_log_entry(TEXTS[1], 2))
+    assert copy._parse_entry is not parser._parse_entry
+
+
+if __name__ == "__main__":
+    test_compiled_matches_generic()
+    test_unknown_types_parse_as_strings()
+    test_parser_pickles_without_generated_code()
+    print("Compiled parser tests passed!")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_compressed.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for reading compressed log files
+"""
+
+import sys
+import os
+import bz2
+import gzip
+import lzma
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, LogIndex, GzipReader, is_log_file
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+CATEGORIES = [
+    {"name": "Timestamp", "type": "datetime", "order": 1},
+    {"name": "LogLevel", "type": "string", "order": 2},
+    {"name": "Component", "type": "string", "order": 3},
+    {"name": "Details", "type": "string", "order": 4}
+]
+
+DELIMITERS = {
+    "categorySeparator": "|",
+    "keyValuePairsSeparator": ";",
+    "keyValueSeparator": "=",
+    "arrayElementSeparator": ","
+}
+
+
+def _config(**settings):
+    return {"logViewerConfig": dict({"delimiters": DELIMITERS, "categories": CATEGORIES}, **settings)}
+
+
+def _lines(count, start=0):
+    return "".join(f"2025-08-08 {i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}|INFO|Svc{i % 3}|n={i}\n"
+                   for i in range(start, start + count)).encode("utf-8")
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, dict(log.fields)) for log in logs]
+
+
+def test_compressed_files_parse_like_plain_files():
+    """gzip, bz2 and xz files are streamed through a decompressor"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        data = _lines(500)
+        with open(path, "wb") as f:
+            f.write(data)
+        viewer = LogViewer(config_dict=_config())
+        viewer.load_file(path)
+        expected = _snapshot(viewer.logs)
+
+        for suffix, module in ((".gz", gzip), (".bz2", bz2), (".xz", lzma)):
+            with module.open(path + suffix, "wb") as f:
+                f.write(data)
+            viewer = LogViewer(config_dict=_config())
+            assert viewer.load_file(path + suffix) == 500
+            assert _snapshot(viewer.logs) == expected
+            assert viewer.poll_file() is None
+
+            viewer.load_page(path + suffix, viewer.find_line(path + suffix, 321), 5)
+            assert _snapshot(viewer.logs) == expected[320:325]
+
+
+def test_folder_filters_match_compressed_names():
+    """LogFileFilters extensions also match under a compression suffix"""
+    filters = [".txt", ".log"]
+    assert is_log_file("app.log", filters)
+    assert is_log_file("APP.LOG.GZ", filters)
+    assert is_log_file("app.txt.bz2", filters)
+    assert is_log_file("app.log.xz", filters)
+    assert not is_log_file("app.log.lvidx", filters)
+    assert not is_log_file("archive.tar.gz", filters)
+    assert is_log_file("archive.gz", [".gz"])
+
+
+def test_gzip_seek_points():
+    """Seeks resume from member starts and decompressor copies"""
+    original_span = log_viewer_module.GZIP_SEEK_SPAN
+    log_viewer_module.GZIP_SEEK_SPAN = 16 * 1024
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log.gz")
+            # A rotated-and-appended file: three gzip members
+            data = b""
+            with open(path, "wb") as f:
+                for start in (0, 20000, 40000):
+                    member = _lines(20000, start)
+                    f.write(gzip.compress(member))
+                    data += member
+
+            points = []
+            with GzipReader(path, points) as reader:
+                assert reader.read() == data
+            member_points = [point for point in points if point[2] is None]
+            # Each member end is also where an appended member would start
+            assert [point[0] for point in member_points] == \
+                [0, len(_lines(20000)), len(_lines(40000)), len(data)]
+            assert len(points) > len(member_points)
+
+            with GzipReader(path, points) as reader:
+                for offset in (len(data) - 10, 5, 700000, 1500000, 0):
+                    reader.seek(offset)
+                    assert reader.read(100) == data[offset:offset + 100]
+
+            viewer = LogViewer(config_dict=_config(IndexStride=64, IndexDir=tmp))
+            index = viewer.open_index(path)
+            assert index.count == 60000
+            assert len(index.seek_points) > 3
+            saved = LogIndex.load(path, viewer.config_hash, tmp)
+            assert saved.seek_points == [point[:2] + (None,) for point in member_points]
+            viewer.load_page(path, viewer.find_time(path, "2025-08-08 13:53:20"), 2)
+            assert [log.get_field('Details') for log in viewer.logs] == [{'n': '50000'}, {'n': '50001'}]
+    finally:
+        log_viewer_module.GZIP_SEEK_SPAN = original_span
+
+
+def test_gzip_copy_is_saved_with_seek_points():
+    """A single-member gzip file is paged through a copy whose seek points are saved"""
+    original_span = log_viewer_module.GZIP_SEEK_SPAN
+    log_viewer_module.GZIP_SEEK_SPAN = 16 * 1024
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log.gz")
+            with open(path, "wb") as f:
+                f.write(gzip.compress(_lines(30000)))
+            index_dir = os.path.join(tmp, "index")
+            viewer = LogViewer(config_dict=_config(IndexStride=64, IndexDir=index_dir))
+            index = viewer.open_index(path)
+            assert len(index.copy_points) > 10
+            with gzip.open(index.copy_path(), "rb") as f:
+                assert f.read() == _lines(30000)
+
+            # A reloaded index seeks into the copy without the decompressor state
+            saved = LogIndex.load(path, viewer.config_hash, index_dir)
+            assert saved.copy_points == index.copy_points
+            viewer = LogViewer(config_dict=_config(IndexStride=64, IndexDir=index_dir))
+            viewer.load_page(path, 25000, 2)
+            assert [log.get_field('Details') for log in viewer.logs] == [{'n': '25000'}, {'n': '25001'}]
+
+            # An appended member extends the copy
+            with open(path, "ab") as f:
+                f.write(gzip.compress(_lines(100, 30000)))
+            assert viewer.open_index(path).count == 30100
+            assert viewer.indexes[path].copy_points[-1][0] == len(_lines(30100))
+            viewer.load_page(path, 30050, 1)
+            assert viewer.logs[0].get_field('Details') == {'n': '30050'}
+
+            # Without its copy, a reloaded index reads the file itself
+            os.remove(index.copy_path())
+            viewer = LogViewer(config_dict=_config(IndexStride=64, IndexDir=index_dir))
+            viewer.load_page(path, 30050, 1)
+            assert viewer.logs[0].get_field('Details') == {'n': '30050'}
+    finally:
+        log_viewer_module.GZIP_SEEK_SPAN = original_span
+
+
+def test_compressed_delimited_entries():
+    """Delimited entries are found in a decompressed stream"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = _config(IndexStride=2, IndexDir=tmp)
+        config["logViewerConfig"]["delimiters"] = dict(DELIMITERS, logStartDelimiter="[", logEndDelimiter="]###")
+        viewer = LogViewer(config_dict=config)
+        viewer.load_file(SAMPLE_FILE)
+        expected = [(log.line_number, log.raw_text) for log in viewer.logs]
+
+        path = os.path.join(tmp, "sample.log.gz")
+        with open(SAMPLE_FILE, "rb") as src, gzip.open(path, "wb") as dst:
+            dst.write(src.read())
+        viewer.load_file(path)
+        assert [(log.line_number, log.raw_text) for log in viewer.logs] == expected
+        assert viewer.open_index(path).delimited
+        viewer.load_page(path, 9, 4)
+        assert [(log.line_number, log.raw_text) for log in viewer.logs] == expected[9:13]
+
+
+if __name__ == "__main__":
+    test_compressed_files_parse_like_plain_files()
+    test_folder_filters_match_compressed_names()
+    test_gzip_seek_points()
+    test_gzip_copy_is_saved_with_seek_points()
+    test_compressed_delimited_entries()
+    print("Compressed file tests passed!")
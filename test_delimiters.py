@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_delimiters.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for delimiter alternatives
+"""
+
+import sys
+import pickle
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, DelimiterAlternatives, LogStore
+
+CATEGORIES = [
+    {"name": "Timestamp", "type": "datetime", "order": 1},
+    {"name": "LogLevel", "type": "string", "order": 2},
+    {"name": "Details", "type": "string", "order": 3},
+    {"name": "Tags", "type": "string", "order": 4}
+]
+
+
+def _viewer(**settings):
+    return LogViewer(config_dict={"logViewerConfig": dict({
+        "delimiters": {
+            "ContainerStartDelimiter": ["{", "["],
+            "ContainerEndDelimiter": ["}", "]"],
+            "categorySeparator": ["|", "\t"],
+            "keyValuePairsSeparator": [";", "&"],
+            "keyValueSeparator": ["=", ":"],
+            "arrayElementSeparator": [",", ";"]
+        },
+        "categories": CATEGORIES
+    }, **settings)})
+
+
+def test_alternatives_split_in_one_pass():
+    """Every alternative splits, the longest first"""
+    assert DelimiterAlternatives(["=", ":"]).split("a=1:2", 1) == ["a", "1:2"]
+    assert DelimiterAlternatives([";", "&"]).split("a;b&c") == ["a", "b", "c"]
+    assert DelimiterAlternatives(["|", "||"]).split("a||b|c") == ["a", "b", "c"]
+    assert DelimiterAlternatives("|").split("a|b") == ["a", "b"]
+    assert DelimiterAlternatives(["|", "\t"]).normalise("a\tb|c") == "a|b|c"
+    assert DelimiterAlternatives([]).split("a=b") == ["a=b"]
+    assert not DelimiterAlternatives([]).found_in("a=b")
+    assert DelimiterAlternatives(["\\", "/"]).normalise("a/b") == "a\\b"
+
+
+def test_entries_honour_every_alternative():
+    """Fields parse the same with any of the configured delimiters"""
+    expected = {'action': 'login', 'user': 'bob'}
+    for lazy in (False, True):
+        parser = _viewer(LazyFields=lazy).parser
+        for text in ("2025-08-08 06:50:00|INFO|{action=login;user=bob}|a,b",
+                     "2025-08-08 06:50:00\tINFO\t[action:login&user:bob]\ta;b"):
+            entry = parser._parse_log_entry(text, 1)
+            assert entry.get_field('Details') == expected
+            assert entry.get_field('Tags') == ['a', 'b']
+            assert entry.get_field('LogLevel') == 'INFO'
+            assert entry.get_epoch('Timestamp') is not None
+            assert entry.raw_text == text
+
+
+def test_store_and_pickle_use_compiled_delimiters():
+    """LogStore and the parse cache see the same fields"""
+    viewer = _viewer()
+    store = LogStore(viewer.parser)
+    entry = viewer.parser._parse_log_entry("2025-08-08 06:50:00\tWARN\tk:v\tx;y", 1)
+    store.append(entry)
+    store = pickle.loads(pickle.dumps(store))
+    assert store[0].fields == entry.fields
+    assert store.select('LogLevel', lambda value: value == 'WARN') == [store[0]]
+
+
+if __name__ == "__main__":
+    test_alternatives_split_in_one_pass()
+    test_entries_honour_every_alternative()
+    test_store_and_pickle_use_compiled_delimiters()
+    print("Delimiter tests passed!")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_dictionary_encoding.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for shared (dictionary-encoded) field values and per-value filtering
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "ErrorCode", "type": "number", "order": 5}
+        ]
+    }
+}
+
+LEVELS = ["INFO", "DEBUG", "WARNING", "ERROR"]
+
+
+def _write_log(path, lines=200):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            f.write(f"2025-08-08 06:{i // 60 % 60:02d}:{i % 60:02d}|{LEVELS[i % 4]}|Svc{i % 3}|"
+                    f"(mode=fast;id={i})|{i % 5}\n")
+
+
+def test_repeated_values_are_shared():
+    """Low-cardinality categories share one value object per distinct text"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _write_log(path)
+
+        original_limit = log_viewer_module.FIELD_DICTIONARY_LIMIT
+        log_viewer_module.FIELD_DICTIONARY_LIMIT = 16
+        try:
+            viewer = LogViewer(config_dict=CONFIG)
+            viewer.load_file(path)
+        finally:
+            log_viewer_module.FIELD_DICTIONARY_LIMIT = original_limit
+
+        logs = viewer.logs
+        assert logs[0].get_field('LogLevel') is logs[4].get_field('LogLevel')
+        assert logs[1].get_field('Component') is logs[4].get_field('Component')
+        assert len({id(log.get_field('LogLevel')) for log in logs}) == 4
+
+        # Details has more distinct values than the limit and is parsed per entry
+        assert viewer.parser.unshared_categories == {'Details'}
+        assert logs[0].get_field('Details') == {'mode': 'fast', 'id': '0'}
+        assert logs[0].get_field('Details') is not logs[1].get_field('Details')
+
+
+def test_shared_values_cannot_be_modified():
+    """Shared dicts and lists are frozen, and each load shares values afresh"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(20):
+                f.write(f"2025-08-08 06:00:{i:02d}|INFO|(Svc{i % 2},db)|(mode=fast;id=7)|1\n")
+
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path)
+        details = viewer.logs[0].get_field('Details')
+        components = viewer.logs[0].get_field('Component')
+        assert details is viewer.logs[1].get_field('Details')
+        assert components is viewer.logs[2].get_field('Component')
+        assert isinstance(details, dict) and details == {'mode': 'fast', 'id': '7'}
+        assert isinstance(components, list) and components == ['Svc0', 'db']
+        for modify in (lambda: details.update(mode='slow'), lambda: details.pop('mode'),
+                       lambda: components.append('cache'), lambda: components.sort()):
+            try:
+                modify()
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("A shared value was modified")
+        assert viewer.logs[1].get_field('Details') == {'mode': 'fast', 'id': '7'}
+        assert pickle.loads(pickle.dumps(details)) == details
+        assert pickle.loads(pickle.dumps(components)) == components
+        changed = details.copy()
+        changed['mode'] = 'slow'  # A copy can be modified
+
+        # A category that passed the limit in one load is shared again in the next
+        original_limit = log_viewer_module.FIELD_DICTIONARY_LIMIT
+        log_viewer_module.FIELD_DICTIONARY_LIMIT = 1
+        try:
+            viewer.load_file(path)
+        finally:
+            log_viewer_module.FIELD_DICTIONARY_LIMIT = original_limit
+        assert 'Component' in viewer.parser.unshared_categories
+        viewer.load_file(path)
+        assert not viewer.parser.unshared_categories
+        assert viewer.logs[0].get_field('Component') is viewer.logs[2].get_field('Component')
+        assert viewer.logs[0].get_field('Details') is not details
+
+
+def test_filters_test_each_distinct_value_once():
+    """List and LogStore filtering call the value test once per distinct value"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _write_log(path)
+
+        for columnar in (False, True):
+            viewer = LogViewer(config_dict={"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=columnar)})
+            viewer.load_file(path)
+
+            assert viewer.filter_by_field('LogLevel', 'ERROR') == 50
+            assert all(log.get_field('LogLevel') == 'ERROR' for log in viewer.filtered_logs)
+            assert [log.line_number for log in viewer.filtered_logs[:2]] == [4, 8]
+            assert viewer.filter_by_field('Component', 'vc1', 'contains') == 67
+
+        tested = []
+        selected = viewer.logs.select('LogLevel', lambda value: tested.append(value) or value in ('INFO', 'DEBUG'))
+        assert sorted(tested) == sorted(LEVELS)
+        assert len(selected) == 100 and selected[1].get_field('LogLevel') == 'DEBUG'
+
+
+if __name__ == "__main__":
+    test_repeated_values_are_shared()
+    test_shared_values_cannot_be_modified()
+    test_filters_test_each_distinct_value_once()
+    print("Dictionary encoding tests passed!")
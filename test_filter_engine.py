@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_filter_engine.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the single-pass FilterEngine
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LogStore, FieldFilter, FieldType
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+
+def _viewer(**settings):
+    config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], **settings)}
+    viewer = LogViewer(config_dict=config)
+    viewer.load_file(SAMPLE_FILE, workers=1)
+    return viewer
+
+
+def _lines(logs):
+    return [log.line_number for log in logs]
+
+
+def test_filters_match_each_entry():
+    """Each operator keeps the entries its field test keeps"""
+    viewer = _viewer()
+    logs = viewer.logs
+    engine = viewer.filter_engine
+
+    def check(filters, expected, display="Show All", search=""):
+        assert _lines(engine.apply(logs, filters, display, search)) == _lines(log for log in logs if expected(log))
+
+    field = lambda log, name: log.get_field(name)
+    check([FieldFilter("LogLevel", "equals", "error")], lambda log: field(log, 'LogLevel') == "ERROR")
+    check([FieldFilter("Component", "starts with", "auth")],
+          lambda log: str(field(log, 'Component')).lower().startswith("auth"))
+    check([FieldFilter("Details", "has key", "error")],
+          lambda log: isinstance(field(log, 'Details'), dict) and 'error' in field(log, 'Details'))
+    check([FieldFilter("Details", "key equals", "action=query")],
+          lambda log: isinstance(field(log, 'Details'), dict) and field(log, 'Details').get('action') == "query")
+    check([FieldFilter("Tags", "contains all", "security, debug")],
+          lambda log: isinstance(field(log, 'Tags'), list) and
+          {"security", "debug"} <= set(field(log, 'Tags')))
+    check([FieldFilter("ErrorCode", "between", "1000", "2000")],
+          lambda log: field(log, 'ErrorCode') is not None and 1000 <= field(log, 'ErrorCode') <= 2000)
+    check([FieldFilter("Timestamp", "after", "2025-08-08 07:00:00"), FieldFilter("LogLevel", "not equals", "info")],
+          lambda log: log.get_epoch('Timestamp') is not None and
+          str(field(log, 'Timestamp')) > "2025-08-08 07:00:00" and field(log, 'LogLevel') != "INFO")
+    check([], lambda log: '{' in log.raw_text or '[' in log.raw_text or '<' in log.raw_text and '>' in log.raw_text,
+          display="Only JSON/XML")
+    check([FieldFilter("LogLevel", "equals", "ERROR")],
+          lambda log: field(log, 'LogLevel') == "ERROR" and "timeout" in log.raw_text.lower(), search=" Timeout ")
+
+    # Inactive filters
+    assert engine.compile([FieldFilter("LogLevel", "equals", " "), FieldFilter("Missing", "equals", "x"),
+                           FieldFilter("ErrorCode", "equals", "n/a")]) is None
+    assert engine.apply(logs, [FieldFilter("ErrorCode", "between", "1")]) == []
+
+
+def test_store_matches_list():
+    """A LogStore filters to the same entries as a list, and CLI specs parse"""
+    listed = _viewer(ColumnarStore=False)
+    stored = _viewer(ColumnarStore=True)
+    assert isinstance(stored.logs, LogStore)
+    specs = ["LogLevel:equals:ERROR", "Component:contains:service", "ErrorCode:not between:2000..4000"]
+    filters = [FieldFilter.from_spec(spec) for spec in specs]
+    assert filters[2] == FieldFilter("ErrorCode", "not between", "2000", "4000")
+    assert listed.apply_filters(filters) == stored.apply_filters(filters) > 0
+    assert _lines(listed.filtered_logs) == _lines(stored.filtered_logs)
+    assert stored.apply_filters() == len(stored.logs)
+
+
+def test_new_config_rebuilds_engine():
+    """Filters use the category types of a configuration switched to after loading"""
+    viewer = _viewer()
+    column_index = viewer.prepare_column_index()
+    viewer.apply_filters([FieldFilter("ErrorCode", "greater than", "1000")], search="a")
+    categories = [dict(category, type="string") if category["name"] == "ErrorCode" else category
+                  for category in CONFIG["logViewerConfig"]["categories"]]
+    config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], categories=categories +
+                                      [{"name": "Extra", "type": "string", "order": 7}])}
+    viewer.set_config_manager(LogViewer(config_dict=config).config_manager)
+    assert viewer.prepare_column_index() is not column_index
+    assert viewer.filter_query == ([], "Show All", "a")
+
+    engine = viewer.filter_engine
+    assert engine.field_types["ErrorCode"] == FieldType.STRING and "Extra" in engine.field_types
+    codes = {str(log.get_field('ErrorCode')) for log in viewer.logs if log.get_field('ErrorCode') is not None}
+    code = sorted(codes)[0]
+    viewer.apply_filters([FieldFilter("ErrorCode", "starts with", code)])
+    assert _lines(viewer.filtered_logs) == _lines(log for log in viewer.logs
+                                                  if str(log.get_field('ErrorCode')).startswith(code))
+
+
+if __name__ == "__main__":
+    test_filters_match_each_entry()
+    test_store_matches_list()
+    test_new_config_rebuilds_engine()
+    print("Filter engine tests passed!")
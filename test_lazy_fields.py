@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_lazy_fields.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for lazy field parsing
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LazyFields
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+
+def _config(**settings):
+    return {"logViewerConfig": dict(MULTILINE_CONFIG["logViewerConfig"], **settings)}
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, dict(log.fields), dict(log.epochs)) for log in logs]
+
+
+def test_lazy_entries_match_eager():
+    """Lazy entries read the same values as eagerly parsed ones"""
+    eager = LogViewer(config_dict=MULTILINE_CONFIG)
+    eager.load_file(SAMPLE_FILE)
+    lazy = LogViewer(config_dict=_config(LazyFields=True))
+    lazy.load_file(SAMPLE_FILE)
+
+    assert isinstance(lazy.logs[0].fields, LazyFields)
+    assert _snapshot(lazy.logs) == _snapshot(eager.logs)
+    assert lazy.logs == eager.logs
+    assert str(lazy.logs[3]) == str(eager.logs[3])
+
+
+def test_fields_parse_on_first_access():
+    """Only the fields that are read are parsed, and each only once"""
+    viewer = LogViewer(config_dict=_config(LazyFields=True))
+    parsed = []
+    parse_field = viewer.parser._parse_field
+    viewer.parser._parse_field = lambda value, category: parsed.append(category.name) or parse_field(value, category)
+
+    viewer.load_file(SAMPLE_FILE)
+    assert parsed == []
+
+    levels = viewer.get_stats()['log_levels']
+    assert levels['ERROR'] == 6
+    assert set(parsed) == {'LogLevel'} and len(parsed) == len(levels)  # Once per distinct value
+
+    log = viewer.logs[1]
+    assert 'Details' in log.fields and 'Missing' not in log.fields
+    assert parsed.count('Details') == 0
+    assert log.get_field('Details')['error'] == 'connection_timeout'
+    assert log.get_field('Details') is log.get_field('Details')
+    assert parsed.count('Details') == 1
+    assert log.get_epoch('LogLevel') is None and log.get_epoch('Timestamp') > 0
+
+
+def test_lazy_entries_in_workers_store_and_export():
+    """Lazy entries survive worker processes, a LogStore and JSON export"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in range(2):
+            path = os.path.join(tmp, f"app{n}.log")
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(20):
+                    f.write(f"[2025-08-08 06:{i:02d}:{n:02d}|INFO|Svc{n}|a={i}|x,y|{i}]###\n")
+                f.write(f"[2025-08-08 07:00:00|ERROR|Short{n}]###\n")
+            paths.append(path)
+
+        expected = LogViewer(config_dict=MULTILINE_CONFIG)
+        expected.merge_files(paths, workers=1)
+        for settings in ({"LazyFields": True}, {"LazyFields": True, "ColumnarStore": True}):
+            viewer = LogViewer(config_dict=_config(**settings))
+            viewer.merge_files(paths, workers=2)
+            assert _snapshot(viewer.logs) == _snapshot(expected.logs)
+        assert 'Details' not in viewer.logs[-1].fields
+
+        json_path = os.path.join(tmp, "out.json")
+        assert viewer.export_logs(json_path) == 42
+        with open(json_path, encoding="utf-8") as f:
+            assert json.load(f)[0]['fields']['Details'] == {'a': '0'}
+
+
+if __name__ == "__main__":
+    test_lazy_entries_match_eager()
+    test_fields_parse_on_first_access()
+    test_lazy_entries_in_workers_store_and_export()
+    print("Lazy field tests passed!")
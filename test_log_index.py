@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_log_index.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the sidecar entry index
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LogIndex
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+CATEGORIES = [
+    {"name": "Timestamp", "type": "datetime", "order": 1},
+    {"name": "LogLevel", "type": "string", "order": 2},
+    {"name": "Component", "type": "string", "order": 3},
+    {"name": "Details", "type": "string", "order": 4}
+]
+
+DELIMITERS = {
+    "categorySeparator": "|",
+    "keyValuePairsSeparator": ";",
+    "keyValueSeparator": "=",
+    "arrayElementSeparator": ","
+}
+
+
+def _config(**settings):
+    return {"logViewerConfig": dict({"delimiters": DELIMITERS, "categories": CATEGORIES}, **settings)}
+
+
+def _write_lines(path, count, start=0, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        for i in range(start, start + count):
+            f.write(f"2025-08-08 06:{i // 60:02d}:{i % 60:02d}|INFO|Svc{i % 3}|n={i}\n")
+            if i % 7 == 0:
+                f.write("\n")
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, dict(log.fields)) for log in logs]
+
+
+def test_pages_match_full_parse():
+    """Pages read through dense and sparse indexes match a full parse"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _write_lines(path, 200)
+        viewer = LogViewer(config_dict=_config())
+        viewer.load_file(path)
+        expected = _snapshot(viewer.logs)
+
+        for stride in (1, 16):
+            index_dir = os.path.join(tmp, f"index{stride}")
+            viewer = LogViewer(config_dict=_config(IndexStride=stride, IndexDir=index_dir))
+            index = viewer.open_index(path)
+            assert index.count == 200 and len(index.offsets) == -(-200 // stride)
+            # Saved in the index directory, not next to the log file
+            assert not os.path.exists(path + LogIndex.SUFFIX)
+            assert [name.endswith(LogIndex.SUFFIX) for name in os.listdir(index_dir)] == [True]
+            saved = LogIndex.load(path, viewer.config_hash, index_dir)
+            assert (saved.stride, saved.count) == (stride, 200)
+            assert (saved.offsets, saved.numbers, saved.epochs) == (index.offsets, index.numbers, index.epochs)
+            assert LogIndex.load(path, "other config", index_dir) is None
+            for position in (0, 5, 17, 150, 195):
+                assert viewer.load_page(path, position, 10) == min(10, 200 - position)
+                assert _snapshot(viewer.logs) == expected[position:position + 10]
+            assert viewer.poll_file() is None
+
+
+def test_find_line_and_time():
+    """Lines and times are found by bisecting the index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _write_lines(path, 200)
+        for stride in (1, 16):
+            viewer = LogViewer(config_dict=_config(IndexStride=stride, IndexDir=tmp))
+            viewer.load_page(path, viewer.find_time(path, "2025-08-08 06:02:05"), 1)
+            assert viewer.logs[0].get_field('Details') == {'n': '125'}
+
+            # A blank line resolves to the entry after it
+            viewer.load_page(path, viewer.find_line(path, 10), 1)
+            assert viewer.logs[0].line_number == 11
+            assert viewer.find_line(path, 10 ** 6) == 200
+            assert viewer.find_time(path, "2025-08-09 00:00:00") == 200
+
+
+def test_grown_file_is_indexed_from_last_checkpoint():
+    """Appended entries extend a saved index; a rewritten file is indexed again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        _write_lines(path, 50)
+        viewer = LogViewer(config_dict=_config(IndexStride=4, IndexDir=tmp))
+        first = viewer.open_index(path)
+
+        _write_lines(path, 30, start=50, mode="a")
+        grown = viewer.open_index(path)
+        assert grown.count == 80
+
+        rebuilt = LogViewer(config_dict=_config(IndexStride=4))
+        fresh = rebuilt.parser.index_file(path, LogIndex(path, rebuilt.config_hash, 4))
+        assert (grown.offsets, grown.numbers, grown.epochs) == (fresh.offsets, fresh.numbers, fresh.epochs)
+        assert grown.offsets[:len(first.offsets) - 1] == first.offsets[:-1]
+
+        _write_lines(path, 5, start=500)
+        assert viewer.open_index(path).count == 5
+        # A viewer without the index in memory reads the saved one
+        assert LogViewer(config_dict=_config(IndexStride=4, IndexDir=tmp)).open_index(path).count == 5
+
+
+def test_delimited_entries():
+    """Delimited files are indexed by entry"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {"logViewerConfig": {
+            "delimiters": dict(DELIMITERS, logStartDelimiter="[", logEndDelimiter="]###"),
+            "categories": CATEGORIES,
+            "IndexStride": 3,
+            "IndexDir": tmp
+        }}
+        viewer = LogViewer(config_dict=config)
+        viewer.load_file(SAMPLE_FILE)
+        expected = _snapshot(viewer.logs)
+
+        path = os.path.join(tmp, "sample.log")
+        with open(SAMPLE_FILE, "rb") as src, open(path, "wb") as dst:
+            dst.write(src.read())
+        assert viewer.open_index(path).delimited
+        viewer.load_page(path, 10, 3)
+        assert [(number, text) for number, text, _ in _snapshot(viewer.logs)] == \
+            [(number, text) for number, text, _ in expected[10:13]]
+        assert viewer.logs[1].is_multiline
+
+
+if __name__ == "__main__":
+    test_pages_match_full_parse()
+    test_find_line_and_time()
+    test_grown_file_is_indexed_from_last_checkpoint()
+    test_delimited_entries()
+    print("Log index tests passed!")
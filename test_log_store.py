@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_log_store.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the columnar LogStore
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, LogStore
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+
+def _columnar(config):
+    return {"logViewerConfig": dict(config["logViewerConfig"], ColumnarStore=True)}
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, log.is_multiline, log.source_file, log.fields, log.epochs)
+            for log in logs]
+
+
+def test_store_matches_list():
+    """A columnar load gives the same entries as a list load"""
+    expected = LogViewer(config_dict=MULTILINE_CONFIG)
+    expected.load_file(SAMPLE_FILE)
+
+    viewer = LogViewer(config_dict=_columnar(MULTILINE_CONFIG))
+    assert viewer.load_file(SAMPLE_FILE) == len(expected.logs)
+    assert isinstance(viewer.logs, LogStore)
+    assert viewer.filtered_logs is viewer.logs
+    assert _snapshot(viewer.logs) == _snapshot(expected.logs)
+    assert _snapshot(viewer.logs[2:5]) == _snapshot(expected.logs[2:5])
+    assert viewer.logs[-1] == expected.logs[-1]
+    assert viewer.get_stats()['log_levels'] == expected.get_stats()['log_levels']
+
+
+def test_high_cardinality_columns_are_reparsed():
+    """Columns with many distinct values fall back to parsing the raw text"""
+    config = _columnar(MULTILINE_CONFIG)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "many.log")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(50):
+                f.write(f"[2025-08-08 06:50:{i:02d}|INFO|Svc|id={i};note=ü{i}|a,b|{i * 1.5 if i % 2 else i}]###\n")
+            f.write("[2025-08-08 06:51:00|ERROR|Svc|id=x|a|oops]###\n[short|DEBUG]###\n")
+
+        original_limit = log_viewer_module.STORE_DICTIONARY_LIMIT
+        log_viewer_module.STORE_DICTIONARY_LIMIT = 8
+        try:
+            viewer = LogViewer(config_dict=config)
+            viewer.load_file(path)
+        finally:
+            log_viewer_module.STORE_DICTIONARY_LIMIT = original_limit
+
+        expected = LogViewer(config_dict=MULTILINE_CONFIG)
+        expected.load_file(path)
+        assert _snapshot(viewer.logs) == _snapshot(expected.logs)
+        assert viewer.logs._codes['Details'] is None
+        assert viewer.logs._codes['LogLevel'] is not None
+        assert viewer.logs[3].get_field('ErrorCode') == 4.5
+        assert viewer.logs[4].get_field('ErrorCode') == 4
+        assert viewer.logs[-2].get_field('ErrorCode') is None
+        assert 'ErrorCode' not in viewer.logs[-1].fields
+
+
+def test_store_tail_removal_and_refresh():
+    """Entries are removed from the end only; auto-refresh works on a store"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grow.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[2025-08-08 06:50:00|INFO|A|k=1|t|0]###\n[2025-08-08 06:50:01|INFO|B|k=2")
+
+        viewer = LogViewer(config_dict=_columnar(MULTILINE_CONFIG))
+        viewer.load_file(path)
+        assert [log.get_field('Component') for log in viewer.logs] == ['A', 'B']
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("|t|0]###\n[2025-08-08 06:50:02|WARNING|C|k=3|t|0]###\n")
+        assert viewer.refresh_file() == 2
+        assert [log.get_field('Component') for log in viewer.filtered_logs] == ['A', 'B', 'C']
+        assert viewer.logs[1].raw_text == "2025-08-08 06:50:01|INFO|B|k=2|t|0"
+
+        try:
+            del viewer.logs[0]
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Only trailing entries can be removed")
+        del viewer.logs[1:]
+        assert len(viewer.logs) == 1 and viewer.logs[0].get_field('Component') == 'A'
+
+
+if __name__ == "__main__":
+    test_store_matches_list()
+    test_high_cardinality_columns_are_reparsed()
+    test_store_tail_removal_and_refresh()
+    print("LogStore tests passed!")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_merge.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for merging several log files into one view
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, LogEntry, LogParser, merge_entries
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4}
+        ]
+    }
+}
+
+
+def _entry(timestamp, name):
+    fields = {"Timestamp": timestamp} if timestamp else {}
+    return LogEntry(raw_text=name, line_number=0, fields=dict(fields, Component=name))
+
+
+def _names(entries):
+    return [entry.get_field("Component") for entry in entries]
+
+
+def test_merge_entries_reorders_within_window():
+    """Slightly out-of-order lines are put back in order; ties keep stream order"""
+    first = [_entry("01", "a1"), _entry("03", "a3"), _entry("02", "a2"), _entry("05", "a5")]
+    second = [_entry("02", "b2"), _entry("04", "b4"), _entry(None, "b4-cont"), _entry("06", "b6")]
+
+    merged = _names(merge_entries([first, second], window=2))
+    assert merged == ["a1", "a2", "b2", "a3", "b4", "b4-cont", "a5", "b6"]
+
+    # Disorder further out than the window is passed through where it falls
+    late = [_entry("03", "c3"), _entry("04", "c4"), _entry("01", "c1")]
+    assert _names(merge_entries([late], window=1)) == ["c3", "c1", "c4"]
+    assert _names(merge_entries([[], second])) == _names(second)
+
+
+def test_merge_entries_is_lazy():
+    """Merged entries are produced before the input streams are exhausted"""
+    consumed = []
+
+    def stream(prefix):
+        for i in range(1000):
+            consumed.append(prefix)
+            yield _entry(f"{i:04d}", f"{prefix}{i}")
+
+    merged = merge_entries([stream("a"), stream("b")], window=4)
+    assert _names([next(merged), next(merged)]) == ["a0", "b0"]
+    assert len(consumed) < 20
+
+
+def test_merge_files_shows_first_screen():
+    """The first screen is loaded before the rest, in both serial and pool merges"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in range(2):
+            path = os.path.join(tmp, f"app{n}.log")
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(50):
+                    f.write(f"2025-08-08 06:{i:02d}:{n:02d}|INFO|Svc{n}|a={i}\n")
+            paths.append(path)
+
+        original_screen = log_viewer_module.MERGE_FIRST_SCREEN
+        log_viewer_module.MERGE_FIRST_SCREEN = 10
+        try:
+            results = []
+            for workers in (1, 2):
+                viewer = LogViewer(config_dict=CONFIG)
+                screens = []
+                count = viewer.merge_files(paths, workers=workers,
+                                           first_screen=lambda logs: screens.append(len(viewer.logs)))
+                assert screens == [10]
+                assert count == len(viewer.filtered_logs) == 100
+                results.append([log.raw_text for log in viewer.logs])
+        finally:
+            log_viewer_module.MERGE_FIRST_SCREEN = original_screen
+
+        assert results[0] == results[1]
+        assert results[0][:2] == ["2025-08-08 06:00:00|INFO|Svc0|a=0", "2025-08-08 06:00:01|INFO|Svc1|a=0"]
+
+
+def test_first_screen_closes_files_and_reuses_heads():
+    """Files are closed after the first screen, and files read to the end are not parsed again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        small = os.path.join(tmp, "small.log")
+        large = os.path.join(tmp, "large.log")
+        with open(small, "w", encoding="utf-8") as f:
+            for i in range(50):
+                f.write(f"2025-08-08 06:00:{i:02d}|INFO|Svc0|a={i}\n")
+        with open(large, "w", encoding="utf-8") as f:
+            for i in range(5000):
+                f.write(f"2025-08-08 07:{i // 60 % 60:02d}:{i % 60:02d}|INFO|Svc1|a={i}\n")
+
+        viewer = LogViewer(config_dict=CONFIG)
+        opened = []
+        parsed = []
+        open_log_file = LogParser._open_log_file
+        parse_file = viewer.parser.parse_file
+
+        def tracked_open(*args, **kwargs):
+            f = open_log_file(*args, **kwargs)
+            opened.append(f)
+            return f
+
+        def tracked_parse(path, *args, **kwargs):
+            parsed.append(path)
+            return parse_file(path, *args, **kwargs)
+
+        # The head of each file is read by a parser of its own
+        LogParser._open_log_file = tracked_open
+        viewer.parser.parse_file = tracked_parse
+        screens = []
+        try:
+            count = viewer.merge_files([small, large], workers=2,
+                                       first_screen=lambda logs: screens.append([f.closed for f in opened]))
+        finally:
+            LogParser._open_log_file = open_log_file
+        assert screens == [[True, True]]
+        assert parsed == [large]
+        assert count == 5050
+        assert viewer.logs[0].raw_text == "2025-08-08 06:00:00|INFO|Svc0|a=0"
+
+
+if __name__ == "__main__":
+    test_merge_entries_reorders_within_window()
+    test_merge_entries_is_lazy()
+    test_merge_files_shows_first_screen()
+    test_first_screen_closes_files_and_reuses_heads()
+    print("Merge tests passed!")
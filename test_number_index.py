@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_number_index.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the sorted indexes of number categories
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, FilterEngine, FieldFilter
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "ErrorCode", "type": "number", "order": 3},
+            {"name": "Duration", "type": "number", "order": 4}
+        ]
+    }
+}
+
+FILTER_SETS = [
+    [FieldFilter("ErrorCode", "equals", "404")],
+    [FieldFilter("ErrorCode", "not equals", "404")],
+    [FieldFilter("ErrorCode", "greater than", "500")],
+    [FieldFilter("ErrorCode", "less than", "200.5")],
+    [FieldFilter("ErrorCode", "between", "500", "300")],
+    [FieldFilter("ErrorCode", "not between", "300", "500")],
+    [FieldFilter("ErrorCode", "between", "300")],
+    [FieldFilter("Duration", "greater than", "1e20")],
+    [FieldFilter("Duration", "less than", "0.25"), FieldFilter("ErrorCode", "greater than", "199")],
+    [FieldFilter("ErrorCode", "greater than", "400"), FieldFilter("LogLevel", "equals", "ERROR")],
+    [FieldFilter("ErrorCode", "equals", "nan")],
+    [FieldFilter("ErrorCode", "not between", "100", "NaN")],
+]
+
+
+def _entry(i, partial=False):
+    code = ["200", "404", "500", "503", "-", "301", "abc", "418"][i % 8]
+    duration = [f"{i % 13 / 10}", str(10 ** 30 + i), "", "7"][i % 4]
+    level = "ERROR" if i % 3 == 0 else "INFO"
+    text = f"[2025-08-08 10:{i // 60 % 60:02d}:{i % 60:02d}|{level}|{code}|{duration}"
+    return text if partial else text + "]###\n"
+
+
+def _check(viewer):
+    """Indexed filters keep the entries that testing every entry keeps"""
+    for filters in FILTER_SETS:
+        expected = FilterEngine(viewer.config_manager).apply(viewer.logs, filters)
+        count = viewer.apply_filters(filters)
+        assert [log.line_number for log in viewer.filtered_logs] == \
+            [log.line_number for log in expected], filters
+        assert count == len(expected)
+
+
+def test_indexed_ranges_match_scan():
+    """Every number operator keeps the same entries with and without the index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(250)))
+        for store in (False, True):
+            config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+            viewer = LogViewer(config_dict=config)
+            viewer.load_file(path, workers=1)
+            _check(viewer)
+            index = viewer.column_index._numbers["ErrorCode"]
+            assert list(index.values) == sorted(index.values)
+            assert len(index.rows) == sum(1 for log in viewer.logs
+                                          if isinstance(log.get_field("ErrorCode"), (int, float)))
+
+
+def test_nan_bound_is_inactive():
+    """A "nan" bound, which float() accepts, filters nothing with or without the index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(40)))
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path, workers=1)
+        for operator in ("equals", "not equals", "greater than", "between"):
+            assert viewer.apply_filters([FieldFilter("ErrorCode", operator, "nan", "500")]) == 40
+
+
+def test_index_follows_refresh():
+    """Appended entries are found in the tail, then once merged, and retracted ones are dropped"""
+    for fraction in (log_viewer_module.NUMBER_INDEX_TAIL_FRACTION, 10 ** 9):
+        saved = log_viewer_module.NUMBER_INDEX_TAIL_FRACTION
+        log_viewer_module.NUMBER_INDEX_TAIL_FRACTION = fraction  # 10 ** 9 merges every update
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "app.log")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("".join(_entry(i) for i in range(60)) + _entry(60, partial=True))
+                viewer = LogViewer(config_dict=CONFIG)
+                viewer.load_file(path, workers=1)
+                _check(viewer)
+                index = viewer.column_index._numbers["ErrorCode"]
+
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("1]###\n" + "".join(_entry(i) for i in range(61, 75)) + _entry(75, partial=True))
+                assert viewer.refresh_file() > 0
+                _check(viewer)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("2]###\n")
+                assert viewer.refresh_file() > 0
+                _check(viewer)
+                assert viewer.column_index._numbers["ErrorCode"] is index
+                assert (len(index._tail_rows) == 0) == (fraction == 10 ** 9)
+        finally:
+            log_viewer_module.NUMBER_INDEX_TAIL_FRACTION = saved
+
+
+if __name__ == "__main__":
+    test_indexed_ranges_match_scan()
+    test_nan_bound_is_inactive()
+    test_index_follows_refresh()
+    print("Number index tests passed!")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_parallel_loading.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for parallel (multi-process) log loading
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, FileCheckpoint
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+SINGLE_LINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {key: value for key, value in MULTILINE_CONFIG["logViewerConfig"]["delimiters"].items()
+                       if key not in ("logStartDelimiter", "logEndDelimiter")},
+        "categories": MULTILINE_CONFIG["logViewerConfig"]["categories"]
+    }
+}
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, log.fields, log.source_file) for log in logs]
+
+
+def _compare_serial_and_parallel(config, path):
+    viewer = LogViewer(config_dict=config)
+    serial_checkpoint = FileCheckpoint()
+    serial = viewer.parser.parse_file(path, serial_checkpoint)
+
+    original_range_size = log_viewer_module.PARALLEL_RANGE_SIZE
+    log_viewer_module.PARALLEL_RANGE_SIZE = 64  # Force many small ranges
+    try:
+        delimited, ranges = viewer.parser.split_ranges(path, 2)
+        assert len(ranges) > 2
+        assert ranges[0][0] == 0 and ranges[-1][1] == os.path.getsize(path)
+
+        parallel_checkpoint = FileCheckpoint()
+        parallel = viewer.parser.parse_file_parallel(path, 2, parallel_checkpoint)
+    finally:
+        log_viewer_module.PARALLEL_RANGE_SIZE = original_range_size
+
+    assert _snapshot(parallel) == _snapshot(serial)
+    assert parallel_checkpoint == serial_checkpoint
+    return serial
+
+
+def test_parallel_matches_serial_multiline():
+    """Delimited entries parse identically when split across workers"""
+    logs = _compare_serial_and_parallel(MULTILINE_CONFIG, SAMPLE_FILE)
+    assert [log.line_number for log in logs] == list(range(1, 15))
+
+
+def test_parallel_matches_serial_lines():
+    """Line numbers stay global across ranges, including blank lines"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lines.log")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(200):
+                f.write(f"2025-08-08 06:50:{i % 60:02d}|INFO|Svc{i % 3}|a={i};b=2|x,y|{i}\n")
+                if i % 17 == 0:
+                    f.write("\n")
+            f.write("2025-08-08 07:00:00|ERROR|Tail|a=1|x|9")  # No trailing newline
+
+        logs = _compare_serial_and_parallel(SINGLE_LINE_CONFIG, path)
+        assert logs[-1].line_number == 213
+
+
+def test_load_file_uses_configured_workers():
+    """ParseWorkers in the config enables the parallel path for large files"""
+    config = {"logViewerConfig": dict(SINGLE_LINE_CONFIG["logViewerConfig"], ParseWorkers=2)}
+    viewer = LogViewer(config_dict=config)
+    assert viewer.config_manager.parse_workers == 2
+
+    original_min_bytes = log_viewer_module.PARALLEL_MIN_BYTES
+    log_viewer_module.PARALLEL_MIN_BYTES = 0
+    try:
+        count = viewer.load_file(SAMPLE_FILE)
+    finally:
+        log_viewer_module.PARALLEL_MIN_BYTES = original_min_bytes
+
+    assert count == len(LogViewer(config_dict=SINGLE_LINE_CONFIG).parser.parse_file(SAMPLE_FILE))
+    assert viewer.checkpoint.size == os.path.getsize(SAMPLE_FILE)
+
+
+def test_merge_files_in_worker_pool():
+    """Files merged through the pool match a serial merge and report progress"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for n in range(3):
+            path = os.path.join(tmp, f"app{n}.log")
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(40):
+                    f.write(f"2025-08-08 06:{i:02d}:{n:02d}|INFO|Svc{n}|a={i}|x|{i}\n")
+            paths.append(path)
+        missing = os.path.join(tmp, "gone.log")
+
+        progress = []
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        count = viewer.merge_files(paths + [missing], workers=2,
+                                   progress=lambda *args: progress.append(args))
+        assert count == 120
+        assert sorted(call[0] for call in progress) == paths
+        assert [call[2] for call in progress] == [1, 2, 3]
+        assert all(call[1] == 40 and call[3] == 3 for call in progress)
+
+        serial = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        serial.merge_files(paths, workers=1)
+        assert _snapshot(viewer.logs) == _snapshot(serial.logs)
+        assert [log.source_file for log in viewer.logs[:3]] == paths
+
+        loaded = serial.load_files(reversed(paths), workers=2)
+        assert list(loaded) == paths[::-1]
+
+
+if __name__ == "__main__":
+    test_parallel_matches_serial_multiline()
+    test_parallel_matches_serial_lines()
+    test_load_file_uses_configured_workers()
+    test_merge_files_in_worker_pool()
+    print("Parallel loading tests passed!")
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_parse_cache.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the on-disk parse cache
+"""
+
+import sys
+import os
+import json
+import time
+import zlib
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LogStore, LazyFields, ParseCache
+
+CATEGORIES = [
+    {"name": "Timestamp", "type": "datetime", "order": 1},
+    {"name": "LogLevel", "type": "string", "order": 2},
+    {"name": "Component", "type": "string", "order": 3},
+    {"name": "Details", "type": "string", "order": 4}
+]
+
+
+def _config(cache_dir, **settings):
+    return {
+        "logViewerConfig": dict({
+            "delimiters": {
+                "categorySeparator": "|",
+                "keyValuePairsSeparator": ";",
+                "keyValueSeparator": "=",
+                "arrayElementSeparator": ","
+            },
+            "categories": CATEGORIES,
+            "ParseCacheDir": cache_dir
+        }, **settings)
+    }
+
+
+def _write(path, text, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(text)
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, dict(log.fields)) for log in logs]
+
+
+def test_unchanged_file_is_served_from_cache():
+    """A second load of an unchanged file does not parse it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        path = os.path.join(tmp, "app.log")
+        _write(path, "".join(f"2025-08-08 06:50:{i:02d}|INFO|Svc|a={i}\n" for i in range(30)))
+
+        first = LogViewer(config_dict=_config(cache_dir))
+        assert first.load_file(path) == 30
+        assert len(os.listdir(cache_dir)) == 1
+
+        second = LogViewer(config_dict=_config(cache_dir))
+        second.parser.iter_entries = None  # Any parse would fail
+        assert second.load_file(path) == 30
+        assert _snapshot(second.logs) == _snapshot(first.logs)
+        assert second.checkpoint == first.checkpoint
+
+        # Settings that do not change parsing share the entry; a new format has its own
+        coloured = [dict(category, ColourType="WholeLine", ColourMap={"255,0,0": "INFO"}) for category in CATEGORIES]
+        other = LogViewer(config_dict=_config(cache_dir, LazyFields=True, categories=coloured))
+        assert other.config_hash == first.config_hash
+        other.load_file(path)
+        assert _snapshot(other.logs) == _snapshot(first.logs)
+        other = LogViewer(config_dict=_config(cache_dir, DecodeErrors="backslashreplace"))
+        other.load_file(path)
+        assert len(os.listdir(cache_dir)) == 2
+
+        # Entries are stored as plain data, not pickles
+        for name in os.listdir(cache_dir):
+            with open(os.path.join(cache_dir, name), "rb") as f:
+                assert json.loads(f.readline())["path"] == os.path.abspath(path)
+                assert json.loads(zlib.decompress(f.read()))[3][0][:2] == [first.logs[0].raw_text, 1]
+
+
+def test_store_and_shared_values_come_back():
+    """Cached entries go back into a LogStore, and shared values stay shared and frozen"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        path = os.path.join(tmp, "app.log")
+        _write(path, "".join(f"2025-08-08 06:50:{i:02d}|INFO|Svc|(a=1;b=2)\n" for i in range(30)))
+        first = LogViewer(config_dict=_config(cache_dir, ColumnarStore=True))
+        first.load_file(path)
+
+        second = LogViewer(config_dict=_config(cache_dir, ColumnarStore=True))
+        second.parser.iter_entries = None  # Any parse would fail
+        second.load_file(path)
+        assert isinstance(second.logs, LogStore)
+        assert _snapshot(second.logs) == _snapshot(first.logs)
+
+        third = LogViewer(config_dict=_config(cache_dir))
+        third.load_file(path)
+        assert third.logs[0].get_field('Details') is third.logs[29].get_field('Details')
+        assert third.logs[0].epochs == first.logs[0].epochs
+        try:
+            third.logs[0].get_field('Details')['a'] = '3'
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("A shared value was modified")
+
+
+def test_lazy_fields_stay_unparsed():
+    """Caching entries with LazyFields parses only their timestamps, and they come back lazy"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        path = os.path.join(tmp, "app.log")
+        _write(path, "".join(f"2025-08-08 06:50:{i:02d}|INFO|Svc|(a={i};b=2)\n" for i in range(30)))
+        first = LogViewer(config_dict=_config(cache_dir, LazyFields=True))
+        first.load_file(path)
+        assert len(os.listdir(cache_dir)) == 1
+        assert all(set(log.fields._values) == {'Timestamp'} for log in first.logs)
+
+        second = LogViewer(config_dict=_config(cache_dir, LazyFields=True))
+        second.parser.iter_entries = None  # Any parse would fail
+        second.load_file(path)
+        assert isinstance(second.logs[0].fields, LazyFields)
+        assert set(second.logs[0].fields._values) == {'Timestamp'}
+        assert second.logs[0].get_epoch('Timestamp') == first.logs[0].get_epoch('Timestamp')
+
+        eager = LogViewer(config_dict=_config(cache_dir))
+        eager.load_file(path)
+        assert not isinstance(eager.logs[0].fields, LazyFields)
+        fresh = LogViewer(config_dict=_config(""))
+        fresh.load_file(path)
+        assert _snapshot(second.logs) == _snapshot(eager.logs) == _snapshot(fresh.logs)
+        assert [log.epochs for log in eager.logs] == [log.epochs for log in fresh.logs]
+
+
+def test_grown_and_rewritten_files():
+    """A grown file parses only its tail; a rewritten one is parsed again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        path = os.path.join(tmp, "app.log")
+        _write(path, "2025-08-08 06:50:00|INFO|A|a=1\n2025-08-08 06:50:01|INFO|B|a=")
+        LogViewer(config_dict=_config(cache_dir)).load_file(path)
+
+        _write(path, "2\n2025-08-08 06:50:02|ERROR|C|a=3\n", mode="a")
+        viewer = LogViewer(config_dict=_config(cache_dir))
+        read_from = []
+        iter_entries = viewer.parser.iter_entries
+        viewer.parser.iter_entries = lambda file_path, *args, checkpoint=None, **kwargs: (
+            read_from.append(checkpoint.offset if checkpoint else 0) or iter_entries(file_path, *args, checkpoint=checkpoint, **kwargs))
+        assert viewer.load_file(path) == 3
+        assert read_from and read_from[0] > 0
+        assert [log.get_field('Details') for log in viewer.logs] == [{'a': '1'}, {'a': '2'}, {'a': '3'}]
+
+        fresh = LogViewer(config_dict=_config(""))
+        fresh.load_file(path)
+        assert _snapshot(viewer.logs) == _snapshot(fresh.logs)
+        assert (viewer.checkpoint.offset, viewer.checkpoint.next_number) == (fresh.checkpoint.offset, fresh.checkpoint.next_number)
+
+        # Same size, different content and mtime
+        time.sleep(0.01)
+        with open(path, "r+", encoding="utf-8") as f:
+            f.write("2025-08-08 06:50:00|WARN|")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+        rewritten = LogViewer(config_dict=_config(cache_dir))
+        rewritten.load_file(path)
+        assert rewritten.logs[0].get_field('LogLevel') == 'WARN'
+
+
+def test_lru_eviction_and_merged_loads():
+    """The cache stays under its size cap, dropping least recently used files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        paths = []
+        for n in range(3):
+            path = os.path.join(tmp, f"app{n}.log")
+            _write(path, "".join(f"2025-08-08 06:{n:02d}:{i:02d}|INFO|Svc{n}|a={i}\n" for i in range(40)))
+            paths.append(path)
+
+        viewer = LogViewer(config_dict=_config(cache_dir))
+        assert viewer.merge_files(paths, workers=1) == 120
+        sizes = {name: os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir)}
+        assert len(sizes) == 3
+
+        cache = ParseCache(cache_dir, max(sizes.values()) * 2)
+        oldest = cache._path(paths[0], viewer.config_hash)
+        os.utime(oldest, ns=(1, 1))
+        cache.evict()
+        assert sorted(os.listdir(cache_dir)) == sorted(name for name in sizes if name != os.path.basename(oldest))
+
+        again = LogViewer(config_dict=_config(cache_dir))
+        assert again.merge_files(paths, workers=1) == 120
+        assert _snapshot(again.logs) == _snapshot(viewer.logs)
+
+
+if __name__ == "__main__":
+    test_unchanged_file_is_served_from_cache()
+    test_store_and_shared_values_come_back()
+    test_lazy_fields_stay_unparsed()
+    test_grown_and_rewritten_files()
+    test_lru_eviction_and_merged_loads()
+    print("Parse cache tests passed!")
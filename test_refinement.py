@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_refinement.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for refining the last query of the filter engine
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, FilterEngine, FieldFilter
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "ErrorCode", "type": "number", "order": 3},
+            {"name": "Message", "type": "string", "order": 4}
+        ]
+    }
+}
+
+# Queries in the order a user might type them, each followed by whether it refines the one before
+QUERIES = [
+    ([], "c", None),
+    ([], "co", True),
+    ([], "conn", True),
+    ([], "conx", False),
+    ([FieldFilter("ErrorCode", "between", "200", "500")], "", False),
+    ([FieldFilter("ErrorCode", "between", "300", "500")], "", True),
+    ([FieldFilter("ErrorCode", "between", "300", "500"), FieldFilter("LogLevel", "equals", "ERROR")], "", True),
+    ([FieldFilter("ErrorCode", "between", "300", "400"), FieldFilter("LogLevel", "equals", "ERROR")], "tim", True),
+    ([FieldFilter("ErrorCode", "between", "300", "600"), FieldFilter("LogLevel", "equals", "ERROR")], "tim", False),
+    ([FieldFilter("ErrorCode", "not between", "300", "600")], "", False),
+    ([FieldFilter("ErrorCode", "not between", "200", "700")], "", True),
+    ([FieldFilter("ErrorCode", "not between", "400", "700")], "", False),
+    ([FieldFilter("Message", "contains", "time")], "", False),
+    ([FieldFilter("Message", "contains", "timeout")], "", True),
+    ([FieldFilter("Message", "starts with", "timeout")], "", False),
+    ([FieldFilter("Timestamp", "after", "2025-08-08 10:00:20")], "", False),
+    ([FieldFilter("Timestamp", "after", "2025-08-08 10:01:00")], "", True),
+    ([FieldFilter("Timestamp", "before", "2025-08-08 10:01:30")], "", False),
+]
+
+
+def _entry(i):
+    level = "ERROR" if i % 3 == 0 else "INFO"
+    code = ["200", "301", "404", "500", "-", "503"][i % 6]
+    message = ["connection reset", "timeout waiting", "connected", "time skew"][i % 4]
+    stamp = f"2025-08-08 10:{i // 60 % 60:02d}:{i % 60:02d}" if i % 11 != 4 else "unknown"
+    return f"[{stamp}|{level}|{code}|{message} {i}]###\n"
+
+
+def _lines(logs):
+    return [log.line_number for log in logs]
+
+
+def test_refinements_match_fresh_engine():
+    """Each query keeps what a fresh engine keeps, and refinements are recognized"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(120)))
+        for store in (False, True):
+            config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+            viewer = LogViewer(config_dict=config)
+            viewer.load_file(path, workers=1)
+            engine = viewer.filter_engine
+            for filters, search, refines in QUERIES:
+                if refines is not None:
+                    active = [field_filter for field_filter in filters if engine._is_active(field_filter)]
+                    candidates = engine._refinement_candidates(viewer.logs, active, "Show All", search)
+                    assert (candidates is not None) == refines, (filters, search)
+                viewer.apply_filters(filters, search=search)
+                expected = FilterEngine(viewer.config_manager).apply(viewer.logs, filters, search=search)
+                assert _lines(viewer.filtered_logs) == _lines(expected), (filters, search)
+
+
+def test_second_value_of_before_is_ignored():
+    """A value left in the second box does not change the bound of before or after"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[2025-08-08 10:00:00|INFO|200|a]###\n[2025-08-08 13:xx|INFO|200|b]###\n")
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path, workers=1)
+        viewer.apply_filters([FieldFilter("Timestamp", "before", "2025-08-08 12:00:00", "2000")])
+        assert _lines(viewer.filtered_logs) == [1]
+        # The unparsed time compares as text, and "2025-08-08 13:xx" < "2025-08-08T11:00:00"
+        filters = [FieldFilter("Timestamp", "before", "2025-08-08T11:00:00", "2000")]
+        viewer.apply_filters(filters)
+        assert _lines(viewer.filtered_logs) == _lines(FilterEngine(viewer.config_manager).apply(viewer.logs, filters))
+        assert _lines(viewer.filtered_logs) == [1, 2]
+
+
+def test_refinement_follows_refresh():
+    """Entries appended after a query are considered by the next refinement"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(40)))
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path, workers=1)
+        viewer.apply_filters([], search="time")
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(40, 80)))
+        assert viewer.refresh_file() > 0
+        viewer.apply_filters([], search="timeout")
+        expected = FilterEngine(viewer.config_manager).apply(viewer.logs, search="timeout")
+        assert _lines(viewer.filtered_logs) == _lines(expected)
+        assert max(_lines(expected)) > 40
+
+        # Loading a file replaces the logs, and the active filters run over the new ones
+        viewer.load_file(path, workers=1)
+        assert viewer.filter_engine._previous[0] is viewer.logs
+        assert _lines(viewer.filtered_logs) == _lines(expected)
+
+
+def test_store_without_indexes_keeps_the_query():
+    """Applying filters to a LogStore with no indexes remembers every filter of the query"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(120)))
+        config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=True)}
+        viewer = LogViewer(config_dict=config)
+        viewer.load_file(path, workers=1)
+        engine = FilterEngine(viewer.config_manager)
+        level = FieldFilter("LogLevel", "equals", "ERROR")
+        codes = FieldFilter("ErrorCode", "between", "300", "500")
+        filters = [level, codes]
+        engine.apply(viewer.logs, filters)
+        assert filters == [level, codes]
+        assert engine._previous[2] == [level, codes]
+        # Dropping the level filter widens the query, so it is not run over the last result
+        expected = FilterEngine(viewer.config_manager).apply(viewer.logs, [codes])
+        assert _lines(engine.apply(viewer.logs, [codes])) == _lines(expected)
+
+
+if __name__ == "__main__":
+    test_refinements_match_fresh_engine()
+    test_second_value_of_before_is_ignored()
+    test_refinement_follows_refresh()
+    test_store_without_indexes_keeps_the_query()
+    print("Refinement tests passed!")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_rotation.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for rotated log sets
+"""
+
+import sys
+import os
+import gzip
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, FieldFilter, rotation_set, group_rotation_sets, is_log_file
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Details", "type": "string", "order": 3}
+        ]
+    }
+}
+
+
+def _lines(day, count=3):
+    return "".join(f"2025-08-{day:02d} 10:00:{i:02d}|INFO|day={day}\n" for i in range(count))
+
+
+def _write_set(tmp):
+    """app.log with three rotated segments: day 8 is live, day 5 the oldest"""
+    paths = {}
+    for name, day in (("app.log", 8), ("app.log.1", 7), ("app.log.2.gz", 6), ("app.log.3.gz", 5)):
+        path = paths[day] = os.path.join(tmp, name)
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            f.write(_lines(day))
+    with open(os.path.join(tmp, "other.log"), "w", encoding="utf-8") as f:
+        f.write(_lines(1))
+    return paths
+
+
+def _days(logs):
+    return [log.get_field('Details')['day'] for log in logs]
+
+
+def test_rotation_sets_are_grouped_and_ordered():
+    """Numbered and dated segments sort oldest first, after their live file's name"""
+    assert group_rotation_sets(["app.log", "app.log.2.gz", "app.log.10", "app.log.1", "b.log"]) == \
+        [["app.log.10", "app.log.2.gz", "app.log.1", "app.log"], ["b.log"]]
+    assert group_rotation_sets(["app.log-20250808.gz", "app.log", "app.log-20250807"]) == \
+        [["app.log-20250807", "app.log-20250808.gz", "app.log"]]
+    assert group_rotation_sets(["web.2025-08-08.log", "web.log", "web.2025-08-07.log"]) == \
+        [["web.2025-08-07.log", "web.2025-08-08.log", "web.log"]]
+    assert is_log_file("app.log.1", [".log"])
+    assert is_log_file("app.log-20250808.gz", [".log"])
+    assert not is_log_file("app.log.1.lvidx", [".log"])
+
+
+def test_numbered_names_without_live_file_are_not_segments():
+    """A number before the extension only marks a segment when the live file exists"""
+    names = ["node-1.log", "node-2.log", "node-3.log", "python3.11.log", "build-123.txt", "v1.2.log"]
+    assert group_rotation_sets(names) == [[name] for name in names]
+    assert group_rotation_sets(["node-1.log", "node.log"]) == [["node-1.log", "node.log"]]
+    assert not is_log_file("python3.11", [".log"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, name) for name in ("node-1.log", "node-2.log", "v1.2.log")]
+        for path in paths:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(_lines(1))
+        for path in paths:
+            assert rotation_set(path) == [path]
+        with open(os.path.join(tmp, "node.log"), "w", encoding="utf-8") as f:
+            f.write(_lines(2))
+        assert rotation_set(paths[0]) == [paths[1], paths[0], os.path.join(tmp, "node.log")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_set(tmp)
+        assert rotation_set(paths[8]) == [paths[5], paths[6], paths[7], paths[8]]
+        assert rotation_set(paths[6]) == rotation_set(paths[8])
+
+
+def test_older_segments_load_on_demand():
+    """Only the live segment is parsed until older entries are asked for"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_set(tmp)
+        segments = rotation_set(paths[8])
+        viewer = LogViewer(config_dict=CONFIG)
+        assert viewer.load_rotation_set(segments) == 3
+        assert _days(viewer.logs) == ['8'] * 3
+        assert viewer.older_segments == segments[:-1]
+
+        assert viewer.load_older() == 3
+        assert _days(viewer.logs) == ['7'] * 3 + ['8'] * 3
+        assert viewer.load_older_until("2025-08-06 10:00:01") == 3
+        assert viewer.reaches_back_to("2025-08-06 10:00:01")
+        assert not viewer.reaches_back_to("2025-08-05 23:00:00")
+        assert viewer.load_older_until("2025-08-01 00:00:00") == 3
+        assert viewer.load_older() == 0
+        assert _days(viewer.filtered_logs) == [str(day) for day in (5, 6, 7, 8) for _ in range(3)]
+
+        # New entries in the live file are still picked up
+        with open(paths[8], "a", encoding="utf-8") as f:
+            f.write("2025-08-08 11:00:00|INFO|day=8\n")
+        assert viewer.refresh_file() == 1
+        assert len(viewer.logs) == 13
+
+        viewer = LogViewer(config_dict=CONFIG)
+        assert viewer.load_rotation_set(segments, since="2025-08-07 12:00:00") == 7
+        assert [log.line_number for log in viewer.iter_rotation_set(segments)] == [1, 2, 3] * 3 + [1, 2, 3, 4]
+
+
+def test_older_segments_prepend_to_store():
+    """A LogStore takes older segments in front, keeping its entries and values"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_set(tmp)
+        segments = rotation_set(paths[8])
+        config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=True)}
+        viewer = LogViewer(config_dict=config)
+        viewer.load_rotation_set(segments)
+        store = viewer.logs
+        viewer.prepare_column_index()
+        assert viewer.load_older_until("2025-08-01 00:00:00") == 9
+        assert viewer.logs is store and viewer.column_index is None
+        assert _days(viewer.logs) == [str(day) for day in (5, 6, 7, 8) for _ in range(3)]
+        assert [log.raw_text for log in viewer.logs] == [log.raw_text for log in viewer.iter_rotation_set(segments)]
+        assert viewer.apply_filters([FieldFilter("Details", "contains", "day=6")]) == 3
+
+        # Appending and retracting work on the prepended store
+        with open(paths[8], "a", encoding="utf-8") as f:
+            f.write("2025-08-08 11:00:00|INFO|day=8\n")
+        assert viewer.refresh_file() == 1
+        del store[-2:]
+        assert store[-1].raw_text == "2025-08-08 10:00:01|INFO|day=8"
+
+
+def test_rotated_live_file_resets_older_segments():
+    """Rotating the live file reloads it and renumbers the older segments"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_set(tmp)
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_rotation_set(rotation_set(paths[8]))
+
+        os.rename(paths[7], os.path.join(tmp, "app.log.2"))
+        os.remove(paths[6])
+        os.rename(paths[8], paths[7])
+        with open(paths[8], "w", encoding="utf-8") as f:
+            f.write(_lines(9, 2))
+        assert viewer.refresh_file() == 2
+        assert _days(viewer.logs) == ['9', '9']
+        assert [os.path.basename(path) for path in viewer.older_segments] == ["app.log.3.gz", "app.log.2", "app.log.1"]
+        viewer.load_older()
+        assert _days(viewer.logs) == ['8'] * 3 + ['9'] * 2
+
+
+if __name__ == "__main__":
+    test_rotation_sets_are_grouped_and_ordered()
+    test_numbered_names_without_live_file_are_not_segments()
+    test_older_segments_load_on_demand()
+    test_older_segments_prepend_to_store()
+    test_rotated_live_file_resets_older_segments()
+    print("Rotation tests passed!")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_search_index.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the trigram search index
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, LogStore, TrigramIndex, SEARCH_INDEX_BLOCK
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Message", "type": "string", "order": 3}
+        ],
+        "SearchIndex": True
+    }
+}
+
+WORDS = ["Timeout", "connection reset", "ΣΊΣΥΦΟΣ", "naïve café", "user=alice", "user=bob", "disk full"]
+TERMS = ["tim", "timeout", "TIMEOUT", "reset", "σίσυφος", "ïve c", "user=al", "full\nstack", "zzz", "ok", "[2025", "timeout 14"]
+RARE = ["zzz", "timeout 14"]
+
+
+def _entry(i):
+    trace = "\n  at main (app.py:1)\nstack" if i % 7 == 0 else ""
+    return f"[2025-08-08 10:{i // 60 % 60:02d}:{i % 60:02d}|INFO|{WORDS[i % len(WORDS)]} {i}{trace}]###\n"
+
+
+def _scan(logs, term):
+    return [row for row, log in enumerate(logs) if term.lower() in log.raw_text.lower()]
+
+
+def _check(viewer):
+    index = viewer.prepare_search_index(background=False)
+    assert index is not None and index.logs is viewer.logs
+    for term in TERMS:
+        rows = index.search(term)
+        if len(term) < 3:
+            assert rows is None
+        elif rows is not None or term in RARE:
+            # Common terms may be left to a scan, but rare ones are narrowed by the index
+            assert rows == _scan(viewer.logs, term), term
+        count = viewer.apply_filters(search=term)
+        assert [log.line_number for log in viewer.filtered_logs] == \
+            [viewer.logs[row].line_number for row in _scan(viewer.logs, term.strip())]
+        assert count == len(viewer.filtered_logs)
+
+
+def test_search_matches_scan():
+    """Indexed searches find exactly the entries a scan finds, in lists and LogStores"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(40 * SEARCH_INDEX_BLOCK + 5)))
+        for store in (False, True):
+            config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+            viewer = LogViewer(config_dict=config)
+            viewer.load_file(path)
+            assert isinstance(viewer.logs, LogStore) == store
+            _check(viewer)
+            assert viewer.search_index.blocks == 40
+
+
+def test_index_follows_refresh():
+    """Appended entries, and an incomplete last entry that is re-read, are searched correctly"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(_entry(i) for i in range(20 * SEARCH_INDEX_BLOCK)) + "[2025-08-08 11:00:00|INFO|half")
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path)
+        _check(viewer)
+        assert viewer.search_index.blocks == 20
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(" written Timeout]###\n" + "".join(_entry(i) for i in range(SEARCH_INDEX_BLOCK)))
+        assert viewer.refresh_file() > 0
+        index = viewer.search_index
+        _check(viewer)
+        assert viewer.search_index is index and index.blocks == 21
+
+        # A reloaded file gets a new index
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_entry(1))
+        viewer.refresh_file()
+        _check(viewer)
+        assert viewer.search_index is not index
+
+    index = TrigramIndex([])
+    assert index.update() == 0 and index.ready
+    assert LogViewer(config_dict={"logViewerConfig": dict(CONFIG["logViewerConfig"], SearchIndex=False)}) \
+        .prepare_search_index() is None
+
+
+def test_common_and_rare_trigrams():
+    """Trigrams in many blocks are kept as bitmaps, and ones that only start out common go back to arrays"""
+    def word(row):
+        block, slot = divmod(row, SEARCH_INDEX_BLOCK)
+        if slot == 3 and block % 5 == 0:
+            return "alpha"
+        if slot == 0 and block < 2:
+            return "qqqxyz"
+        return "filler"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "app.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(f"[2025-08-08 10:00:00|INFO|{word(i)} {i}]###\n" for i in range(400 * SEARCH_INDEX_BLOCK)))
+        viewer = LogViewer(config_dict=CONFIG)
+        viewer.load_file(path)
+        index = viewer.prepare_search_index(background=False)
+        assert all(gram in index._bitmaps for gram in ("alp", "lph", "pha"))
+        assert "qqq" in index._arrays and "qqq" not in index._bitmaps
+        for term in ("alpha", "qqqxyz", "alpha 83", "beta"):
+            assert index.search(term) == _scan(viewer.logs, term), term
+
+
+if __name__ == "__main__":
+    test_search_matches_scan()
+    test_index_follows_refresh()
+    test_common_and_rare_trigrams()
+    print("Search index tests passed!")
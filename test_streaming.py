@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_streaming.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for streaming (chunked) log parsing
+"""
+
+import io
+import sys
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, FileCheckpoint
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+SINGLE_LINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": MULTILINE_CONFIG["logViewerConfig"]["categories"]
+    }
+}
+
+
+def _snapshot(logs):
+    return [(log.line_number, log.raw_text, log.is_multiline, log.fields) for log in logs]
+
+
+def test_chunk_boundaries_multiline():
+    """Entries and delimiters split across chunks parse the same as a single read"""
+    viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+    expected = _snapshot(viewer.iter_file(SAMPLE_FILE, chunk_size=1 << 20))
+    assert len(expected) == 14
+    assert expected[11][2]  # The stack trace entry spans several lines
+
+    for chunk_size in (1, 2, 3, 5, 17, 64):
+        assert _snapshot(viewer.iter_file(SAMPLE_FILE, chunk_size=chunk_size)) == expected
+
+
+def test_chunk_boundaries_single_line():
+    """Lines split across chunks, CRLF endings and multi-byte characters"""
+    lines = [
+        "2025-08-08 06:50:00|INFO|AuthService|action=login;user=jöhn|security,user|0",
+        "",
+        "2025-08-08 06:50:15|ERROR|DbService|action=query;note=naïve ✓|database,critical|1001",
+        "2025-08-08 06:50:30|WARNING|Cache|action=evict|cache|0",
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "crlf.log")
+        with open(path, "wb") as f:
+            f.write("\r\n".join(lines).encode("utf-8"))
+
+        viewer = LogViewer(config_dict=SINGLE_LINE_CONFIG)
+        expected = _snapshot(viewer.iter_file(path))
+        assert [entry[0] for entry in expected] == [1, 3, 4]
+        assert expected[1][3]["Details"]["note"] == "naïve ✓"
+
+        for chunk_size in (1, 2, 3, 7, 50):
+            assert _snapshot(viewer.iter_file(path, chunk_size=chunk_size)) == expected
+
+
+def test_unterminated_trailing_entry():
+    """A final entry without an end delimiter is kept, on mapped and chunked reads"""
+    content = (b"[a|INFO|x|k=v|t|1]###\n[b|ERROR|y|k=v|t|2]###\n"
+               b"[c|WARNING|z|k=v|t|3")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "partial.log")
+        with open(path, "wb") as f:
+            f.write(content)
+
+        viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+        logs = list(viewer.iter_file(path))
+        assert [log.get_field('LogLevel') for log in logs] == ['INFO', 'ERROR', 'WARNING']
+        assert logs[2].get_field('ErrorCode') == 3
+
+        # Streams that cannot be memory-mapped go through the chunked scanner
+        for chunk_size in (1, 4, 1 << 20):
+            records = list(viewer.parser._iter_delimited_records(io.BytesIO(content), chunk_size, FileCheckpoint()))
+            assert records == [(log.line_number, log.raw_text) for log in logs]
+
+
+def test_missing_delimiters_fall_back_to_lines():
+    """Files without any start delimiter are parsed line by line"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "plain.log")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("2025-08-08 06:50:00|INFO|Auth|a=1|t|0\n2025-08-08 06:50:01|DEBUG|Auth|a=2|t|0\n")
+
+        logs = list(LogViewer(config_dict=MULTILINE_CONFIG).iter_file(path))
+        assert [log.line_number for log in logs] == [1, 2]
+        assert not logs[0].is_multiline
+
+
+def test_invalid_utf8_only_affects_its_entry():
+    """Bad bytes are replaced, or kept with surrogateescape, instead of failing the file"""
+    content = (b"2025-08-08 06:50:00|INFO|Auth|user=j\xf6hn|t|0\n"
+               b"2025-08-08 06:50:01|ERROR|Db|note=ok|t|1\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "latin1.log")
+        with open(path, "wb") as f:
+            f.write(content)
+
+        logs = list(LogViewer(config_dict=SINGLE_LINE_CONFIG).iter_file(path))
+        assert len(logs) == 2
+        assert logs[0].get_field('Details') == {'user': 'j\ufffdhn'}
+        assert logs[1].get_field('LogLevel') == 'ERROR'
+
+        config = {"logViewerConfig": dict(SINGLE_LINE_CONFIG["logViewerConfig"], DecodeErrors="surrogateescape")}
+        viewer = LogViewer(config_dict=config)
+        viewer.load_file(path)
+        csv_path = os.path.join(tmp, "out.csv")
+        viewer.export_logs(csv_path)
+        with open(csv_path, "rb") as f:
+            assert b"user=j\xf6hn" in f.read()
+
+        config = {"logViewerConfig": dict(SINGLE_LINE_CONFIG["logViewerConfig"], DecodeErrors="nonsense")}
+        try:
+            LogViewer(config_dict=config)
+            assert False, "unknown handler accepted"
+        except ValueError:
+            pass
+
+
+def test_load_file_and_stats_use_stream():
+    """load_file, get_stats and get_file_stats agree"""
+    viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+    count = viewer.load_file(SAMPLE_FILE)
+    file_stats = viewer.get_file_stats(SAMPLE_FILE)
+
+    assert count == file_stats['total_logs'] == 14
+    assert viewer.get_stats()['log_levels'] == file_stats['log_levels']
+    assert file_stats['log_levels']['ERROR'] == 6
+    assert all(log.source_file == SAMPLE_FILE for log in viewer.logs)
+
+
+def test_unreadable_file_is_reported():
+    """A file that cannot be read raises instead of loading as an empty log"""
+    viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            viewer.load_file(tmp)  # A directory exists but cannot be read as a file
+        except OSError:
+            pass
+        else:
+            raise AssertionError("Reading a directory should fail")
+
+
+def test_export_streams_from_iterator():
+    """Exporting straight from iter_file writes every entry"""
+    viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "out.json")
+        assert viewer.export_logs(json_path, viewer.iter_file(SAMPLE_FILE)) == 14
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data[0]['line_number'] == 1
+        assert data[1]['fields']['LogLevel'] == 'ERROR'
+
+        csv_path = os.path.join(tmp, "out.csv")
+        assert viewer.export_logs(csv_path, viewer.iter_file(SAMPLE_FILE)) == 14
+
+        empty_path = os.path.join(tmp, "empty.json")
+        assert viewer.export_logs(empty_path, []) == 0
+        with open(empty_path, encoding="utf-8") as f:
+            assert json.load(f) == []
+
+
+if __name__ == "__main__":
+    test_chunk_boundaries_multiline()
+    test_chunk_boundaries_single_line()
+    test_unterminated_trailing_entry()
+    test_missing_delimiters_fall_back_to_lines()
+    test_invalid_utf8_only_affects_its_entry()
+    test_load_file_and_stats_use_stream()
+    test_unreadable_file_is_reported()
+    test_export_streams_from_iterator()
+    print("Streaming tests passed!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_time_index.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for the time index of datetime categories
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import LogViewer as log_viewer_module
+from LogViewer import LogViewer, FilterEngine, FieldFilter, TimestampParser
+
+CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Message", "type": "string", "order": 3}
+        ]
+    }
+}
+
+FILTER_SETS = [
+    [FieldFilter("Timestamp", "before", "2025-08-08 10:00:40")],
+    [FieldFilter("Timestamp", "after", "2025-08-08 10:01:10")],
+    [FieldFilter("Timestamp", "between", "2025-08-08 10:01:30", "2025-08-08 10:00:30")],
+    [FieldFilter("Timestamp", "not between", "2025-08-08 10:00:20", "2025-08-08 10:01:50")],
+    [FieldFilter("Timestamp", "after", "2025-08-08 10:03:00")],
+    [FieldFilter("Timestamp", "before", "2025-08-08 09:00:00")],
+    [FieldFilter("Timestamp", "between", "2025-08-08 10:00:30", "2025-08-08 10:01:30"),
+     FieldFilter("LogLevel", "equals", "ERROR")],
+]
+
+
+def _time(second):
+    return f"2025-08-08 10:{second // 60:02d}:{second % 60:02d}"
+
+
+def _entry(i, partial=False):
+    """Mostly in time order, with late entries, unparsed times and missing fields mixed in"""
+    if i % 17 == 5:
+        stamp = _time(max(i - 30, 0))     # Written late
+    elif i % 23 == 7:
+        stamp = "not-a-time"
+    else:
+        stamp = _time(i)
+    level = "ERROR" if i % 3 == 0 else "INFO"
+    text = f"[{stamp}|{level}|message {i}" if i % 29 != 3 else f"[{stamp}"
+    return text if partial else text + "]###\n"
+
+
+def _small_blocks(test):
+    """Run a test with 8-entry blocks, so a small file spans many blocks"""
+    saved = log_viewer_module.TIME_INDEX_BLOCK
+    log_viewer_module.TIME_INDEX_BLOCK = 8
+    try:
+        test()
+    finally:
+        log_viewer_module.TIME_INDEX_BLOCK = saved
+
+
+def _check(viewer):
+    """Indexed time filters keep the entries that testing every entry keeps"""
+    for filters in FILTER_SETS:
+        expected = FilterEngine(viewer.config_manager).apply(viewer.logs, filters)
+        count = viewer.apply_filters(filters)
+        assert [log.line_number for log in viewer.filtered_logs] == \
+            [log.line_number for log in expected], filters
+        assert count == len(expected)
+
+
+def test_indexed_time_ranges_match_scan():
+    """Time ranges keep the same entries with and without the index, in lists and LogStores"""
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("".join(_entry(i) for i in range(150)))
+            for store in (False, True):
+                config = {"logViewerConfig": dict(CONFIG["logViewerConfig"], ColumnarStore=store)}
+                viewer = LogViewer(config_dict=config)
+                viewer.load_file(path, workers=1)
+                _check(viewer)
+                index = viewer.column_index.time_index("Timestamp")
+                assert index.unparsed_rows and index._other_rows
+    _small_blocks(check)
+
+
+def test_index_follows_refresh():
+    """Appended entries are indexed, and a re-read incomplete entry replaces the old one"""
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("".join(_entry(i) for i in range(60)) + _entry(60, partial=True))
+            viewer = LogViewer(config_dict=CONFIG)
+            viewer.load_file(path, workers=1)
+            _check(viewer)
+            index = viewer.column_index.time_index("Timestamp")
+
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(" more]###\n" + "".join(_entry(i) for i in range(61, 140)))
+            assert viewer.refresh_file() > 0
+            _check(viewer)
+            assert viewer.column_index.time_index("Timestamp") is index
+    _small_blocks(check)
+
+
+def test_jump_to_time():
+    """find_loaded_time finds the first entry at or after a time, filtered or not"""
+    def check():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("".join(f"[{_time(i // 2)}|{'ERROR' if i % 3 == 0 else 'INFO'}|m]###\n"
+                                for i in range(100)))
+            viewer = LogViewer(config_dict=CONFIG)
+            viewer.load_file(path, workers=1)
+            parser = TimestampParser()
+            for second in (0, 7, 31, 49, 50, 80):
+                epoch = parser.parse(_time(second))
+                for filters in ([], [FieldFilter("LogLevel", "equals", "ERROR")]):
+                    viewer.apply_filters(filters)
+                    logs = viewer.filtered_logs
+                    expected = next((i for i, log in enumerate(logs) if log.get_epoch("Timestamp") >= epoch),
+                                    len(logs))
+                    assert viewer.find_loaded_time(_time(second)) == expected, (second, filters)
+    _small_blocks(check)
+
+
+if __name__ == "__main__":
+    test_indexed_time_ranges_match_scan()
+    test_index_follows_refresh()
+    test_jump_to_time()
+    print("Time index tests passed!")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+#====== Log Viewer/test_timestamps.py ======#
+#!copyright (c) 2025 Andrew Keith Watts. All rights reserved.
+#!
+#!This code is the intellectual property of Andrew Keith Watts. Unauthorized
+#!reproduction, distribution, or modification of this code, in whole or in part,
+#!without the express written permission of Andrew Keith Watts is strictly prohibited.
+#!
+#!For inquiries, please contact AndrewKWatts@gmail.com.
+"""
+Test script for timestamp parsing to epoch microseconds
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from LogViewer import LogViewer, TimestampParser
+
+SAMPLE_FILE = str(Path(__file__).parent / "sample_logs.txt")
+
+MULTILINE_CONFIG = {
+    "logViewerConfig": {
+        "delimiters": {
+            "logStartDelimiter": "[",
+            "logEndDelimiter": "]###",
+            "categorySeparator": "|",
+            "keyValuePairsSeparator": ";",
+            "keyValueSeparator": "=",
+            "arrayElementSeparator": ","
+        },
+        "categories": [
+            {"name": "Timestamp", "type": "datetime", "order": 1},
+            {"name": "LogLevel", "type": "string", "order": 2},
+            {"name": "Component", "type": "string", "order": 3},
+            {"name": "Details", "type": "string", "order": 4},
+            {"name": "Tags", "type": "string", "order": 5},
+            {"name": "ErrorCode", "type": "number", "order": 6}
+        ]
+    }
+}
+
+
+def _micros(*args, tz=timezone.utc):
+    return int(datetime(*args, tzinfo=tz).timestamp()) * 1_000_000
+
+
+def test_formats_are_inferred():
+    """Common layouts, fractions, zones and numeric epochs"""
+    base = _micros(2025, 8, 8, 6, 50, 0)
+    cases = {
+        "2025-08-08 06:50:00": base,
+        "2025-08-08T06:50:00.25Z": base + 250000,
+        "2025-08-08 08:50:00,123456+02:00": base + 123456,
+        "2025/08/08 06:50:00": base,
+        "08/Aug/2025:01:50:00 -0500": base,
+        "2025-08-08 06:50": base,
+        "2025-08-08": _micros(2025, 8, 8),
+        "1754635800": base,
+        "1754635800000": base,
+    }
+    for value, expected in cases.items():
+        assert TimestampParser().parse(value) == expected, value
+
+    for value in ("", "06:50:00", "not a time", "2025-13-40 06:50:00", None):
+        assert TimestampParser().parse(value) is None, value
+
+
+def test_layout_is_reused_and_reinferred():
+    """The inferred layout sticks until a value no longer matches"""
+    parser = TimestampParser()
+    assert parser.parse("2025-08-08 06:50:00") == _micros(2025, 8, 8, 6, 50, 0)
+    assert parser.format == "%Y-%m-%d %H:%M:%S"
+    assert parser.parse("2025-08-08 06:50:00.5") == _micros(2025, 8, 8, 6, 50, 0) + 500000
+    assert parser.format == "%Y-%m-%d %H:%M:%S"
+
+    assert parser.parse("08/Aug/2025:06:50:01 +0000") == _micros(2025, 8, 8, 6, 50, 1)
+    assert parser.format == "%d/%b/%Y:%H:%M:%S"
+
+    configured = TimestampParser("%d.%m.%Y %H:%M:%S")
+    assert configured.parse("08.08.2025 06:50:00") == _micros(2025, 8, 8, 6, 50, 0)
+
+
+def test_entries_carry_epochs():
+    """Parsed entries keep the display string and gain an epoch"""
+    viewer = LogViewer(config_dict=MULTILINE_CONFIG)
+    viewer.load_file(SAMPLE_FILE)
+    first = viewer.logs[0]
+    assert isinstance(first.get_field('Timestamp'), str)
+    assert first.get_epoch('Timestamp') == TimestampParser().parse(first.get_field('Timestamp'))
+    assert first.get_epoch('LogLevel') is None
+
+    epochs = [log.get_epoch('Timestamp') for log in viewer.logs]
+    assert all(epoch is not None for epoch in epochs)
+    assert epochs == sorted(epochs)
+
+
+def test_merge_orders_by_epoch_across_formats():
+    """Files in different layouts and zones merge in real time order"""
+    config = {"logViewerConfig": dict(MULTILINE_CONFIG["logViewerConfig"], delimiters={
+        key: value for key, value in MULTILINE_CONFIG["logViewerConfig"]["delimiters"].items()
+        if key not in ("logStartDelimiter", "logEndDelimiter")})}
+    with tempfile.TemporaryDirectory() as tmp:
+        utc_path = os.path.join(tmp, "utc.log")
+        with open(utc_path, "w", encoding="utf-8") as f:
+            f.write("2025-08-08T06:50:00Z|INFO|a|k=1|t|0\n2025-08-08T07:10:00Z|INFO|a|k=3|t|0\n")
+        local_path = os.path.join(tmp, "local.log")
+        with open(local_path, "w", encoding="utf-8") as f:
+            f.write("08/Aug/2025:09:00:00 +0200|INFO|b|k=2|t|0\n")
+
+        viewer = LogViewer(config_dict=config)
+        viewer.merge_files([utc_path, local_path], workers=1)
+        assert [log.get_field('Component') for log in viewer.logs] == ['a', 'b', 'a']
+
+
+def test_year_is_filled_in():
+    """Layouts without a year take the year of the file's modification time"""
+    parser = TimestampParser()
+    this_year = datetime.now(timezone.utc).year
+    assert parser.parse("Jan 01 10:00:00") == _micros(this_year, 1, 1, 10, 0, 0)
+
+    parser.reset(_micros(2024, 3, 1) / 1_000_000)
+    assert parser.parse("Feb 29 10:00:00") == _micros(2024, 2, 29, 10, 0, 0)
+    # December entries in a file last modified in March are from the year before
+    assert parser.parse("Dec 31 23:59:59") == _micros(2023, 12, 31, 23, 59, 59)
+
+    config = {"logViewerConfig": dict(MULTILINE_CONFIG["logViewerConfig"], delimiters={
+        key: value for key, value in MULTILINE_CONFIG["logViewerConfig"]["delimiters"].items()
+        if key not in ("logStartDelimiter", "logEndDelimiter")})}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "syslog")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Aug 08 10:00:00|INFO|a|k=1|t|0\n")
+        modified = _micros(2023, 9, 1) / 1_000_000
+        os.utime(path, (modified, modified))
+
+        viewer = LogViewer(config_dict=config)
+        viewer.load_file(path, workers=1)
+        assert viewer.logs[0].get_epoch('Timestamp') == _micros(2023, 8, 8, 10, 0, 0)
+
+
+def test_merged_files_keep_their_own_year():
+    """Yearless files merged side by side each take the year of their own modification time"""
+    config = {"logViewerConfig": dict(MULTILINE_CONFIG["logViewerConfig"], delimiters={
+        key: value for key, value in MULTILINE_CONFIG["logViewerConfig"]["delimiters"].items()
+        if key not in ("logStartDelimiter", "logEndDelimiter")})}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name, year in (("a", 2020), ("b", 2023)):
+            path = paths[name] = os.path.join(tmp, f"{name}.log")
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(3000):
+                    f.write(f"Aug 08 10:{i // 60 % 60:02d}:{i % 60:02d}|INFO|{name}|k={i}|t|0\n")
+            modified = _micros(year, 9, 1) / 1_000_000
+            os.utime(path, (modified, modified))
+
+        for lazy in (False, True):
+            for workers, first_screen in ((1, None), (2, lambda logs: None)):
+                viewer = LogViewer(config_dict={"logViewerConfig": dict(config["logViewerConfig"], LazyFields=lazy)})
+                viewer.merge_files([paths["a"], paths["b"]], workers=workers, first_screen=first_screen)
+                years = {(log.get_field('Component'),
+                          datetime.fromtimestamp(log.get_epoch('Timestamp') / 1_000_000, timezone.utc).year)
+                         for log in viewer.logs}
+                assert years == {("a", 2020), ("b", 2023)}, (lazy, workers)
+
+
+if __name__ == "__main__":
+    test_formats_are_inferred()
+    test_layout_is_reused_and_reinferred()
+    test_entries_carry_epochs()
+    test_merge_orders_by_epoch_across_formats()
+    test_year_is_filled_in()
+    test_merged_files_keep_their_own_year()
+    print("Timestamp tests passed!")